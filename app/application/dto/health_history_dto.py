@@ -0,0 +1,37 @@
+# app/application/dto/health_history_dto.py
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from app.domain.model.health_check import HealthCheckBucket
+
+
+class HealthHistoryPointDto(BaseModel):
+    timestamp: datetime  # bucket start (the check time at raw resolution)
+    count: int
+    upCount: int
+    latencyMinMs: Optional[int] = None
+    latencyAvgMs: Optional[float] = None
+    latencyMaxMs: Optional[int] = None
+    version: Optional[str] = None
+
+    @classmethod
+    def from_domain(cls, bucket: HealthCheckBucket) -> "HealthHistoryPointDto":
+        return cls(
+            timestamp=bucket.bucket_start,
+            count=bucket.count,
+            upCount=bucket.up_count,
+            latencyMinMs=bucket.latency_min_ms,
+            latencyAvgMs=bucket.latency_avg_ms,
+            latencyMaxMs=bucket.latency_max_ms,
+            version=str(bucket.version) if bucket.version else None,
+        )
+
+
+class HealthHistoryDto(BaseModel):
+    serviceId: str
+    resolution: str
+    start: datetime
+    end: datetime
+    points: List[HealthHistoryPointDto]
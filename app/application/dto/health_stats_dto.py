@@ -0,0 +1,45 @@
+# app/application/dto/health_stats_dto.py
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.domain.services.health_stats_calculator import ServiceHealthStats
+
+
+class HealthStatsDto(BaseModel):
+    serviceId: str
+    start: datetime
+    end: datetime
+    checks: int
+    upChecks: int
+    availabilityPercent: Optional[float] = None
+    errorRatePercent: Optional[float] = None
+    latencyP50Ms: Optional[float] = None
+    latencyP90Ms: Optional[float] = None
+    latencyP99Ms: Optional[float] = None
+    incidents: int
+    mttrSeconds: Optional[float] = None
+    ongoingIncident: bool
+    rawChecks: int  # checks with full detail (percentiles and MTTR use these)
+    rolledUpChecks: int  # older checks only available as rollup counts
+
+    @classmethod
+    def from_domain(cls, service_id: str, start: datetime, end: datetime, stats: ServiceHealthStats) -> "HealthStatsDto":
+        return cls(
+            serviceId=service_id,
+            start=start,
+            end=end,
+            checks=stats.checks,
+            upChecks=stats.up_checks,
+            availabilityPercent=stats.availability_percent,
+            errorRatePercent=stats.error_rate_percent,
+            latencyP50Ms=stats.latency_p50_ms,
+            latencyP90Ms=stats.latency_p90_ms,
+            latencyP99Ms=stats.latency_p99_ms,
+            incidents=stats.incidents,
+            mttrSeconds=stats.mttr_seconds,
+            ongoingIncident=stats.ongoing_incident,
+            rawChecks=stats.raw_checks,
+            rolledUpChecks=stats.rolled_up_checks,
+        )
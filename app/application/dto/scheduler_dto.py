@@ -0,0 +1,94 @@
+# app/application/dto/scheduler_dto.py
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class SchedulerLagDto(BaseModel):
+    """
+    How late checks started compared with when they were due (recent window).
+    """
+    checks: int
+    p50Ms: float
+    p95Ms: float
+    p99Ms: float
+    maxMs: float
+    lastMs: float
+
+
+class SchedulerShardingDto(BaseModel):
+    """
+    This worker's share of the services when several workers run the scheduler.
+    """
+    workerId: str
+    shards: int
+    ownedShards: int
+    workers: List[str]
+
+
+class SchedulerBreakersDto(BaseModel):
+    """
+    Services whose probe circuit breaker is not closed, and checks skipped for them.
+    """
+    open: int
+    halfOpen: int
+    skippedChecks: int
+
+
+class SchedulerStatusDto(BaseModel):
+    scheduledServices: int
+    inFlight: int
+    nextCheckInSeconds: Optional[float] = None
+    lag: SchedulerLagDto
+    sharding: Optional[SchedulerShardingDto] = None
+    breakers: Optional[SchedulerBreakersDto] = None
+
+
+class CyclePhaseDto(BaseModel):
+    phase: str
+    totalMs: float
+    avgMs: float
+    maxMs: float
+    share: float  # of all phase time in the cycle
+
+
+class SlowCheckDto(BaseModel):
+    serviceId: str
+    totalMs: float
+    phasesMs: Dict[str, float]
+
+
+class DbCommitDto(BaseModel):
+    """
+    Write-behind commits that ran while the cycle was open.
+    """
+    batches: int
+    rows: int
+    totalMs: float
+
+
+class CycleProfileDto(BaseModel):
+    """
+    Where the time of one scheduler cycle went: phases slowest first, then
+    the slowest individual checks.
+    """
+    id: int
+    startedAt: datetime
+    durationMs: float
+    checks: int
+    complete: bool
+    phases: List[CyclePhaseDto]
+    slowestServices: List[SlowCheckDto]
+    dbCommit: DbCommitDto
+
+
+class SchedulerCyclesDto(BaseModel):
+    current: Optional[CycleProfileDto] = None
+    recent: List[CycleProfileDto]
+
+
+class ProfileCaptureDto(BaseModel):
+    armed: bool
+    capturingCycle: Optional[int] = None
+    lastCapture: Optional[str] = None
@@ -15,6 +15,8 @@ class HealthCheckItemDto(BaseModel):
     version: Optional[str] = None
     versionMatchesExpected: Optional[bool] = None
     errorMessage: Optional[str] = None
+    connectMs: Optional[int] = None
+    breakerState: Optional[str] = None  # probe circuit breaker transition caused by this check
 
     @classmethod
     def from_domain(cls, check: HealthCheckResult) -> "HealthCheckItemDto":
@@ -25,6 +27,8 @@ class HealthCheckItemDto(BaseModel):
             version=str(check.version) if check.version else None,
             versionMatchesExpected=check.version_matches_expected,
             errorMessage=check.error_message,
+            connectMs=check.connect_ms,
+            breakerState=check.breaker_state.value if check.breaker_state else None,
         )
 
 
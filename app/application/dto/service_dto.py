@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.domain.model.service import Service
+from app.domain.model.value_objects import ProbeMode
 
 
 class ServiceDto(BaseModel):
@@ -12,6 +13,9 @@ class ServiceDto(BaseModel):
     expectedVersion: Optional[str] = None
     environment: str
     enabled: bool
+    checkIntervalSeconds: Optional[int] = None
+    jitterSeconds: Optional[float] = None
+    probeMode: str = "get"
 
     @classmethod
     def from_domain(cls, service: Service) -> "ServiceDto":
@@ -22,6 +26,9 @@ class ServiceDto(BaseModel):
             expectedVersion=service.expected_version.value if service.expected_version else None,
             environment=service.environment.value,
             enabled=service.enabled,
+            checkIntervalSeconds=service.check_interval_seconds,
+            jitterSeconds=service.jitter_seconds,
+            probeMode=service.probe_mode.value,
         )
 
 
@@ -32,3 +39,12 @@ class CreateServiceRequest(BaseModel):
     expectedVersion: Optional[str] = None
     environment: Optional[str] = "unknown"
     enabled: bool = True
+    checkIntervalSeconds: Optional[int] = Field(None, ge=1)
+    jitterSeconds: Optional[float] = Field(None, ge=0)
+    probeMode: ProbeMode = ProbeMode.GET  # get | head | headers-only | tcp
+
+
+class BulkCreateServicesResponse(BaseModel):
+    received: int
+    registered: int  # distinct serviceIds written; for repeated ids the last item wins
+    serviceIds: List[str]
@@ -30,3 +30,7 @@ class ServiceHealthSummaryDto(BaseModel):
             versionMatchesExpected=check.version_matches_expected,
             lastCheckedAt=check.timestamp,
         )
+
+
+class StatusVersionDto(BaseModel):
+    version: int
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import List
+
+from app.domain.model.service import Service
+from app.domain.repository.async_service_repository import AsyncServiceRepository
+from app.domain.services.service_catalogue_diff import ServiceCatalogueDiff
+from app.infrastructure.cache.status_snapshot import StatusSnapshot
+
+
+class ApplyServiceCatalogueDiff:
+    """
+    Use case: apply a config reload incrementally. Added and changed services
+    are upserted, removed ones are disabled (their history is kept, and putting
+    them back in the file enables them again); services that didn't change
+    are not written at all. Returns the services it wrote.
+    """
+
+    def __init__(self, service_repo: AsyncServiceRepository, snapshot: StatusSnapshot | None = None) -> None:
+        self._service_repo = service_repo
+        self._snapshot = snapshot
+
+    async def execute(self, diff: ServiceCatalogueDiff) -> List[Service]:
+        retired = [replace(service, enabled=False) for service in diff.removed]
+        writes = diff.added + diff.changed + retired
+        if not writes:
+            return writes
+        await self._service_repo.save_or_update_many(writes)
+        if self._snapshot is not None:
+            self._snapshot.upsert_services(writes)
+        return writes
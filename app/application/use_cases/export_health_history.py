@@ -0,0 +1,155 @@
+# app/application/use_cases/export_health_history.py
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.application.use_cases.get_health_history_for_service import ServiceNotFoundError
+from app.application.use_cases.get_health_history_range import InvalidHistoryRangeError, as_naive_utc
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.value_objects import ServiceId
+from app.domain.repository.async_health_check_repository import AsyncHealthCheckRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+_JSON = json.JSONEncoder(separators=(",", ":"))
+
+EXPORT_COLUMNS = [
+    "id", "timestamp", "status", "latencyMs", "connectMs",
+    "version", "versionMatchesExpected", "errorMessage", "breakerState",
+]
+
+
+def parse_export_cursor(value: str) -> Tuple[datetime, int]:
+    """
+    '<timestamp>,<id>' (the last exported record's values) -> keyset position.
+    """
+    timestamp, _, check_id = value.rpartition(",")
+    try:
+        return as_naive_utc(datetime.fromisoformat(timestamp)), int(check_id)
+    except ValueError:
+        raise InvalidHistoryRangeError(f"Invalid cursor '{value}' (expected '<timestamp>,<id>')") from None
+
+
+class ExportHealthHistory:
+    """
+    Use case: stream the raw health checks of one service in [from, to) as
+    NDJSON or CSV.
+    Reads keyset pages of `page_size` rows, each in its own short DB session,
+    and yields one text chunk per page, so memory stays constant however
+    long the range is and no read transaction is held open between pages.
+    Records carry `id`; pass the last record's '<timestamp>,<id>' as `after`
+    to resume an interrupted export.
+    Only raw checks are exported. Retention folds checks older than
+    `raw_retention` into rollups, so a range starting before that is
+    rejected rather than silently returning only its recent part; older
+    history is available as buckets from /health/{id}/history.
+    """
+
+    DEFAULT_SPAN = timedelta(hours=24)
+
+    def __init__(
+        self,
+        service_repo: AsyncServiceRepository,
+        health_repo: AsyncHealthCheckRepository,
+        page_size: int = 2_000,
+        raw_retention: Optional[timedelta] = None,
+    ) -> None:
+        self._service_repo = service_repo
+        self._health_repo = health_repo
+        self._page_size = page_size
+        self._raw_retention = raw_retention
+
+    async def open(
+        self,
+        service_id_str: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        fmt: ExportFormat = ExportFormat.NDJSON,
+        after: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Validate the request and return the chunk iterator. Errors surface
+        here, before any of the response has been sent.
+        """
+        now = datetime.utcnow()
+        end = as_naive_utc(end) if end else now
+        start = as_naive_utc(start) if start else end - self.DEFAULT_SPAN
+        if start >= end:
+            raise InvalidHistoryRangeError("'from' must be before 'to'")
+        if self._raw_retention is not None and start < now - self._raw_retention:
+            raise InvalidHistoryRangeError(
+                f"'from' is before {(now - self._raw_retention).isoformat()}: raw checks are only kept for "
+                f"{self._raw_retention}, older ones are rolled up (use /history?resolution=1m or 1h)"
+            )
+        position = parse_export_cursor(after) if after else None
+
+        sid = ServiceId(service_id_str)
+        if await self._service_repo.find_by_id(sid) is None:
+            raise ServiceNotFoundError(f"Service '{service_id_str}' not found")
+        return self._chunks(sid, start, end, fmt, position)
+
+    async def _chunks(
+        self,
+        sid: ServiceId,
+        start: datetime,
+        end: datetime,
+        fmt: ExportFormat,
+        position: Optional[Tuple[datetime, int]],
+    ) -> AsyncIterator[str]:
+        def fetch(after: Optional[Tuple[datetime, int]]) -> "asyncio.Future[List[HealthCheckResult]]":
+            return asyncio.ensure_future(
+                self._health_repo.find_page_by_service_id(sid, start, end, after, self._page_size)
+            )
+
+        if fmt is ExportFormat.CSV:
+            yield _csv_lines([EXPORT_COLUMNS])
+        # Read one page ahead: the next query runs on the DB thread pool while
+        # this page is serialised and sent. At most two pages are held.
+        next_page: Optional[asyncio.Future] = fetch(position)
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if len(page) == self._page_size:
+                    next_page = fetch((page[-1].timestamp, page[-1].id))
+                if not page:
+                    return
+                records = [_record(check) for check in page]
+                if fmt is ExportFormat.CSV:
+                    yield _csv_lines([[r[c] for c in EXPORT_COLUMNS] for r in records])
+                else:
+                    yield "".join(_JSON.encode(r) + "\n" for r in records)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+
+def _record(check: HealthCheckResult) -> Dict[str, Any]:
+    return {
+        "id": check.id,
+        "timestamp": check.timestamp.isoformat(),
+        "status": check.status.value,
+        "latencyMs": check.latency_ms,
+        "connectMs": check.connect_ms,
+        "version": str(check.version) if check.version else None,
+        "versionMatchesExpected": check.version_matches_expected,
+        "errorMessage": check.error_message,
+        "breakerState": check.breaker_state.value if check.breaker_state else None,
+    }
+
+
+def _csv_lines(rows: List[List[Any]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
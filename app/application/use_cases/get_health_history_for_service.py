@@ -5,8 +5,8 @@ from typing import Optional
 
 from app.application.dto.service_details_dto import ServiceDetailsDto
 from app.domain.model.value_objects import ServiceId
-from app.domain.repository.health_check_repository import HealthCheckRepository
-from app.domain.repository.service_repository import ServiceRepository
+from app.domain.repository.async_health_check_repository import AsyncHealthCheckRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
 
 
 class ServiceNotFoundError(Exception):
@@ -20,17 +20,17 @@ class GetHealthHistoryForService:
 
     def __init__(
         self,
-        service_repo: ServiceRepository,
-        health_repo: HealthCheckRepository,
+        service_repo: AsyncServiceRepository,
+        health_repo: AsyncHealthCheckRepository,
     ) -> None:
         self._service_repo = service_repo
         self._health_repo = health_repo
 
-    def execute(self, service_id_str: str, limit: int = 20) -> ServiceDetailsDto:
+    async def execute(self, service_id_str: str, limit: int = 20) -> ServiceDetailsDto:
         sid = ServiceId(service_id_str)
-        service = self._service_repo.find_by_id(sid)
+        service = await self._service_repo.find_by_id(sid)
         if service is None:
             raise ServiceNotFoundError(f"Service '{service_id_str}' not found")
 
-        checks = self._health_repo.find_recent_by_service_id(sid, limit=limit)
+        checks = await self._health_repo.find_recent_by_service_id(sid, limit=limit)
         return ServiceDetailsDto.from_domain(service, checks)
@@ -0,0 +1,71 @@
+# app/application/use_cases/get_health_history_range.py
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.application.dto.health_history_dto import HealthHistoryDto, HealthHistoryPointDto
+from app.application.use_cases.get_health_history_for_service import ServiceNotFoundError
+from app.domain.model.health_check import HistoryResolution
+from app.domain.model.value_objects import ServiceId
+from app.domain.repository.async_health_check_repository import AsyncHealthCheckRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
+from app.domain.services.history_resolution_policy import HistoryResolutionPolicy
+
+
+class InvalidHistoryRangeError(Exception):
+    pass
+
+
+class GetHealthHistoryRange:
+    """
+    Use case: health history of one service over a time range, at raw,
+    1-minute or 1-hour resolution (picked automatically unless requested).
+    """
+
+    DEFAULT_SPAN = timedelta(hours=24)
+
+    def __init__(
+        self,
+        service_repo: AsyncServiceRepository,
+        health_repo: AsyncHealthCheckRepository,
+        policy: HistoryResolutionPolicy,
+    ) -> None:
+        self._service_repo = service_repo
+        self._health_repo = health_repo
+        self._policy = policy
+
+    async def execute(
+        self,
+        service_id_str: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        resolution: Optional[HistoryResolution] = None,
+    ) -> HealthHistoryDto:
+        now = datetime.utcnow()
+        end = as_naive_utc(end) if end else now
+        start = as_naive_utc(start) if start else end - self.DEFAULT_SPAN
+        if start >= end:
+            raise InvalidHistoryRangeError("'from' must be before 'to'")
+
+        sid = ServiceId(service_id_str)
+        service = await self._service_repo.find_by_id(sid)
+        if service is None:
+            raise ServiceNotFoundError(f"Service '{service_id_str}' not found")
+
+        resolution = resolution or self._policy.choose(start, end, now)
+        buckets = await self._health_repo.find_history(sid, start, end, resolution)
+        return HealthHistoryDto(
+            serviceId=str(service.id),
+            resolution=resolution.value,
+            start=start,
+            end=end,
+            points=[HealthHistoryPointDto.from_domain(b) for b in buckets],
+        )
+
+
+def as_naive_utc(value: datetime) -> datetime:
+    # Check timestamps are stored as naive UTC
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -6,6 +6,7 @@ from typing import List
 from app.application.dto.service_health_summary_dto import ServiceHealthSummaryDto
 from app.domain.repository.service_repository import ServiceRepository
 from app.domain.repository.health_check_repository import HealthCheckRepository
+from app.infrastructure.cache.status_snapshot import StatusSnapshot
 
 
 class GetLatestHealthStatusForAllServices:
@@ -30,3 +31,19 @@ class GetLatestHealthStatusForAllServices:
             result.append(dto)
 
         return result
+
+
+class GetLatestHealthStatusFromSnapshot:
+    """
+    Same result as GetLatestHealthStatusForAllServices, but served from the
+    in-memory status snapshot instead of querying the DB.
+    """
+
+    def __init__(self, snapshot: StatusSnapshot) -> None:
+        self._snapshot = snapshot
+
+    def execute(self) -> List[ServiceHealthSummaryDto]:
+        return [
+            ServiceHealthSummaryDto.from_domain(service, check)
+            for service, check in self._snapshot.latest()
+        ]
@@ -0,0 +1,77 @@
+# app/application/use_cases/get_service_health_stats.py
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.application.dto.health_stats_dto import HealthStatsDto
+from app.application.use_cases.get_health_history_for_service import ServiceNotFoundError
+from app.application.use_cases.get_health_history_range import InvalidHistoryRangeError, as_naive_utc
+from app.domain.model.value_objects import ServiceId
+from app.domain.repository.async_health_check_repository import AsyncHealthCheckRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
+from app.domain.services.health_stats_calculator import HealthStatsCalculator
+
+_WINDOW = re.compile(r"^\s*(\d{1,12})\s*([smhdw])\s*$")
+_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+# Longest window when history is kept forever
+MAX_WINDOW = timedelta(days=3660)
+
+
+def parse_window(value: str, max_window: timedelta = MAX_WINDOW) -> timedelta:
+    """
+    '90s', '15m', '24h', '7d', '2w' -> timedelta, at most `max_window`.
+    """
+    match = _WINDOW.match(value.lower())
+    if not match or int(match.group(1)) == 0:
+        raise InvalidHistoryRangeError(f"Invalid window '{value}' (expected e.g. 15m, 24h, 7d)")
+    try:
+        window = timedelta(**{_UNITS[match.group(2)]: int(match.group(1))})
+    except OverflowError:
+        window = None
+    if window is None or window > max_window:
+        raise InvalidHistoryRangeError(
+            f"Window '{value}' is longer than the {max_window.days} days of history kept"
+        )
+    return window
+
+
+class GetServiceHealthStats:
+    """
+    Use case: SLO statistics (latency percentiles, availability, error rate,
+    MTTR) for one service over a window ending at `end` (default: now).
+    Windows longer than `max_window` (how long history is kept) are rejected.
+    """
+
+    def __init__(
+        self,
+        service_repo: AsyncServiceRepository,
+        health_repo: AsyncHealthCheckRepository,
+        calculator: Optional[HealthStatsCalculator] = None,
+        max_window: Optional[timedelta] = None,
+    ) -> None:
+        self._service_repo = service_repo
+        self._health_repo = health_repo
+        self._calculator = calculator or HealthStatsCalculator()
+        self._max_window = min(max_window, MAX_WINDOW) if max_window is not None else MAX_WINDOW
+
+    async def execute(
+        self,
+        service_id_str: str,
+        window: str = "24h",
+        end: Optional[datetime] = None,
+    ) -> HealthStatsDto:
+        end = as_naive_utc(end) if end else datetime.utcnow()
+        try:
+            start = end - parse_window(window, self._max_window)
+        except OverflowError as exc:
+            raise InvalidHistoryRangeError(f"Window '{window}' reaches before year 1") from exc
+
+        sid = ServiceId(service_id_str)
+        service = await self._service_repo.find_by_id(sid)
+        if service is None:
+            raise ServiceNotFoundError(f"Service '{service_id_str}' not found")
+
+        series = await self._health_repo.load_series(sid, start, end)
+        return HealthStatsDto.from_domain(str(service.id), start, end, self._calculator.calculate(series))
@@ -1,6 +1,9 @@
 # app/application/use_cases/initialize_services_from_config.py
 from __future__ import annotations
 
+from typing import List
+
+from app.domain.model.service import Service
 from app.domain.repository.service_repository import ServiceRepository
 from app.infrastructure.config.service_config_loader import ServiceConfigLoader
 
@@ -8,7 +11,7 @@ from app.infrastructure.config.service_config_loader import ServiceConfigLoader
 class InitializeServicesFromConfig:
     """
     Use case: load services from config file and upsert into the repository.
-    Intended to run at application startup.
+    Intended to run at application startup; returns the services it loaded.
     """
 
     def __init__(
@@ -19,10 +22,11 @@ class InitializeServicesFromConfig:
         self._service_repo = service_repo
         self._config_loader = config_loader
 
-    def execute(self) -> None:
+    def execute(self) -> List[Service]:
         services = self._config_loader.load()
         if not services:
             # Nothing to seed – that's fine.
-            return
+            return []
 
         self._service_repo.save_or_update_many(services)
+        return services
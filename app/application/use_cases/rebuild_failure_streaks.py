@@ -0,0 +1,28 @@
+# app/application/use_cases/rebuild_failure_streaks.py
+from __future__ import annotations
+
+from app.domain.repository.health_check_repository import HealthCheckRepository
+from app.domain.repository.service_repository import ServiceRepository
+from app.domain.services.failure_streak_tracker import FailureStreakTracker
+
+
+class RebuildFailureStreaks:
+    """
+    Use case: seed the consecutive-failure tracker from recent history.
+    Intended to run once when the scheduler starts.
+    """
+
+    def __init__(
+        self,
+        service_repo: ServiceRepository,
+        health_repo: HealthCheckRepository,
+        tracker: FailureStreakTracker,
+    ) -> None:
+        self._service_repo = service_repo
+        self._health_repo = health_repo
+        self._tracker = tracker
+
+    def execute(self) -> None:
+        for service in self._service_repo.find_all_enabled():
+            recent = self._health_repo.find_recent_by_service_id(service.id, limit=self._tracker.threshold)
+            self._tracker.seed(service.id, recent)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from app.domain.model.service import Service
+from app.domain.model.value_objects import ServiceId
+from app.domain.repository.async_health_check_repository import AsyncHealthCheckRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
+from app.infrastructure.cache.status_snapshot import StatusSnapshot
+
+
+@dataclass(frozen=True)
+class PeerRefresh:
+    updated: List[ServiceId]  # services whose status row was updated or removed
+    catalogue_changed: bool  # services were created, edited, enabled or disabled elsewhere
+
+
+class RefreshPeerStatuses:
+    """
+    Use case: when several scheduler workers share the services, each one
+    only records its own checks in its status snapshot. This copies the
+    latest checks of the services other workers own from the database, so
+    /health and the dashboard are complete whichever worker serves them,
+    and drops services that are no longer enabled (e.g. disabled or
+    deleted through another worker).
+    Also reports whether the service catalogue changed since the previous
+    call, so the caller can drop cached /services responses and re-sync its
+    schedule.
+    """
+
+    def __init__(
+        self,
+        service_repo: AsyncServiceRepository,
+        health_repo: AsyncHealthCheckRepository,
+        snapshot: StatusSnapshot,
+        is_local: Callable[[ServiceId], bool],
+    ) -> None:
+        self._service_repo = service_repo
+        self._health_repo = health_repo
+        self._snapshot = snapshot
+        self._is_local = is_local
+        self._catalogue: Optional[Dict[ServiceId, Service]] = None
+
+    async def execute(self) -> PeerRefresh:
+        catalogue = {service.id: service for service in await self._service_repo.list_all()}
+        latest = await self._health_repo.find_latest_for_all_services()
+        # The first call only sets the baseline
+        changed = self._catalogue is not None and catalogue != self._catalogue
+        self._catalogue = catalogue
+        services = [service for service in catalogue.values() if service.enabled]
+        updated: List[ServiceId] = []
+        for sid in self._snapshot.service_ids():
+            service = catalogue.get(sid)
+            if service is None or not service.enabled:
+                self._snapshot.remove(sid)
+                updated.append(sid)
+                changed = True
+        for service in services:
+            if self._snapshot.is_retired(service.id):
+                # Enabled again through another worker
+                self._snapshot.upsert_service(service)
+                updated.append(service.id)
+            check = latest.get(service.id)
+            if check is None or self._is_local(service.id):
+                continue
+            current = self._snapshot.get(service.id)
+            if current is not None and current[0] == service and current[1].timestamp >= check.timestamp:
+                continue
+            self._snapshot.record(service, check)
+            updated.append(service.id)
+        return PeerRefresh(updated, changed)
@@ -1,46 +1,116 @@
 # app/application/use_cases/run_health_check_for_service.py
 from __future__ import annotations
 
+import time
 from datetime import datetime
+from typing import Callable, Dict, Optional, Sequence
 
+from app.domain.model.health_check import HealthCheckResult
 from app.domain.model.service import Service
-from app.domain.repository.health_check_repository import HealthCheckRepository
+from app.domain.model.value_objects import BreakerState
+from app.domain.repository.async_health_check_repository import AsyncHealthCheckRepository
+from app.domain.services.adaptive_timeout_policy import AdaptiveTimeoutPolicy
 from app.domain.services.health_evaluation_service import (
     HealthEvaluationService,
     HealthCheckInput,
 )
+from app.domain.services.probe_circuit_breaker import ProbeCircuitBreaker
+from app.infrastructure.db.health_check_writer import HealthCheckWriter
+from app.infrastructure.http.process_probe_pool import ProcessProbePool
 from app.infrastructure.http.service_pinger import HttpServicePinger
 
 
 class RunHealthCheckForService:
     """
     Use case: run a single health check for one service.
+    If a write-behind `writer` is given, the result is queued on it;
+    otherwise it is saved directly through the repository.
+    Each `on_result` callback is then called with (service, result),
+    e.g. to update in-memory state.
+    With a `probe_pool`, ping + evaluate run in one of its worker processes
+    instead of on this event loop.
+    With `timeouts`, the ping uses the service's adaptive timeout, and UP
+    latencies are fed back into it; a breaker's HALF_OPEN trial probe always
+    gets the full timeout. With a `breaker`, the result is recorded
+    on the service's circuit breaker before it is persisted, and a state
+    change is stored with it (result.breaker_state).
+    If `timings` is given, the seconds spent in each step are stored in it
+    under "ping", "evaluate", "persist" and "hooks".
     """
 
     def __init__(
         self,
         pinger: HttpServicePinger,
         evaluator: HealthEvaluationService,
-        health_repo: HealthCheckRepository,
+        health_repo: AsyncHealthCheckRepository,
+        writer: HealthCheckWriter | None = None,
+        on_result: Sequence[Callable[[Service, HealthCheckResult], None]] = (),
+        probe_pool: ProcessProbePool | None = None,
+        timeouts: AdaptiveTimeoutPolicy | None = None,
+        breaker: ProbeCircuitBreaker | None = None,
     ) -> None:
         self._pinger = pinger
         self._evaluator = evaluator
         self._health_repo = health_repo
+        self._writer = writer
+        self._on_result = on_result
+        self._probe_pool = probe_pool
+        self._timeouts = timeouts
+        self._breaker = breaker
 
-    async def execute(self, service: Service) -> None:
-        ping_result = await self._pinger.ping(service)
+    async def execute(self, service: Service, timings: Optional[Dict[str, float]] = None) -> HealthCheckResult:
+        started = time.perf_counter()
+        timeout = self._probe_timeout(service)
+        if self._probe_pool is not None:
+            health_check, evaluate_seconds = await self._probe_pool.check(service, timeout)
+            evaluated = time.perf_counter()
+            # The round trip to the worker counts as ping time
+            pinged = evaluated - evaluate_seconds
+        else:
+            ping_result = await self._pinger.ping(service, timeout)
+            pinged = time.perf_counter()
 
-        input_data = HealthCheckInput(
-            http_status_code=ping_result.http_status_code,
-            latency_ms=ping_result.latency_ms,
-            reported_version=ping_result.reported_version,
-            error_message=ping_result.error_message,
-        )
+            input_data = HealthCheckInput(
+                http_status_code=ping_result.http_status_code,
+                latency_ms=ping_result.latency_ms,
+                reported_version=ping_result.reported_version,
+                error_message=ping_result.error_message,
+                connect_ms=ping_result.connect_ms,
+                tcp_connected=ping_result.tcp_connected,
+            )
 
-        health_check = self._evaluator.evaluate(
-            service=service,
-            data=input_data,
-            timestamp=datetime.utcnow(),
-        )
+            health_check = self._evaluator.evaluate(
+                service=service,
+                data=input_data,
+                timestamp=datetime.utcnow(),
+            )
+            evaluated = time.perf_counter()
 
-        self._health_repo.save(health_check)
+        if self._timeouts is not None:
+            self._timeouts.record(health_check)
+        if self._breaker is not None:
+            health_check.breaker_state = self._breaker.record(health_check)
+
+        if self._writer is not None:
+            await self._writer.put(health_check)
+        else:
+            await self._health_repo.save(health_check)
+        persisted = time.perf_counter()
+
+        for callback in self._on_result:
+            callback(service, health_check)
+
+        if timings is not None:
+            timings["ping"] = pinged - started
+            timings["evaluate"] = evaluated - pinged
+            timings["persist"] = persisted - evaluated
+            timings["hooks"] = time.perf_counter() - persisted
+        return health_check
+
+    def _probe_timeout(self, service: Service) -> Optional[float]:
+        if self._timeouts is None:
+            return None
+        if self._breaker is not None and self._breaker.state(service.id) == BreakerState.HALF_OPEN:
+            # A trial clipped to the old latencies could never see a slower recovery
+            return self._timeouts.max_seconds
+        return self._timeouts.timeout_for(service.id)
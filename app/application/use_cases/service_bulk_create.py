@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Dict, List
+
+from app.application.dto.service_dto import BulkCreateServicesResponse, CreateServiceRequest
+from app.domain.model.service import Service
+from app.domain.repository.async_service_repository import AsyncServiceRepository
+from app.infrastructure.cache.status_snapshot import StatusSnapshot
+
+
+class InvalidServiceRequestError(Exception):
+    pass
+
+
+class BulkCreateServices:
+    """
+    Create or update many services in one repository call (a single
+    transaction), then refresh the status snapshot once for the whole batch.
+    """
+
+    def __init__(self, service_repo: AsyncServiceRepository, snapshot: StatusSnapshot | None = None) -> None:
+        self._service_repo = service_repo
+        self._snapshot = snapshot
+
+    async def execute(self, reqs: List[CreateServiceRequest]) -> BulkCreateServicesResponse:
+        services: Dict[str, Service] = {}
+        for index, req in enumerate(reqs):
+            try:
+                services[req.serviceId] = Service.from_primitives(
+                    id=req.serviceId,
+                    name=req.name,
+                    url=req.url,
+                    expected_version=req.expectedVersion,
+                    environment=req.environment,
+                    enabled=req.enabled,
+                    check_interval_seconds=req.checkIntervalSeconds,
+                    jitter_seconds=req.jitterSeconds,
+                    probe_mode=req.probeMode,
+                )
+            except ValueError as exc:
+                raise InvalidServiceRequestError(f"Item {index} ({req.serviceId}): {exc}") from exc
+        if services:
+            await self._service_repo.save_or_update_many(services.values())
+            if self._snapshot is not None:
+                self._snapshot.upsert_services(services.values())
+        return BulkCreateServicesResponse(
+            received=len(reqs),
+            registered=len(services),
+            serviceIds=list(services),
+        )
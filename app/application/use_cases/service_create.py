@@ -2,14 +2,16 @@ from __future__ import annotations
 
 from app.application.dto.service_dto import ServiceDto, CreateServiceRequest
 from app.domain.model.service import Service
-from app.domain.repository.service_repository import ServiceRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
+from app.infrastructure.cache.status_snapshot import StatusSnapshot
 
 
 class CreateService:
-    def __init__(self, service_repo: ServiceRepository) -> None:
+    def __init__(self, service_repo: AsyncServiceRepository, snapshot: StatusSnapshot | None = None) -> None:
         self._service_repo = service_repo
+        self._snapshot = snapshot
 
-    def execute(self, req: CreateServiceRequest) -> ServiceDto:
+    async def execute(self, req: CreateServiceRequest) -> ServiceDto:
         service = Service.from_primitives(
             id=req.serviceId,
             name=req.name,
@@ -17,6 +19,11 @@ class CreateService:
             expected_version=req.expectedVersion,
             environment=req.environment,
             enabled=req.enabled,
+            check_interval_seconds=req.checkIntervalSeconds,
+            jitter_seconds=req.jitterSeconds,
+            probe_mode=req.probeMode,
         )
-        self._service_repo.save(service)
+        await self._service_repo.save(service)
+        if self._snapshot is not None:
+            self._snapshot.upsert_service(service)
         return ServiceDto.from_domain(service)
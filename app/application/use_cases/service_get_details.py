@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from app.application.dto.service_dto import ServiceDto
 from app.domain.model.value_objects import ServiceId
-from app.domain.repository.service_repository import ServiceRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
 
 
 class ServiceNotFoundError(Exception):
@@ -10,12 +10,12 @@ class ServiceNotFoundError(Exception):
 
 
 class GetServiceDetails:
-    def __init__(self, service_repo: ServiceRepository) -> None:
+    def __init__(self, service_repo: AsyncServiceRepository) -> None:
         self._service_repo = service_repo
 
-    def execute(self, service_id_str: str) -> ServiceDto:
+    async def execute(self, service_id_str: str) -> ServiceDto:
         sid = ServiceId(service_id_str)
-        service = self._service_repo.find_by_id(sid)
+        service = await self._service_repo.find_by_id(sid)
         if service is None:
             raise ServiceNotFoundError(f"Service '{service_id_str}' not found")
         return ServiceDto.from_domain(service)
@@ -3,13 +3,13 @@ from __future__ import annotations
 from typing import List
 
 from app.application.dto.service_dto import ServiceDto
-from app.domain.repository.service_repository import ServiceRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
 
 
 class ListServices:
-    def __init__(self, service_repo: ServiceRepository) -> None:
+    def __init__(self, service_repo: AsyncServiceRepository) -> None:
         self._service_repo = service_repo
 
-    def execute(self) -> List[ServiceDto]:
-        services = self._service_repo.list_all()
+    async def execute(self) -> List[ServiceDto]:
+        services = await self._service_repo.list_all()
         return [ServiceDto.from_domain(s) for s in services]
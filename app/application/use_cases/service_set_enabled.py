@@ -2,20 +2,24 @@ from __future__ import annotations
 
 from app.application.dto.service_dto import ServiceDto
 from app.domain.model.value_objects import ServiceId
-from app.domain.repository.service_repository import ServiceRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
 from app.application.use_cases.service_get_details import ServiceNotFoundError
+from app.infrastructure.cache.status_snapshot import StatusSnapshot
 
 
 class SetServiceEnabled:
-    def __init__(self, service_repo: ServiceRepository) -> None:
+    def __init__(self, service_repo: AsyncServiceRepository, snapshot: StatusSnapshot | None = None) -> None:
         self._service_repo = service_repo
+        self._snapshot = snapshot
 
-    def execute(self, service_id_str: str, enabled: bool) -> ServiceDto:
+    async def execute(self, service_id_str: str, enabled: bool) -> ServiceDto:
         sid = ServiceId(service_id_str)
-        service = self._service_repo.find_by_id(sid)
+        service = await self._service_repo.find_by_id(sid)
         if service is None:
             raise ServiceNotFoundError(f"Service '{service_id_str}' not found")
 
         service.enabled = enabled
-        self._service_repo.save(service)
+        await self._service_repo.save(service)
+        if self._snapshot is not None:
+            self._snapshot.upsert_service(service)
         return ServiceDto.from_domain(service)
@@ -0,0 +1,29 @@
+# app/application/use_cases/warm_status_snapshot.py
+from __future__ import annotations
+
+from app.domain.repository.health_check_repository import HealthCheckRepository
+from app.domain.repository.service_repository import ServiceRepository
+from app.infrastructure.cache.status_snapshot import StatusSnapshot
+
+
+class WarmStatusSnapshot:
+    """
+    Use case: load enabled services and their latest checks into the snapshot.
+    Intended to run at application startup.
+    """
+
+    def __init__(
+        self,
+        service_repo: ServiceRepository,
+        health_repo: HealthCheckRepository,
+        snapshot: StatusSnapshot,
+    ) -> None:
+        self._service_repo = service_repo
+        self._health_repo = health_repo
+        self._snapshot = snapshot
+
+    def execute(self) -> None:
+        self._snapshot.warm(
+            self._service_repo.find_all_enabled(),
+            self._health_repo.find_latest_for_all_services(),
+        )
@@ -3,8 +3,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 
-from .value_objects import ServiceId, HealthStatus, Version
+from .value_objects import BreakerState, ServiceId, HealthStatus, Version
 
 
 @dataclass
@@ -19,3 +20,34 @@ class HealthCheckResult:
     version: Version | None
     version_matches_expected: bool | None
     error_message: str | None = None
+    # Part of latency_ms spent on connection setup (TCP/TLS); None if not measured
+    connect_ms: int | None = None
+    # Set when this check moved the service's probe circuit breaker: OPEN when it
+    # tripped it (or a trial probe failed), CLOSED when a trial probe succeeded
+    breaker_state: BreakerState | None = None
+    # Storage id once persisted; with timestamp it orders checks for keyset paging
+    id: int | None = None
+
+
+class HistoryResolution(str, Enum):
+    RAW = "raw"
+    MINUTE = "1m"
+    HOUR = "1h"
+
+
+@dataclass
+class HealthCheckBucket:
+    """
+    Health checks of one service aggregated over a time bucket
+    [bucket_start, bucket_start + resolution). At RAW resolution each bucket
+    is a single check.
+    """
+    service_id: ServiceId
+    bucket_start: datetime
+    resolution: HistoryResolution
+    count: int
+    up_count: int
+    latency_min_ms: int | None
+    latency_avg_ms: float | None
+    latency_max_ms: int | None
+    version: Version | None  # latest version seen in the bucket
@@ -0,0 +1,34 @@
+# app/domain/model/health_check_series.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+
+from .value_objects import ServiceId
+
+
+@dataclass
+class HealthCheckSeries:
+    """
+    Column-oriented health checks of one service over [start, end), oldest
+    first, for bulk statistics. Parallel NumPy arrays instead of one
+    HealthCheckResult per check.
+    - timestamps_ms: check time, ms since the Unix epoch (UTC)
+    - up:            True where status was UP
+    - latency_ms:    float, NaN where no latency was recorded
+    Checks already compacted into rollups only contribute counts.
+    """
+    service_id: ServiceId
+    start: datetime
+    end: datetime
+    timestamps_ms: np.ndarray
+    up: np.ndarray
+    latency_ms: np.ndarray
+    rolled_up_checks: int = 0
+    rolled_up_up_checks: int = 0
+
+    @property
+    def raw_checks(self) -> int:
+        return int(self.timestamps_ms.size)
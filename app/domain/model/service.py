@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from .value_objects import ServiceId, Version, Environment
+from .value_objects import ServiceId, Version, Environment, ProbeMode
 
 
 @dataclass
@@ -17,6 +17,10 @@ class Service:
     expected_version: Version | None
     environment: Environment
     enabled: bool = True
+    # Per-service scheduling; None = use the global defaults from settings
+    check_interval_seconds: int | None = None
+    jitter_seconds: float | None = None
+    probe_mode: ProbeMode = ProbeMode.GET
 
     @staticmethod
     def from_primitives(
@@ -26,11 +30,14 @@ class Service:
         expected_version: str | None,
         environment: str | None,
         enabled: bool = True,
+        check_interval_seconds: int | None = None,
+        jitter_seconds: float | None = None,
+        probe_mode: str | None = None,
     ) -> "Service":
         """
         Helper factory to construct a Service from basic types (e.g. config/DB row).
         """
-        from .value_objects import Version, Environment, ServiceId
+        from .value_objects import Version, Environment, ServiceId, ProbeMode
 
         env = Environment(environment) if environment is not None else Environment.UNKNOWN
         version_obj = Version(expected_version) if expected_version is not None else None
@@ -42,4 +49,7 @@ class Service:
             expected_version=version_obj,
             environment=env,
             enabled=enabled,
+            check_interval_seconds=check_interval_seconds,
+            jitter_seconds=jitter_seconds,
+            probe_mode=ProbeMode(probe_mode) if probe_mode is not None else ProbeMode.GET,
         )
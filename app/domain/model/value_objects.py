@@ -25,6 +25,30 @@ class HealthStatus(str, Enum):
     # You can add DEGRADED later as a stretch
 
 
+class ProbeMode(str, Enum):
+    """
+    How a service is probed:
+    - GET: GET the URL, read the body up to a byte cap for the version (default),
+    - HEAD: HEAD request; version from the X-Service-Version header only,
+    - HEADERS_ONLY: GET, but the body is never read (for targets that don't allow HEAD),
+    - TCP: open a TCP connection to the URL's host and port; UP if it connects.
+    """
+    GET = "get"
+    HEAD = "head"
+    HEADERS_ONLY = "headers-only"
+    TCP = "tcp"
+
+
+class BreakerState(str, Enum):
+    """
+    Per-service probe circuit breaker: CLOSED probes every interval, OPEN
+    only re-probes at a slow cadence, HALF_OPEN is a trial probe in flight.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
 @dataclass(frozen=True)
 class Version:
     """
@@ -0,0 +1,62 @@
+# app/domain/repository/async_health_check_repository.py
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.domain.model.health_check import HealthCheckBucket, HealthCheckResult, HistoryResolution
+from app.domain.model.health_check_series import HealthCheckSeries
+from app.domain.model.value_objects import ServiceId
+
+
+class AsyncHealthCheckRepository(ABC):
+    """
+    Async variant of HealthCheckRepository, for callers on the event loop.
+    Implementations must not block the loop (e.g. run DB work in a thread pool).
+    """
+
+    @abstractmethod
+    async def save(self, result: HealthCheckResult) -> None:
+        ...
+
+    @abstractmethod
+    async def save_many(self, results: Iterable[HealthCheckResult]) -> None:
+        ...
+
+    @abstractmethod
+    async def find_latest_by_service_id(self, service_id: ServiceId) -> Optional[HealthCheckResult]:
+        ...
+
+    @abstractmethod
+    async def find_latest_for_all_services(self) -> Dict[ServiceId, HealthCheckResult]:
+        ...
+
+    @abstractmethod
+    async def find_recent_by_service_id(self, service_id: ServiceId, limit: int = 20) -> List[HealthCheckResult]:
+        ...
+
+    @abstractmethod
+    async def find_history(
+        self,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+        resolution: HistoryResolution,
+    ) -> List[HealthCheckBucket]:
+        ...
+
+    @abstractmethod
+    async def load_series(self, service_id: ServiceId, start: datetime, end: datetime) -> HealthCheckSeries:
+        ...
+
+    @abstractmethod
+    async def find_page_by_service_id(
+        self,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 1_000,
+    ) -> List[HealthCheckResult]:
+        ...
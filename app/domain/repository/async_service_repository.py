@@ -0,0 +1,35 @@
+# app/domain/repository/async_service_repository.py
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+
+from app.domain.model.service import Service
+from app.domain.model.value_objects import ServiceId
+
+
+class AsyncServiceRepository(ABC):
+    """
+    Async variant of ServiceRepository, for callers on the event loop.
+    Implementations must not block the loop (e.g. run DB work in a thread pool).
+    """
+
+    @abstractmethod
+    async def find_all_enabled(self) -> List[Service]:
+        ...
+
+    @abstractmethod
+    async def find_by_id(self, service_id: ServiceId) -> Optional[Service]:
+        ...
+
+    @abstractmethod
+    async def save(self, service: Service) -> None:
+        ...
+
+    @abstractmethod
+    async def save_or_update_many(self, services: Iterable[Service]) -> None:
+        ...
+
+    @abstractmethod
+    async def list_all(self) -> List[Service]:
+        ...
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.health_check import HealthCheckBucket, HealthCheckResult, HistoryResolution
+from app.domain.model.health_check_series import HealthCheckSeries
 from app.domain.model.value_objects import ServiceId
 
 
@@ -18,6 +20,14 @@ class HealthCheckRepository(ABC):
     def save(self, result: HealthCheckResult) -> None:
         ...
 
+    def save_many(self, results: Iterable[HealthCheckResult]) -> None:
+        """
+        Default implementation in terms of save(); implementations should
+        override it with a single-transaction batch insert.
+        """
+        for result in results:
+            self.save(result)
+
     @abstractmethod
     def find_latest_by_service_id(self, service_id: ServiceId) -> Optional[HealthCheckResult]:
         ...
@@ -32,3 +42,41 @@ class HealthCheckRepository(ABC):
     @abstractmethod
     def find_recent_by_service_id(self, service_id: ServiceId, limit: int = 20) -> List[HealthCheckResult]:
         ...
+
+    @abstractmethod
+    def find_history(
+        self,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+        resolution: HistoryResolution,
+    ) -> List[HealthCheckBucket]:
+        """
+        Checks of one service in [start, end), oldest first, aggregated to
+        `resolution`. Covers raw rows and rollups, whichever holds the range.
+        """
+        ...
+
+    @abstractmethod
+    def load_series(self, service_id: ServiceId, start: datetime, end: datetime) -> HealthCheckSeries:
+        """
+        Checks of one service in [start, end) as columns, for bulk statistics.
+        """
+        ...
+
+    @abstractmethod
+    def find_page_by_service_id(
+        self,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 1_000,
+    ) -> List[HealthCheckResult]:
+        """
+        Keyset page: checks of one service with start <= timestamp < end that
+        come after `after` in (timestamp, id) order, oldest first, at most
+        `limit` of them. Pass the last row's (timestamp, id) as `after` to
+        get the next page.
+        """
+        ...
@@ -0,0 +1,71 @@
+# app/domain/services/adaptive_timeout_policy.py
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, Set
+
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.value_objects import HealthStatus, ServiceId
+
+
+class AdaptiveTimeoutPolicy:
+    """
+    Domain service that gives each service a probe timeout fitted to how
+    fast it normally answers: `multiplier` x the `percentile` latency of its
+    last `window` UP checks, clamped to [min_seconds, max_seconds].
+    - Until a service has `min_samples` UP checks, it gets max_seconds.
+    - Only UP latencies are sampled, so a slow outage can't shrink the
+      timeout and a timed-out probe can't grow it.
+    - After a DOWN check the service gets max_seconds until it is UP again:
+      a service that merely got slower than its fitted timeout (but not
+      slower than max_seconds) then answers, and its new latency is sampled,
+      instead of timing out forever.
+    """
+
+    def __init__(
+        self,
+        max_seconds: float,
+        min_seconds: float = 1.0,
+        percentile: float = 0.99,
+        multiplier: float = 3.0,
+        window: int = 50,
+        min_samples: int = 5,
+    ) -> None:
+        self._max = max_seconds
+        self._min = min(min_seconds, max_seconds)
+        self._percentile = percentile
+        self._multiplier = multiplier
+        self._window = window
+        self._min_samples = max(1, min_samples)
+        self._latencies: Dict[ServiceId, Deque[int]] = {}
+        self._failing: Set[ServiceId] = set()
+
+    @property
+    def max_seconds(self) -> float:
+        return self._max
+
+    def timeout_for(self, service_id: ServiceId) -> float:
+        if service_id in self._failing:
+            return self._max
+        samples = self._latencies.get(service_id)
+        if samples is None or len(samples) < self._min_samples:
+            return self._max
+        ordered = sorted(samples)
+        latency_ms = ordered[min(len(ordered) - 1, int(self._percentile * len(ordered)))]
+        return max(self._min, min(self._max, latency_ms * self._multiplier / 1000))
+
+    def record(self, result: HealthCheckResult) -> None:
+        if result.status == HealthStatus.DOWN:
+            self._failing.add(result.service_id)
+            return
+        if result.status != HealthStatus.UP or result.latency_ms is None:
+            return
+        self._failing.discard(result.service_id)
+        samples = self._latencies.get(result.service_id)
+        if samples is None:
+            samples = self._latencies[result.service_id] = deque(maxlen=self._window)
+        samples.append(result.latency_ms)
+
+    def forget(self, service_id: ServiceId) -> None:
+        self._latencies.pop(service_id, None)
+        self._failing.discard(service_id)
@@ -0,0 +1,69 @@
+# app/domain/services/failure_streak_tracker.py
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, List, Sequence
+
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.value_objects import HealthStatus, ServiceId
+
+
+class FailureStreakTracker:
+    """
+    Domain service that counts consecutive DOWN checks per service.
+    Updated in O(1) per result; record() returns True only on the check that
+    makes the streak reach `threshold`, so an outage alerts once rather than
+    on every cycle after the threshold is crossed.
+    """
+
+    def __init__(self, threshold: int) -> None:
+        self._threshold = max(1, threshold)
+        self._streaks: Dict[ServiceId, int] = {}
+        self._recent: Dict[ServiceId, Deque[HealthCheckResult]] = {}
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    def seed(self, service_id: ServiceId, recent_checks: Sequence[HealthCheckResult]) -> None:
+        """
+        Rebuild state from history; `recent_checks` is newest first (as returned
+        by HealthCheckRepository.find_recent_by_service_id).
+        """
+        streak = 0
+        for check in recent_checks:
+            if check.status != HealthStatus.DOWN:
+                break
+            streak += 1
+
+        self._streaks[service_id] = streak
+        # Stored oldest -> newest, like record() appends
+        self._recent[service_id] = deque(reversed(recent_checks[: self._threshold]), maxlen=self._threshold)
+
+    def record(self, result: HealthCheckResult) -> bool:
+        sid = result.service_id
+        recent = self._recent.get(sid)
+        if recent is None:
+            recent = deque(maxlen=self._threshold)
+            self._recent[sid] = recent
+        recent.append(result)
+
+        if result.status == HealthStatus.DOWN:
+            streak = self._streaks.get(sid, 0) + 1
+        else:
+            streak = 0
+        self._streaks[sid] = streak
+        return streak == self._threshold
+
+    def streak(self, service_id: ServiceId) -> int:
+        return self._streaks.get(service_id, 0)
+
+    def recent(self, service_id: ServiceId) -> List[HealthCheckResult]:
+        """
+        Last `threshold` results for a service, newest first.
+        """
+        return list(reversed(self._recent.get(service_id, ())))
+
+    def forget(self, service_id: ServiceId) -> None:
+        self._streaks.pop(service_id, None)
+        self._recent.pop(service_id, None)
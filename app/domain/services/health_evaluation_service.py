@@ -19,6 +19,9 @@ class HealthCheckInput:
     latency_ms: int | None
     reported_version: str | None
     error_message: str | None = None
+    connect_ms: int | None = None
+    # TCP probes have no HTTP status; True when the connection was accepted
+    tcp_connected: bool = False
 
 
 class HealthEvaluationService:
@@ -32,7 +35,7 @@ class HealthEvaluationService:
 
         # --- Determine status (MVP logic) ---
         if data.http_status_code is None:
-            status = HealthStatus.DOWN
+            status = HealthStatus.UP if data.tcp_connected else HealthStatus.DOWN
         elif 200 <= data.http_status_code < 300:
             status = HealthStatus.UP
         else:
@@ -60,4 +63,5 @@ class HealthEvaluationService:
             version=version_obj,
             version_matches_expected=version_matches,
             error_message=data.error_message,
+            connect_ms=data.connect_ms,
         )
@@ -0,0 +1,90 @@
+# app/domain/services/health_stats_calculator.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from app.domain.model.health_check_series import HealthCheckSeries
+
+
+@dataclass(frozen=True)
+class ServiceHealthStats:
+    checks: int
+    up_checks: int
+    availability_percent: Optional[float]
+    error_rate_percent: Optional[float]
+    latency_p50_ms: Optional[float]
+    latency_p90_ms: Optional[float]
+    latency_p99_ms: Optional[float]
+    incidents: int  # DOWN periods in the window, including one already in progress at its start
+    mttr_seconds: Optional[float]  # mean time from first failure to first recovery
+    ongoing_incident: bool
+    raw_checks: int
+    rolled_up_checks: int
+
+
+class HealthStatsCalculator:
+    """
+    Domain service for SLO statistics over a HealthCheckSeries, computed with
+    vectorised NumPy operations (no per-check Python loop).
+    - Availability / error rate count every check in the window, including
+      those already compacted into rollups.
+    - Latency percentiles use successful (UP) raw checks.
+    - Incidents: DOWN runs in the window. A run already in progress at the
+      window start counts too (clipped to the window).
+    - MTTR: for every DOWN run that recovered inside the window, the time
+      from its first DOWN check to the next UP check. A run already in
+      progress at the window start has no known start, so it is left out
+      of MTTR.
+    """
+
+    def calculate(self, series: HealthCheckSeries) -> ServiceHealthStats:
+        up = series.up
+        checks = series.raw_checks + series.rolled_up_checks
+        up_checks = int(np.count_nonzero(up)) + series.rolled_up_up_checks
+
+        latencies = series.latency_ms[up & ~np.isnan(series.latency_ms)]
+        p50 = p90 = p99 = None
+        if latencies.size:
+            p50, p90, p99 = (round(float(v), 1) for v in np.percentile(latencies, [50, 90, 99]))
+
+        incidents, mttr, ongoing = self._incidents(series.timestamps_ms, up)
+
+        return ServiceHealthStats(
+            checks=checks,
+            up_checks=up_checks,
+            availability_percent=round(100.0 * up_checks / checks, 3) if checks else None,
+            error_rate_percent=round(100.0 * (checks - up_checks) / checks, 3) if checks else None,
+            latency_p50_ms=p50,
+            latency_p90_ms=p90,
+            latency_p99_ms=p99,
+            incidents=incidents,
+            mttr_seconds=mttr,
+            ongoing_incident=ongoing,
+            raw_checks=series.raw_checks,
+            rolled_up_checks=series.rolled_up_checks,
+        )
+
+    @staticmethod
+    def _incidents(timestamps_ms: np.ndarray, up: np.ndarray) -> tuple[int, Optional[float], bool]:
+        if up.size == 0:
+            return 0, None, False
+        down = ~up
+        # +1 where a DOWN run starts, -1 where it ends (the first UP after it)
+        edges = np.diff(down.astype(np.int8))
+        starts = np.flatnonzero(edges == 1) + 1
+        ends = np.flatnonzero(edges == -1) + 1
+        incidents = int(starts.size)
+        if down[0]:
+            # Started before the window: an incident, but its recovery can't go
+            # into MTTR since its duration is unknown
+            incidents += 1
+            ends = ends[1:]
+        ongoing = bool(down[-1])
+        recovered = starts[: ends.size]
+        mttr = None
+        if ends.size:
+            mttr = round(float(np.mean(timestamps_ms[ends] - timestamps_ms[recovered])) / 1000, 3)
+        return incidents, mttr, ongoing
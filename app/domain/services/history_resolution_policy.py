@@ -0,0 +1,30 @@
+# app/domain/services/history_resolution_policy.py
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from app.domain.model.health_check import HistoryResolution
+
+
+class HistoryResolutionPolicy:
+    """
+    Domain service that picks the resolution for a history query:
+    the finest one that keeps the number of points reasonable for the
+    requested span and still has data back to `start` under the retention
+    policy (raw rows and 1-minute rollups are compacted away over time).
+    """
+
+    RAW_MAX_SPAN = timedelta(hours=6)
+    MINUTE_MAX_SPAN = timedelta(days=7)
+
+    def __init__(self, raw_retention: timedelta, minute_retention: timedelta) -> None:
+        self._raw_retention = raw_retention
+        self._minute_retention = max(minute_retention, raw_retention)
+
+    def choose(self, start: datetime, end: datetime, now: datetime) -> HistoryResolution:
+        span = end - start
+        if span <= self.RAW_MAX_SPAN and start >= now - self._raw_retention:
+            return HistoryResolution.RAW
+        if span <= self.MINUTE_MAX_SPAN and start >= now - self._minute_retention:
+            return HistoryResolution.MINUTE
+        return HistoryResolution.HOUR
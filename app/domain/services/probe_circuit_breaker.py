@@ -0,0 +1,97 @@
+# app/domain/services/probe_circuit_breaker.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.value_objects import BreakerState, HealthStatus, ServiceId
+
+
+@dataclass
+class _Breaker:
+    state: BreakerState = BreakerState.CLOSED
+    failures: int = 0
+    retry_at: float = 0.0
+
+
+class ProbeCircuitBreaker:
+    """
+    Domain service that stops spending a full probe (often a whole timeout)
+    every interval on services already known to be down.
+    - CLOSED: every due check runs. `failure_threshold` consecutive DOWN
+      results open the breaker.
+    - OPEN: due checks are skipped until `open_seconds` have passed; the
+      next due check then runs as a trial probe (HALF_OPEN).
+    - HALF_OPEN: one trial in flight. UP closes the breaker, DOWN opens it
+      for another `open_seconds` (as does a trial that never reports back).
+    record() returns the state a result moved the breaker to (None if it
+    stayed put), so callers can store transitions with the result.
+    Times come from `clock` (monotonic seconds).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        open_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = max(1, failure_threshold)
+        self._open_seconds = open_seconds
+        self._clock = clock
+        self._breakers: Dict[ServiceId, _Breaker] = {}
+        self.skipped = 0  # allow() calls answered False
+
+    def state(self, service_id: ServiceId) -> BreakerState:
+        breaker = self._breakers.get(service_id)
+        return breaker.state if breaker is not None else BreakerState.CLOSED
+
+    def allow(self, service_id: ServiceId) -> bool:
+        """
+        Whether a check that is due now should probe the service.
+        """
+        breaker = self._breakers.get(service_id)
+        if breaker is None or breaker.state == BreakerState.CLOSED:
+            return True
+        now = self._clock()
+        if now < breaker.retry_at:
+            self.skipped += 1  # still open, or a trial probe is in flight
+            return False
+        # Also covers a trial that never reported back: another one after open_seconds
+        breaker.state = BreakerState.HALF_OPEN
+        breaker.retry_at = now + self._open_seconds
+        return True
+
+    def record(self, result: HealthCheckResult) -> Optional[BreakerState]:
+        sid = result.service_id
+        breaker = self._breakers.get(sid)
+        if result.status != HealthStatus.DOWN:
+            if breaker is None:
+                return None
+            del self._breakers[sid]
+            return BreakerState.CLOSED if breaker.state != BreakerState.CLOSED else None
+
+        if breaker is None:
+            breaker = self._breakers[sid] = _Breaker()
+        breaker.failures += 1
+        if breaker.state == BreakerState.HALF_OPEN or (
+            breaker.state == BreakerState.CLOSED and breaker.failures >= self._threshold
+        ):
+            breaker.state = BreakerState.OPEN
+            breaker.retry_at = self._clock() + self._open_seconds
+            return BreakerState.OPEN
+        return None
+
+    def forget(self, service_id: ServiceId) -> None:
+        """
+        Start over for a service (e.g. its URL changed).
+        """
+        self._breakers.pop(service_id, None)
+
+    def counts(self) -> Dict[BreakerState, int]:
+        counts = {state: 0 for state in BreakerState if state != BreakerState.CLOSED}
+        for breaker in self._breakers.values():
+            if breaker.state != BreakerState.CLOSED:
+                counts[breaker.state] += 1
+        return counts
@@ -0,0 +1,38 @@
+# app/domain/services/service_catalogue_diff.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Mapping
+
+from app.domain.model.service import Service
+from app.domain.model.value_objects import ServiceId
+
+
+@dataclass
+class ServiceCatalogueDiff:
+    """
+    What changed between two versions of a service catalogue (e.g. two
+    reads of services.json). Services are compared field by field, so a
+    service that is byte-for-byte the same is neither added nor changed.
+    """
+    added: List[Service] = field(default_factory=list)
+    changed: List[Service] = field(default_factory=list)
+    removed: List[Service] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    @staticmethod
+    def between(previous: Mapping[ServiceId, Service], current: Iterable[Service]) -> "ServiceCatalogueDiff":
+        diff = ServiceCatalogueDiff()
+        seen = set()
+        for service in current:
+            seen.add(service.id)
+            before = previous.get(service.id)
+            if before is None:
+                diff.added.append(service)
+            elif before != service:
+                diff.changed.append(service)
+        diff.removed = [service for sid, service in previous.items() if sid not in seen]
+        return diff
@@ -0,0 +1,235 @@
+# app/infrastructure/alerting/alert_dispatcher.py
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.alert_outbox_repository import OutboxEntry, SQLiteAlertOutboxRepository
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.db.db_executor import run_with_session
+from app.infrastructure.metrics.app_metrics import alert_webhook_failures_total, metrics_registry
+from app.infrastructure.metrics.registry import CallbackMetric
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AlertDispatcher:
+    """
+    Delivers alert webhooks off the check path.
+    - enqueue() only appends to an in-memory list and wakes the worker, so
+      raising an alert costs the scheduler nothing.
+    - The worker writes new alerts to the alert_outbox table straight away,
+      then waits `batch_window_ms` so alerts from the same outage pile up,
+      and POSTs due rows in batches of up to `batch_max_size` as one
+      {"alerts": [...], "count": n} payload over a pooled client.
+    - A failed batch is retried with exponential backoff (with jitter) up to
+      `max_attempts` times; rows that run out of attempts are marked dead.
+    - Delivered rows are deleted. Rows still pending at shutdown (or after a
+      crash) are picked up by the next start, so delivery is at-least-once.
+    - Rows are claimed before they are sent, so the dispatchers of several
+      workers sharing the database don't deliver the same alerts.
+    """
+
+    def __init__(
+        self,
+        webhook_url: Optional[str] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_window_ms: int = 2_000,
+        batch_max_size: int = 100,
+        timeout_seconds: float = 5.0,
+        retry_base_seconds: float = 2.0,
+        retry_max_seconds: float = 300.0,
+        max_attempts: int = 10,
+    ) -> None:
+        self._webhook_url = webhook_url
+        self._session_factory = session_factory
+        self._batch_window = batch_window_ms / 1000
+        self._batch_max_size = batch_max_size
+        self._timeout = timeout_seconds
+        self._retry_base = retry_base_seconds
+        self._retry_max = retry_max_seconds
+        self._max_attempts = max_attempts
+        self._incoming: List[Dict[str, Any]] = []
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._next_attempt_at: Optional[datetime] = None
+        self.outbox_pending = 0
+        self.batches_sent = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._webhook_url)
+
+    @property
+    def queued(self) -> int:
+        return len(self._incoming)
+
+    def enqueue(self, payload: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        self._incoming.append(payload)
+        self._wake.set()
+
+    def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._wake = asyncio.Event()
+            if self._incoming:
+                self._wake.set()
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+            )
+            # Deliver whatever a previous run left in the outbox
+            self._next_attempt_at = datetime.utcnow()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the worker and persist alerts that haven't reached the outbox yet.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self._persist_incoming()
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Could not persist %s queued alerts: %s", len(self._incoming), exc)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._wait()
+                if self._incoming:
+                    await self._persist_incoming()
+                    # Let alerts from the same incident join this batch
+                    await asyncio.sleep(self._batch_window)
+                    await self._persist_incoming()
+                await self._deliver_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Alert delivery loop failed: %s", exc)
+                await asyncio.sleep(self._retry_base)
+
+    async def _wait(self) -> None:
+        if self._incoming:
+            return
+        timeout = None
+        if self._next_attempt_at is not None:
+            timeout = max(0.0, (self._next_attempt_at - datetime.utcnow()).total_seconds())
+        waiter = asyncio.ensure_future(self._wake.wait())
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        finally:
+            waiter.cancel()
+        self._wake.clear()
+
+    async def _persist_incoming(self) -> None:
+        if not self._incoming:
+            return
+        batch, self._incoming = self._incoming, []
+        now = datetime.utcnow()
+        await run_with_session(
+            lambda db: SQLiteAlertOutboxRepository(db).add_many(batch, now), self._session_factory
+        )
+        self._next_attempt_at = now
+
+    async def _deliver_due(self) -> None:
+        while True:
+            now = datetime.utcnow()
+            claimed_until = now + timedelta(seconds=2 * self._timeout + self._retry_base)
+            entries = await run_with_session(
+                lambda db: SQLiteAlertOutboxRepository(db).claim_due(now, self._batch_max_size, claimed_until),
+                self._session_factory,
+            )
+            if not entries:
+                break
+            error = await self._post(entries)
+            if error is None:
+                self.batches_sent += 1
+                await run_with_session(
+                    lambda db: SQLiteAlertOutboxRepository(db).delete(e.id for e in entries), self._session_factory
+                )
+                continue
+            alert_webhook_failures_total.inc()
+            # One jitter draw per batch keeps rows that failed together in the same retry
+            jitter = random.uniform(0.5, 1.0)
+            retry_at = {entry.id: self._retry_at(entry, now, jitter) for entry in entries}
+            await run_with_session(
+                lambda db: SQLiteAlertOutboxRepository(db).record_failure(entries, error, retry_at),
+                self._session_factory,
+            )
+            dead = sum(1 for at in retry_at.values() if at is None)
+            if dead:
+                logger.error("Giving up on %s alert webhook deliveries after %s attempts", dead, self._max_attempts)
+            break
+
+        summary = await run_with_session(
+            lambda db: SQLiteAlertOutboxRepository(db).pending_summary(), self._session_factory
+        )
+        self.outbox_pending = summary["pending"]
+        self._next_attempt_at = summary["nextAttemptAt"]
+
+    def _retry_at(self, entry: OutboxEntry, now: datetime, jitter: float) -> Optional[datetime]:
+        attempt = entry.attempts + 1
+        if attempt >= self._max_attempts:
+            return None
+        delay = min(self._retry_max, self._retry_base * 2 ** (attempt - 1))
+        return now + timedelta(seconds=delay * jitter)
+
+    async def _post(self, entries: List[OutboxEntry]) -> Optional[str]:
+        """
+        POST one batch; returns None on success, else a description of the failure.
+        """
+        alerts = [entry.payload for entry in entries]
+        try:
+            response = await self._client.post(
+                self._webhook_url,
+                headers={"Content-Type": "application/json"},
+                content=json.dumps({"alerts": alerts, "count": len(alerts)}),
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Alert webhook delivery of %s alerts failed: %s", len(alerts), exc)
+            return f"{type(exc).__name__}: {exc}"
+        if not response.is_success:
+            logger.warning("Alert webhook answered %s for a batch of %s alerts", response.status_code, len(alerts))
+            return f"HTTP {response.status_code}"
+        return None
+
+
+def _delivery_backlog() -> List[Tuple[Tuple[str, ...], float]]:
+    return [(("memory",), alert_dispatcher.queued), (("outbox",), alert_dispatcher.outbox_pending)]
+
+
+# Process-wide dispatcher; the health check scheduler starts and stops it.
+alert_dispatcher = AlertDispatcher(
+    webhook_url=settings.alert_webhook_url,
+    batch_window_ms=settings.alert_batch_window_ms,
+    batch_max_size=settings.alert_batch_max_size,
+    timeout_seconds=settings.alert_webhook_timeout_seconds,
+    retry_base_seconds=settings.alert_retry_base_seconds,
+    retry_max_seconds=settings.alert_retry_max_seconds,
+    max_attempts=settings.alert_max_attempts,
+)
+
+metrics_registry.register(CallbackMetric(
+    "srm_alert_delivery_backlog",
+    "Alerts waiting for webhook delivery: queued in memory, or pending in the outbox table.",
+    "gauge", _delivery_backlog, ("stage",),
+))
@@ -1,15 +1,13 @@
 # app/infrastructure/alerting/alert_notifier.py
 from __future__ import annotations
 
-import json
 import logging
 from typing import Sequence
 
-import httpx
-
 from app.domain.model.health_check import HealthCheckResult
 from app.domain.model.service import Service
-from config.settings import settings
+from app.infrastructure.alerting.alert_dispatcher import AlertDispatcher, alert_dispatcher
+from app.infrastructure.metrics.app_metrics import alerts_sent_total
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +15,15 @@ logger = logging.getLogger(__name__)
 class AlertNotifier:
     """
     Sends alerts when certain conditions are met.
-    MVP: log to console; optionally POST to a webhook if configured.
+    MVP: log to console; if a webhook is configured, hand the alert to the
+    AlertDispatcher, which batches, retries and persists deliveries in the
+    background (raising an alert never waits on the webhook).
     """
 
-    def __init__(self, webhook_url: str | None = None) -> None:
-        self._webhook_url = webhook_url or settings.alert_webhook_url
+    def __init__(self, dispatcher: AlertDispatcher = alert_dispatcher) -> None:
+        self._dispatcher = dispatcher
 
-    async def service_down_repeatedly(
+    def service_down_repeatedly(
         self,
         service: Service,
         recent_checks: Sequence[HealthCheckResult],
@@ -39,26 +39,15 @@ class AlertNotifier:
 
         # Always log
         logger.warning(message)
+        alerts_sent_total.inc()
 
         # Optionally send webhook
-        if self._webhook_url:
-            payload = {
-                "serviceId": str(service.id),
-                "name": service.name,
-                "url": service.url,
-                "environment": service.environment.value,
-                "consecutiveFailures": threshold,
-                "lastStatus": recent_checks[0].status.value,
-                "lastCheckedAt": recent_checks[0].timestamp.isoformat(),
-            }
-            try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    await client.post(
-                        self._webhook_url,
-                        headers={"Content-Type": "application/json"},
-                        content=json.dumps(payload),
-                    )
-            except Exception as exc:  # noqa: BLE001
-                logger.exception(
-                    "Failed to send alert webhook for service %s: %s", service.id, exc
-                )
+        self._dispatcher.enqueue({
+            "serviceId": str(service.id),
+            "name": service.name,
+            "url": service.url,
+            "environment": service.environment.value,
+            "consecutiveFailures": threshold,
+            "lastStatus": recent_checks[0].status.value,
+            "lastCheckedAt": recent_checks[0].timestamp.isoformat(),
+        })
@@ -0,0 +1,138 @@
+# app/infrastructure/cache/response_cache.py
+from __future__ import annotations
+
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+from app.infrastructure.metrics.app_metrics import metrics_registry
+from app.infrastructure.metrics.registry import CallbackMetric
+from config.settings import settings
+
+# Data tags used by the read API:
+STATUS = "status"  # latest status per service (snapshot-backed: /health, dashboard)
+SERVICES = "services"  # the service catalogue
+CHECKS = "checks"  # all stored health checks (e.g. after retention compaction)
+
+
+def checks_tag(service_id: object) -> str:
+    """
+    Stored health checks of one service.
+    """
+    return f"{CHECKS}:{service_id}"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str
+    body: bytes
+    media_type: str
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    In-process cache of rendered read-API responses plus the data versions
+    their ETags are derived from.
+    - Every response depends on a few data tags (see STATUS, SERVICES, ...);
+      its ETag is the current version of those tags plus a digest of the
+      request variant (path and normalized query), so it changes exactly
+      when the data behind the response does, and responses to different
+      queries never share one.
+    - Writers call invalidate(tag) (the scheduler after checks land, the
+      service endpoints after catalogue changes); that bumps the tag's
+      version, which makes every cached body built from it unreachable.
+    - Writes this process doesn't see (another worker, scripts, manual DB
+      edits) can't call invalidate(), so a tag's version also moves on by
+      itself once it is `ttl_seconds` old: ETags and cached bodies alike
+      are then good for at most that long. Bodies are also LRU-bounded.
+    ETags carry a per-process id, so they never match across restarts.
+    All access happens on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, max_entries: int = 1_024, ttl_seconds: float = 5.0) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._versions: Dict[str, Tuple[int, float]] = {}  # tag -> (version, monotonic time it was set)
+        self._instance = uuid.uuid4().hex[:8]
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def etag(self, tags: Sequence[str], variant: str = "") -> str:
+        now = time.monotonic()
+        versions = ".".join(str(self._version(tag, now)) for tag in tags)
+        digest = hashlib.blake2b(variant.encode("utf-8"), digest_size=6).hexdigest()
+        return f'"{self._instance}-{versions}-{digest}"'
+
+    def invalidate(self, *tags: str) -> None:
+        now = time.monotonic()
+        for tag in tags:
+            version, _ = self._versions.get(tag, (0, now))
+            self._versions[tag] = (version + 1, now)
+
+    def _version(self, tag: str, now: float) -> int:
+        entry = self._versions.get(tag)
+        if entry is None:
+            self._versions[tag] = (0, now)
+            return 0
+        version, since = entry
+        if now - since >= self._ttl:
+            version += 1  # the TTL backstop
+            self._versions[tag] = (version, now)
+        return version
+
+    def invalidate_checks(self, service_ids: Iterable[object]) -> None:
+        self.invalidate(*{checks_tag(sid) for sid in service_ids})
+
+    def get(self, key: Hashable, etag: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None or entry.etag != etag or entry.expires_at < time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, etag: str, body: bytes, media_type: str) -> CachedResponse:
+        entry = CachedResponse(etag, body, media_type, time.monotonic() + self._ttl)
+        if self._max_entries > 0 and self._ttl > 0:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "notModified": self.not_modified,
+        }
+
+
+# Process-wide cache shared by the read endpoints and the writers that invalidate it.
+response_cache = ResponseCache(
+    max_entries=settings.response_cache_max_entries,
+    ttl_seconds=settings.response_cache_ttl_seconds,
+)
+
+metrics_registry.register(CallbackMetric(
+    "srm_response_cache_requests_total",
+    "Cached read API lookups: hit, miss (rebuilt) or not_modified (304).",
+    "counter",
+    lambda: [
+        (("hit",), response_cache.hits),
+        (("miss",), response_cache.misses),
+        (("not_modified",), response_cache.not_modified),
+    ],
+    ("result",),
+))
@@ -0,0 +1,222 @@
+# app/infrastructure/cache/status_broadcaster.py
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+from app.application.dto.service_health_summary_dto import ServiceHealthSummaryDto
+from app.domain.model.value_objects import ServiceId
+from app.infrastructure.cache.status_snapshot import StatusSnapshot, status_snapshot
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def sse_frame(event: str, payload: dict, event_id: Optional[int] = None) -> str:
+    """
+    One Server-Sent Events message.
+    """
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n"
+
+
+class _Subscriber:
+    """
+    One open stream. Frames are queued already encoded; a viewer that falls
+    `queue_size` frames behind is not waited for: its backlog is dropped and
+    it is sent a fresh full snapshot instead.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=queue_size)
+        self.resync = False
+
+    def push(self, frame: Optional[str]) -> None:
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            if frame is None:
+                self.queue.put_nowait(None)
+            else:
+                self.resync = True
+                self.queue.put_nowait("")  # wake the reader
+
+
+class StatusBroadcaster:
+    """
+    Pushes status changes to live dashboards (Server-Sent Events).
+    - Fed by StatusSnapshot change notifications, so it never touches the DB.
+    - Changes are coalesced for `coalesce_seconds`, then encoded once and the
+      same frame is fanned out to every open stream: the cost of a check
+      cycle does not grow with the number of viewers.
+    - Only rows whose status, latency or version changed are sent
+      (`update` events); services re-checked with the same result only get
+      their new check time (`checked`: service id -> timestamp), so
+      "Last Checked" stays current without resending their rows. A new
+      stream first gets the whole table (`snapshot` event, shared by all
+      streams opened at the same version).
+    All state is touched on the event loop thread only.
+    """
+
+    def __init__(
+        self,
+        snapshot: StatusSnapshot,
+        coalesce_seconds: float = 0.5,
+        queue_size: int = 64,
+        keepalive_seconds: float = 15.0,
+        max_stream_seconds: float = 300.0,
+        retry_ms: int = 2_000,
+    ) -> None:
+        self._snapshot = snapshot
+        self._coalesce_seconds = coalesce_seconds
+        self._queue_size = queue_size
+        self._keepalive_seconds = keepalive_seconds
+        self._max_stream_seconds = max_stream_seconds
+        self._retry_ms = retry_ms
+        self._subscribers: Set[_Subscriber] = set()
+        self._pending: Set[ServiceId] = set()
+        self._pending_checked: Set[ServiceId] = set()
+        self._pending_all = False
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._snapshot_frame: Optional[tuple] = None  # (snapshot version, frame)
+        self.frames_sent = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._wake = asyncio.Event()
+        self._snapshot.add_listener(self._on_change)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._snapshot.remove_listener(self._on_change)
+        for subscriber in list(self._subscribers):
+            subscriber.push(None)  # ends the stream
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def stream(self) -> AsyncIterator[str]:
+        """
+        SSE body for one viewer: a snapshot, then updates and keepalive
+        comments. The stream ends after `max_stream_seconds` (the browser
+        reconnects after `retry_ms` and resyncs from a fresh snapshot), so an
+        open dashboard never holds up a graceful server shutdown for longer.
+        """
+        subscriber = _Subscriber(self._queue_size)
+        self._subscribers.add(subscriber)
+        deadline = time.monotonic() + self._max_stream_seconds
+        # One pending get() is kept across keepalive timeouts rather than
+        # cancelled and re-issued, so a frame can't be lost to a timeout race.
+        getter: Optional[asyncio.Future] = None
+        try:
+            yield f"retry: {self._retry_ms}\n\n"
+            yield self.snapshot_frame()
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                if getter is None:
+                    getter = asyncio.ensure_future(subscriber.queue.get())
+                done, _ = await asyncio.wait({getter}, timeout=min(self._keepalive_seconds, remaining))
+                if not done:
+                    yield ": keepalive\n\n"
+                    continue
+                frame, getter = getter.result(), None
+                if frame is None:
+                    return
+                if subscriber.resync:
+                    subscriber.resync = False
+                    yield self.snapshot_frame()
+                elif frame:
+                    yield frame
+        finally:
+            if getter is not None:
+                getter.cancel()
+            self._subscribers.discard(subscriber)
+
+    def snapshot_frame(self) -> str:
+        version = self._snapshot.version
+        if self._snapshot_frame is None or self._snapshot_frame[0] != version:
+            services = [
+                ServiceHealthSummaryDto.from_domain(service, check).model_dump(mode="json")
+                for service, check in self._snapshot.latest()
+            ]
+            frame = sse_frame("snapshot", {"version": version, "services": services}, version)
+            self._snapshot_frame = (version, frame)
+        return self._snapshot_frame[1]
+
+    def _on_change(self, service_id: Optional[ServiceId], changed: bool = True) -> None:
+        if service_id is None:
+            self._pending_all = True
+        elif changed:
+            self._pending.add(service_id)
+        else:
+            self._pending_checked.add(service_id)
+        self._wake.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            # Let the rest of the cycle's results land, then send them together
+            await asyncio.sleep(self._coalesce_seconds)
+            self._wake.clear()
+            try:
+                self._flush()
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to broadcast status changes")
+
+    def _flush(self) -> None:
+        pending, pending_checked, pending_all = self._pending, self._pending_checked, self._pending_all
+        self._pending, self._pending_checked, self._pending_all = set(), set(), False
+        if not self._subscribers:
+            return
+        if pending_all:
+            frame = self.snapshot_frame()
+        else:
+            changed: List[dict] = []
+            removed: List[str] = []
+            checked: Dict[str, str] = {}
+            for sid in pending:
+                row = self._snapshot.get(sid)
+                if row is None:
+                    removed.append(str(sid))
+                else:
+                    changed.append(ServiceHealthSummaryDto.from_domain(*row).model_dump(mode="json"))
+            for sid in pending_checked - pending:
+                row = self._snapshot.get(sid)
+                if row is not None:
+                    checked[str(sid)] = row[1].timestamp.isoformat()
+            version = self._snapshot.version
+            frame = sse_frame(
+                "update",
+                {"version": version, "services": changed, "removed": removed, "checked": checked},
+                version,
+            )
+        for subscriber in list(self._subscribers):
+            subscriber.push(frame)
+        self.frames_sent += 1
+
+
+# Process-wide broadcaster shared by every open dashboard.
+status_broadcaster = StatusBroadcaster(
+    status_snapshot,
+    coalesce_seconds=settings.dashboard_stream_coalesce_ms / 1000,
+    queue_size=settings.dashboard_stream_queue_size,
+    keepalive_seconds=settings.dashboard_stream_keepalive_seconds,
+    max_stream_seconds=settings.dashboard_stream_max_seconds,
+)
@@ -0,0 +1,153 @@
+# app/infrastructure/cache/status_snapshot.py
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.service import Service
+from app.domain.model.value_objects import ServiceId
+
+# Called with the id of a service whose row changed (or None when every row may have
+# changed) and True; or with a service id and False when only its check time moved
+SnapshotListener = Callable[[Optional[ServiceId], bool], None]
+
+
+def _row_key(check: HealthCheckResult) -> tuple:
+    # What a dashboard row shows, besides the check time
+    return (check.status, check.latency_ms, check.version, check.version_matches_expected)
+
+
+class StatusSnapshot:
+    """
+    In-process read model of the latest health status per service.
+    - Warmed from the DB at startup.
+    - Updated by the scheduler after every check and by service writes.
+    - `version` increases on every change, so clients can poll it cheaply
+      and only re-fetch when it moves.
+    - Listeners are told which service's row changed (status, latency or
+      version, or the service itself), e.g. to push live dashboard updates,
+      and which services were only re-checked with the same result.
+    - Services disabled or removed since the warm-up are remembered, and
+      results for them are ignored until they are enabled again, so a check
+      still in flight when its service was disabled can't put it back.
+    All mutation happens on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        self._services: Dict[ServiceId, Service] = {}
+        self._latest: Dict[ServiceId, HealthCheckResult] = {}
+        self._retired: Set[ServiceId] = set()
+        self._version = 0
+        self._listeners: List[SnapshotListener] = []
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def add_listener(self, listener: SnapshotListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: SnapshotListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def get(self, service_id: ServiceId) -> Optional[Tuple[Service, HealthCheckResult]]:
+        """
+        (service, latest check) for one service, or None if it is not in the snapshot.
+        """
+        service = self._services.get(service_id)
+        check = self._latest.get(service_id)
+        if service is None or check is None:
+            return None
+        return service, check
+
+    def warm(
+        self,
+        services: Iterable[Service],
+        latest_checks: Mapping[ServiceId, HealthCheckResult],
+    ) -> None:
+        self._services = {service.id: service for service in services}
+        self._latest = {
+            sid: check for sid, check in latest_checks.items() if sid in self._services
+        }
+        self._retired = set()
+        self._version += 1
+        self._notify(None)
+
+    def record(self, service: Service, result: HealthCheckResult) -> None:
+        """
+        Store the latest result for a service (called after each check).
+        Ignored for a service that was disabled meanwhile.
+        """
+        if service.id in self._retired:
+            return
+        previous = self._latest.get(service.id)
+        self._services[service.id] = service
+        self._latest[service.id] = result
+        self._version += 1
+        self._notify(service.id, previous is None or _row_key(previous) != _row_key(result))
+
+    def upsert_service(self, service: Service) -> None:
+        """
+        Reflect a created/updated service; disabled services drop out of the snapshot.
+        """
+        self._apply(service)
+        self._version += 1
+        self._notify(service.id)
+
+    def upsert_services(self, services: Iterable[Service]) -> None:
+        """
+        upsert_service for a batch, with one version bump and a single
+        "everything may have changed" notification instead of one per service.
+        """
+        for service in services:
+            self._apply(service)
+        self._version += 1
+        self._notify(None)
+
+    def is_retired(self, service_id: ServiceId) -> bool:
+        return service_id in self._retired
+
+    def service_ids(self) -> List[ServiceId]:
+        return list(self._services.keys() | self._latest.keys())
+
+    def remove(self, service_id: ServiceId) -> None:
+        """
+        Drop a service disabled or deleted elsewhere (e.g. through another worker).
+        """
+        self._retired.add(service_id)
+        service = self._services.pop(service_id, None)
+        check = self._latest.pop(service_id, None)
+        if service is None and check is None:
+            return
+        self._version += 1
+        self._notify(service_id)
+
+    def _apply(self, service: Service) -> None:
+        if service.enabled:
+            self._services[service.id] = service
+            self._retired.discard(service.id)
+        else:
+            self._services.pop(service.id, None)
+            self._latest.pop(service.id, None)
+            self._retired.add(service.id)
+
+    def latest(self) -> List[Tuple[Service, HealthCheckResult]]:
+        """
+        (service, latest check) for every enabled service that has been checked,
+        in catalogue order.
+        """
+        latest = self._latest
+        return [
+            (service, latest[sid])
+            for sid, service in list(self._services.items())
+            if sid in latest
+        ]
+
+    def _notify(self, service_id: Optional[ServiceId], changed: bool = True) -> None:
+        for listener in list(self._listeners):
+            listener(service_id, changed)
+
+
+# Process-wide snapshot shared by the scheduler and the read endpoints.
+status_snapshot = StatusSnapshot()
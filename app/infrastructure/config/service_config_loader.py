@@ -4,7 +4,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.domain.model.service import Service
 
@@ -17,6 +17,22 @@ class ServiceConfig:
     expectedVersion: Optional[str]
     environment: Optional[str]
     enabled: bool = True
+    checkIntervalSeconds: Optional[int] = None
+    jitterSeconds: Optional[float] = None
+    probeMode: Optional[str] = None
+
+
+def _schedule_fields(item: Dict[str, Any]) -> Tuple[Optional[int], Optional[float]]:
+    """
+    checkIntervalSeconds / jitterSeconds, checked against the same limits as
+    POST /services (interval >= 1, jitter >= 0).
+    """
+    interval, jitter = item.get("checkIntervalSeconds"), item.get("jitterSeconds")
+    if interval is not None and (isinstance(interval, bool) or not isinstance(interval, int) or interval < 1):
+        raise ValueError(f"service '{item.get('id')}': checkIntervalSeconds must be an integer >= 1, got {interval!r}")
+    if jitter is not None and (isinstance(jitter, bool) or not isinstance(jitter, (int, float)) or not jitter >= 0):
+        raise ValueError(f"service '{item.get('id')}': jitterSeconds must be a number >= 0, got {jitter!r}")
+    return interval, jitter
 
 
 class ServiceConfigLoader:
@@ -33,20 +49,34 @@ class ServiceConfigLoader:
             # No config file: return empty list instead of crashing.
             return []
 
-        with self._path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        return self.parse(self._path.read_bytes())
 
+    @staticmethod
+    def parse(raw: bytes, require_services: bool = False) -> List[Service]:
+        """
+        Convert the contents of a services.json file into Service entities.
+        With `require_services`, a document without a "services" list is an
+        error rather than an empty catalogue. Out-of-range schedule fields
+        raise ValueError.
+        """
+        data = json.loads(raw)
+        if require_services and not (isinstance(data, dict) and isinstance(data.get("services"), list)):
+            raise ValueError('expected an object with a "services" list')
         services_data = data.get("services", [])
         services: List[Service] = []
 
-        for raw in services_data:
+        for item in services_data:
+            interval, jitter = _schedule_fields(item)
             cfg = ServiceConfig(
-                id=raw["id"],
-                name=raw["name"],
-                url=raw["url"],
-                expectedVersion=raw.get("expectedVersion"),
-                environment=raw.get("environment"),
-                enabled=raw.get("enabled", True),
+                id=item["id"],
+                name=item["name"],
+                url=item["url"],
+                expectedVersion=item.get("expectedVersion"),
+                environment=item.get("environment"),
+                enabled=item.get("enabled", True),
+                checkIntervalSeconds=interval,
+                jitterSeconds=jitter,
+                probeMode=item.get("probeMode"),
             )
 
             service = Service.from_primitives(
@@ -56,6 +86,9 @@ class ServiceConfigLoader:
                 expected_version=cfg.expectedVersion,
                 environment=cfg.environment,
                 enabled=cfg.enabled,
+                check_interval_seconds=cfg.checkIntervalSeconds,
+                jitter_seconds=cfg.jitterSeconds,
+                probe_mode=cfg.probeMode,
             )
             services.append(service)
 
@@ -0,0 +1,90 @@
+# app/infrastructure/config/service_config_watcher.py
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from app.domain.model.service import Service
+from app.infrastructure.config.service_config_loader import ServiceConfigLoader
+
+
+class ServiceConfigUnavailableError(RuntimeError):
+    """
+    The services config file can't be used as a catalogue right now
+    (missing, empty, half-written or malformed).
+    """
+
+
+class ServiceConfigWatcher:
+    """
+    Detects edits to the services config file cheaply:
+    - poll() stats the file; if mtime and size are unchanged it returns None
+      without reading it (the common case),
+    - a new mtime/size is only acted on once it has stayed the same for a
+      whole poll interval, so a file an editor is still writing is not read
+      half-saved,
+    - it then reads the file and compares a SHA-256 of the contents, so
+      a touch or a save without edits is also a no-op,
+    - only a real content change is parsed and returned as Service entities.
+    A missing, empty or unparsable file, or one without a "services" list,
+    raises ServiceConfigUnavailableError (once per change of the file) and
+    the caller keeps its current services; only an explicit
+    {"services": []} means "no services". Such a file's hash is not
+    remembered, so the next edit is picked up.
+    poll() does blocking file I/O: call it off the event loop.
+    """
+
+    def __init__(self, config_path: str) -> None:
+        self._path = Path(config_path)
+        self._stat: Optional[Tuple[int, int]] = None  # (mtime_ns, size) last acted on; (0, 0) = missing
+        self._settling: Optional[Tuple[int, int]] = None  # new (mtime_ns, size) seen on the previous poll
+        self._digest: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        return str(self._path)
+
+    @property
+    def digest(self) -> Optional[str]:
+        return self._digest
+
+    def forget(self) -> None:
+        """
+        Make the next poll() re-read and return the file (e.g. applying it failed).
+        """
+        self._stat = None
+        self._settling = None
+        self._digest = None
+
+    def poll(self) -> Optional[List[Service]]:
+        try:
+            st = os.stat(self._path)
+            stat = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stat = (0, 0)
+        if stat == self._stat:
+            self._settling = None
+            return None
+        if stat != self._settling and self._stat is not None:
+            # Changed since the last poll: wait until it stops changing
+            self._settling = stat
+            return None
+        self._settling = None
+        self._stat = stat
+
+        if stat == (0, 0):
+            raise ServiceConfigUnavailableError(f"{self._path} is missing")
+        raw = self._path.read_bytes()
+        if not raw.strip():
+            raise ServiceConfigUnavailableError(f"{self._path} is empty")
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest == self._digest:
+            return None
+        try:
+            services = ServiceConfigLoader.parse(raw, require_services=True)
+        except Exception as exc:  # noqa: BLE001
+            raise ServiceConfigUnavailableError(f"{self._path} could not be parsed: {exc!r}") from exc
+        self._digest = digest
+        return services
@@ -0,0 +1,101 @@
+# app/infrastructure/db/alert_outbox_repository.py
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models import AlertOutboxORM
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    id: int
+    payload: Dict[str, Any]
+    attempts: int
+
+
+class SQLiteAlertOutboxRepository:
+    """
+    Durable queue of alert webhook deliveries (the alert_outbox table).
+    """
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def add_many(self, payloads: Iterable[Dict[str, Any]], now: datetime) -> int:
+        rows = [
+            {
+                "service_id": str(payload.get("serviceId", "")),
+                "created_at": now,
+                "payload": json.dumps(payload),
+                "attempts": 0,
+                "next_attempt_at": now,
+                "dead": False,
+            }
+            for payload in payloads
+        ]
+        if rows:
+            self._db.execute(insert(AlertOutboxORM), rows)
+            self._db.commit()
+        return len(rows)
+
+    def claim_due(self, now: datetime, limit: int, claimed_until: datetime) -> List[OutboxEntry]:
+        """
+        Take up to `limit` due rows for delivery by pushing their next attempt
+        to `claimed_until`, so another worker's dispatcher won't send them too.
+        A delivery that never reports back (crash) is retried after that.
+        """
+        ids = self._db.execute(
+            select(AlertOutboxORM.id)
+            .where(AlertOutboxORM.dead == False, AlertOutboxORM.next_attempt_at <= now)  # noqa: E712
+            .order_by(AlertOutboxORM.next_attempt_at, AlertOutboxORM.id)
+            .limit(limit)
+        ).scalars().all()
+        if not ids:
+            return []
+        # Re-check the condition: rows claimed by someone else in between are skipped
+        rows = self._db.execute(
+            update(AlertOutboxORM)
+            .where(AlertOutboxORM.id.in_(ids), AlertOutboxORM.dead == False, AlertOutboxORM.next_attempt_at <= now)  # noqa: E712
+            .values(next_attempt_at=claimed_until)
+            .returning(AlertOutboxORM.id, AlertOutboxORM.payload, AlertOutboxORM.attempts)
+        ).all()
+        self._db.commit()
+        return sorted(
+            (OutboxEntry(id=row.id, payload=json.loads(row.payload), attempts=row.attempts) for row in rows),
+            key=lambda entry: entry.id,
+        )
+
+    def delete(self, ids: Iterable[int]) -> None:
+        self._db.execute(delete(AlertOutboxORM).where(AlertOutboxORM.id.in_(list(ids))))
+        self._db.commit()
+
+    def record_failure(self, entries: Iterable[OutboxEntry], error: str, retry_at: Dict[int, Optional[datetime]]) -> None:
+        """
+        Count a failed attempt for each entry and reschedule it at retry_at[id];
+        None means it is out of attempts and becomes dead.
+        """
+        for entry in entries:
+            next_at = retry_at.get(entry.id)
+            values: Dict[str, Any] = {"attempts": entry.attempts + 1, "last_error": error[:500]}
+            if next_at is None:
+                values["dead"] = True
+            else:
+                values["next_attempt_at"] = next_at
+            self._db.execute(update(AlertOutboxORM).where(AlertOutboxORM.id == entry.id).values(**values))
+        self._db.commit()
+
+    def pending_summary(self) -> Dict[str, Any]:
+        """
+        Live row count and the earliest next attempt (None if nothing is pending).
+        """
+        count, next_at = self._db.execute(
+            select(func.count(), func.min(AlertOutboxORM.next_attempt_at))
+            .where(AlertOutboxORM.dead == False)  # noqa: E712
+        ).one()
+        return {"pending": count, "nextAttemptAt": next_at}
@@ -1,19 +1,115 @@
 # app/infrastructure/db/base.py
-from sqlalchemy import create_engine
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Generator, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from config.settings import settings
-from typing import Generator
 
-# For SQLite, check_same_thread=False is needed for use in async context with FastAPI
-engine = create_engine(
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """
+    PRAGMAs applied to every new SQLite connection.
+    journal_mode is persistent in the database file; the others are per connection,
+    which is why they are set on connect rather than once at startup.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5_000
+    cache_size_kib: int = 65_536
+    mmap_size_bytes: int = 268_435_456
+    temp_store: str = "MEMORY"
+
+    @classmethod
+    def from_settings(cls) -> Optional["SQLiteProfile"]:
+        if not settings.sqlite_tuned:
+            return None
+        return cls(
+            journal_mode=settings.sqlite_journal_mode,
+            synchronous=settings.sqlite_synchronous,
+            busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+            cache_size_kib=settings.sqlite_cache_size_kib,
+            mmap_size_bytes=settings.sqlite_mmap_size_bytes,
+            temp_store=settings.sqlite_temp_store,
+        )
+
+    def pragmas(self, in_memory: bool = False) -> Dict[str, Any]:
+        pragmas: Dict[str, Any] = {
+            "synchronous": self.synchronous,
+            "busy_timeout": self.busy_timeout_ms,
+            "cache_size": -self.cache_size_kib,  # negative = KiB rather than pages
+            "temp_store": self.temp_store,
+        }
+        if not in_memory:
+            # WAL and mmap only make sense for a file-backed database
+            pragmas = {"journal_mode": self.journal_mode, "mmap_size": self.mmap_size_bytes, **pragmas}
+        return pragmas
+
+
+def _is_in_memory(db_url: str) -> bool:
+    return db_url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in db_url
+
+
+def create_db_engine(db_url: str, profile: Optional[SQLiteProfile] = None, **pool_kwargs: Any) -> Engine:
+    """
+    Build an engine for `db_url`. For SQLite, `profile` (if given) is applied on
+    every new pooled connection.
+    """
+    if not db_url.startswith("sqlite"):
+        return create_engine(db_url, **pool_kwargs)
+
+    in_memory = _is_in_memory(db_url)
+    # check_same_thread=False: connections are used from the DB thread pool
+    new_engine = create_engine(
+        db_url,
+        connect_args={"check_same_thread": False},
+        **({} if in_memory else pool_kwargs),
+    )
+    if profile is not None:
+        pragmas = profile.pragmas(in_memory=in_memory)
+
+        @event.listens_for(new_engine, "connect")
+        def _apply_profile(dbapi_connection, connection_record):  # noqa: ANN001
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name} = {value}")
+            finally:
+                cursor.close()
+
+    return new_engine
+
+
+engine = create_db_engine(
     settings.db_url,
-    connect_args={"check_same_thread": False} if settings.db_url.startswith("sqlite") else {},
+    profile=SQLiteProfile.from_settings(),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout_seconds,
+    pool_pre_ping=settings.db_pool_pre_ping,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+def begin_locked(conn: Connection, mode: str = "IMMEDIATE") -> None:
+    """
+    Start the transaction on `conn` with SQLite's write lock (IMMEDIATE) or an
+    exclusive lock taken up front. pysqlite otherwise only issues BEGIN at the
+    first INSERT/UPDATE/DELETE, so reads made before it see data another
+    connection may change before our writes. Waits up to busy_timeout for the
+    lock. No-op on other databases.
+    """
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql(f"BEGIN {mode}")
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     FastAPI dependency that provides a SQLAlchemy session and ensures it's closed
@@ -23,4 +119,4 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1,57 @@
+# app/infrastructure/db/db_executor.py
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.base import SessionLocal
+from config.settings import settings
+
+T = TypeVar("T")
+
+# Dedicated pool for blocking SQLAlchemy/SQLite calls, so a slow query or commit
+# never runs on the event loop and doesn't compete with the default executor.
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.db_thread_pool_size,
+            thread_name_prefix="db",
+        )
+    return _executor
+
+
+async def run_in_db_thread(fn: Callable[[], T]) -> T:
+    return await asyncio.get_running_loop().run_in_executor(get_db_executor(), fn)
+
+
+async def run_with_session(
+    fn: Callable[[Session], T],
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> T:
+    """
+    Run `fn(session)` on the DB thread pool with a fresh session that is
+    closed afterwards.
+    """
+
+    def work() -> T:
+        db = session_factory()
+        try:
+            return fn(db)
+        finally:
+            db.close()
+
+    return await run_in_db_thread(work)
+
+
+def shutdown_db_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
@@ -0,0 +1,217 @@
+# app/infrastructure/db/health_check_compactor.py
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, DefaultDict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.domain.model.health_check import HistoryResolution
+from app.infrastructure.db.base import SessionLocal, begin_locked
+from app.infrastructure.db.models import HealthCheckHourRollupORM, HealthCheckMinuteRollupORM, HealthCheckORM
+from app.infrastructure.db.rollups import RollupAccumulator, floor_to, upsert_rollups
+
+# Bulk deletes by key; nothing in the session needs updating
+_NO_SYNC = {"synchronize_session": False}
+
+
+@dataclass(frozen=True)
+class CompactionStep:
+    """
+    One unit of compaction work for one service; run it in batches until it
+    returns fewer rows than the batch size.
+    - "raw":    fold health_checks older than `cutoff` into 1-minute rollups
+    - "minute": fold 1-minute rollups older than `cutoff` into 1-hour rollups
+    - "hour":   delete 1-hour rollups older than `cutoff`
+    """
+    stage: str
+    service_id: str
+    cutoff: datetime
+
+
+@dataclass
+class CompactionStats:
+    raw_rows_folded: int = 0
+    minute_rows_folded: int = 0
+    hour_rows_deleted: int = 0
+    batches: int = 0
+    max_batch_ms: float = 0.0
+
+    def record(self, step: CompactionStep, rows: int, elapsed_ms: float) -> None:
+        if step.stage == "raw":
+            self.raw_rows_folded += rows
+        elif step.stage == "minute":
+            self.minute_rows_folded += rows
+        else:
+            self.hour_rows_deleted += rows
+        self.batches += 1
+        self.max_batch_ms = max(self.max_batch_ms, elapsed_ms)
+
+
+class HealthCheckCompactor:
+    """
+    Retention for health check history:
+    - raw rows are kept for `raw_retention`, then folded into 1-minute rollups,
+    - 1-minute rollups are kept for `minute_retention`, then folded into 1-hour rollups,
+    - 1-hour rollups are deleted after `hour_retention` (None = keep forever).
+    Every batch is one short transaction touching at most `batch_size` source
+    rows of one service (found via the (service_id, timestamp) index and the
+    rollup primary keys), so the write lock is never held for long. The lock
+    is taken before the batch reads its source rows, so compactions running
+    in several workers at once never fold the same rows twice.
+    A service's newest raw check is never folded: /health and the failure
+    streaks rebuilt at startup read it.
+    """
+
+    def __init__(
+        self,
+        raw_retention: timedelta,
+        minute_retention: timedelta,
+        hour_retention: Optional[timedelta],
+        batch_size: int = 2_000,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self._raw_retention = raw_retention
+        # Rollups can't be dropped before the data they summarise has left the finer tier
+        self._minute_retention = max(minute_retention, raw_retention)
+        self._hour_retention = None if hour_retention is None else max(hour_retention, self._minute_retention)
+        self._batch_size = max(1, batch_size)
+        self._session_factory = session_factory
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def plan(self, now: datetime) -> List[CompactionStep]:
+        """
+        The steps that may have work to do, in the order they should run
+        (raw first, so its output can be rolled up further in the same pass).
+        """
+        raw_cutoff = floor_to(HistoryResolution.MINUTE, now - self._raw_retention)
+        minute_cutoff = floor_to(HistoryResolution.HOUR, now - self._minute_retention)
+        db = self._session_factory()
+        try:
+            raw_ids = self._service_ids(db, HealthCheckORM.service_id)
+            minute_ids = self._service_ids(db, HealthCheckMinuteRollupORM.service_id) | raw_ids
+            hour_ids = self._service_ids(db, HealthCheckHourRollupORM.service_id) | minute_ids
+        finally:
+            db.close()
+
+        steps = [CompactionStep("raw", sid, raw_cutoff) for sid in sorted(raw_ids)]
+        steps += [CompactionStep("minute", sid, minute_cutoff) for sid in sorted(minute_ids)]
+        if self._hour_retention is not None:
+            hour_cutoff = floor_to(HistoryResolution.HOUR, now - self._hour_retention)
+            steps += [CompactionStep("hour", sid, hour_cutoff) for sid in sorted(hour_ids)]
+        return steps
+
+    def run_batch(self, step: CompactionStep) -> int:
+        """
+        Process at most batch_size source rows of `step` in one transaction.
+        Returns the number of source rows removed.
+        """
+        db = self._session_factory()
+        try:
+            begin_locked(db.connection())
+            if step.stage == "raw":
+                rows = self._fold_raw(db, step)
+            elif step.stage == "minute":
+                rows = self._fold_minutes(db, step)
+            else:
+                rows = self._delete_hours(db, step)
+            db.commit()
+            return rows
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def compact(self, now: Optional[datetime] = None) -> CompactionStats:
+        """
+        Run every step to completion (synchronously, e.g. from a script).
+        """
+        stats = CompactionStats()
+        for step in self.plan(now or datetime.utcnow()):
+            while True:
+                started = datetime.utcnow()
+                rows = self.run_batch(step)
+                stats.record(step, rows, (datetime.utcnow() - started).total_seconds() * 1000)
+                if rows < self._batch_size:
+                    break
+        return stats
+
+    def _fold_raw(self, db: Session, step: CompactionStep) -> int:
+        h = HealthCheckORM
+        newest_id = (
+            select(h.id)
+            .where(h.service_id == step.service_id)
+            .order_by(h.timestamp.desc(), h.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        rows = db.execute(
+            select(h.id, h.timestamp, h.status, h.latency_ms, h.version)
+            .where(h.service_id == step.service_id, h.timestamp < step.cutoff, h.id != newest_id)
+            .order_by(h.timestamp, h.id)
+            .limit(self._batch_size)
+        ).all()
+        if not rows:
+            return 0
+
+        buckets: DefaultDict[Tuple[str, datetime], RollupAccumulator] = defaultdict(RollupAccumulator)
+        for row in rows:
+            buckets[(step.service_id, floor_to(HistoryResolution.MINUTE, row.timestamp))].add_check(
+                row.status, row.latency_ms, row.version
+            )
+        upsert_rollups(db, HistoryResolution.MINUTE, buckets.items())
+        db.execute(delete(h).where(h.id.in_([row.id for row in rows])), execution_options=_NO_SYNC)
+        return len(rows)
+
+    def _fold_minutes(self, db: Session, step: CompactionStep) -> int:
+        m = HealthCheckMinuteRollupORM
+        rows = db.execute(
+            select(
+                m.bucket_start, m.count, m.up_count, m.latency_samples,
+                m.latency_sum_ms, m.latency_min_ms, m.latency_max_ms, m.last_version,
+            )
+            .where(m.service_id == step.service_id, m.bucket_start < step.cutoff)
+            .order_by(m.bucket_start)
+            .limit(self._batch_size)
+        ).all()
+        if not rows:
+            return 0
+
+        buckets: DefaultDict[Tuple[str, datetime], RollupAccumulator] = defaultdict(RollupAccumulator)
+        for row in rows:
+            buckets[(step.service_id, floor_to(HistoryResolution.HOUR, row.bucket_start))].add_rollup(row)
+        last_bucket = rows[-1].bucket_start
+        upsert_rollups(db, HistoryResolution.HOUR, buckets.items())
+        # (service_id, bucket_start) is unique, so this deletes exactly the rows read above
+        db.execute(
+            delete(m).where(m.service_id == step.service_id, m.bucket_start <= last_bucket),
+            execution_options=_NO_SYNC,
+        )
+        return len(rows)
+
+    def _delete_hours(self, db: Session, step: CompactionStep) -> int:
+        h = HealthCheckHourRollupORM
+        buckets = db.scalars(
+            select(h.bucket_start)
+            .where(h.service_id == step.service_id, h.bucket_start < step.cutoff)
+            .order_by(h.bucket_start)
+            .limit(self._batch_size)
+        ).all()
+        if not buckets:
+            return 0
+        db.execute(
+            delete(h).where(h.service_id == step.service_id, h.bucket_start <= buckets[-1]),
+            execution_options=_NO_SYNC,
+        )
+        return len(buckets)
+
+    @staticmethod
+    def _service_ids(db: Session, column) -> Set[str]:  # noqa: ANN001
+        return set(db.scalars(select(column).distinct()))
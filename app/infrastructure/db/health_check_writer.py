@@ -0,0 +1,164 @@
+# app/infrastructure/db/health_check_writer.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.domain.model.health_check import HealthCheckResult
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.db.db_executor import run_in_db_thread
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+from app.infrastructure.metrics.app_metrics import health_check_writes_dropped_total
+
+logger = logging.getLogger(__name__)
+
+
+class HealthCheckWriter:
+    """
+    Write-behind buffer for health check results.
+    - put() enqueues a result; it blocks when the queue is full (backpressure).
+    - A background task flushes every `flush_interval_ms`, or earlier once
+      `max_batch_size` results are waiting.
+    - flush() can also be called explicitly (e.g. at the end of a cycle).
+    Each flush is one multi-row insert in one transaction, run on the DB
+    thread pool so the commit doesn't block the event loop.
+    A batch whose write fails (e.g. "database is locked") goes back to the
+    front of the queue and is retried after a backoff that doubles from
+    `retry_base_seconds` up to `retry_max_seconds`; after `max_attempts`
+    failed writes its rows are dropped and counted in `dropped`. The
+    backoff is waited out by the background task, not inside flush(), and
+    stop() doesn't wait for it: each remaining batch gets one last attempt.
+    `on_written` is called (on the event loop) with each batch once it is
+    committed, e.g. to invalidate cached reads; `on_committed` with the
+    batch's row count and how long the write took (DB thread pool wait included).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_queue_size: int = 10_000,
+        flush_interval_ms: int = 1_000,
+        max_batch_size: int = 1_000,
+        on_written: Optional[Callable[[List[HealthCheckResult]], None]] = None,
+        on_committed: Optional[Callable[[int, float], None]] = None,
+        max_attempts: int = 6,
+        retry_base_seconds: float = 0.5,
+        retry_max_seconds: float = 10.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue[HealthCheckResult] = asyncio.Queue(maxsize=max_queue_size)
+        self._flush_interval = flush_interval_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._on_written = on_written
+        self._on_committed = on_committed
+        self._max_attempts = max(1, max_attempts)
+        self._retry_base = retry_base_seconds
+        self._retry_max = retry_max_seconds
+        # A batch whose write failed; it goes out again before anything queued after it
+        self._retry: List[HealthCheckResult] = []
+        self._retry_at = 0.0  # monotonic time the retry batch may go out again
+        self._attempts = 0
+        self.dropped = 0
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the background task and write whatever is still queued.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def put(self, result: HealthCheckResult) -> None:
+        await self._queue.put(result)
+        if self._queue.qsize() >= self._max_batch_size:
+            self._wake.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._retry) + self._queue.qsize()
+
+    async def flush(self) -> int:
+        """
+        Write everything currently queued. Returns the number of rows written.
+        While a failed batch is backing off this returns early (nothing may
+        overtake it); once stopping, a batch that fails is dropped at once.
+        """
+        written = 0
+        async with self._flush_lock:
+            while self._retry or not self._queue.empty():
+                if self._retry and not self._stopping and time.monotonic() < self._retry_at:
+                    break
+                batch = self._drain(self._max_batch_size)
+                started = time.perf_counter()
+                try:
+                    await run_in_db_thread(partial(self._write, batch))
+                except Exception as exc:  # noqa: BLE001
+                    self._attempts += 1
+                    if self._stopping or self._attempts >= self._max_attempts:
+                        logger.exception(
+                            "Dropping %s health check results after %s failed writes%s: %s",
+                            len(batch), self._attempts, " (stopping)" if self._stopping else "", exc,
+                        )
+                        self._attempts = 0
+                        self.dropped += len(batch)
+                        health_check_writes_dropped_total.inc(len(batch))
+                        continue
+                    delay = min(self._retry_max, self._retry_base * 2 ** (self._attempts - 1))
+                    logger.warning(
+                        "Failed to write %s health check results (attempt %s of %s), retrying in %.1fs: %s",
+                        len(batch), self._attempts, self._max_attempts, delay, exc,
+                    )
+                    self._retry = batch
+                    self._retry_at = time.monotonic() + delay
+                    break
+                self._attempts = 0
+                written += len(batch)
+                if self._on_committed is not None:
+                    self._on_committed(len(batch), time.perf_counter() - started)
+                if self._on_written is not None:
+                    self._on_written(batch)
+        return written
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            timeout = self._flush_interval
+            if self._retry:
+                timeout = min(timeout, max(0.0, self._retry_at - time.monotonic()))
+            waiter = asyncio.ensure_future(self._wake.wait())
+            await asyncio.wait({waiter}, timeout=timeout)
+            waiter.cancel()
+            self._wake.clear()
+            await self.flush()
+
+    def _drain(self, limit: int) -> List[HealthCheckResult]:
+        if self._retry:
+            batch, self._retry = self._retry, []
+            return batch
+        batch: List[HealthCheckResult] = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    def _write(self, batch: List[HealthCheckResult]) -> None:
+        db = self._session_factory()
+        try:
+            SQLiteHealthCheckRepository(db).save_many(batch)
+        finally:
+            db.close()
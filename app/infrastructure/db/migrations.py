@@ -0,0 +1,136 @@
+# app/infrastructure/db/migrations.py
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+from app.infrastructure.db.base import Base, begin_locked
+from app.infrastructure.db import models  # noqa: F401  (registers tables on Base.metadata)
+from app.infrastructure.db.models import (
+    AlertOutboxORM,
+    HealthCheckHourRollupORM,
+    HealthCheckMinuteRollupORM,
+    SchedulerLeaseORM,
+    SchedulerWorkerORM,
+    SchemaMigrationORM,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+def _add_column_if_missing(conn: Connection, table: str, column: str, ddl_type: str) -> None:
+    columns = {c["name"] for c in inspect(conn).get_columns(table)}
+    if column not in columns:
+        conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}")
+
+
+def _add_health_check_connect_ms(conn: Connection) -> None:
+    _add_column_if_missing(conn, "health_checks", "connect_ms", "INTEGER")
+
+
+def _add_health_check_service_timestamp_index(conn: Connection) -> None:
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_health_checks_service_id_timestamp "
+        "ON health_checks (service_id, timestamp DESC)"
+    )
+    # Superseded: service_id is a prefix of the composite index, id is the primary key.
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_health_checks_service_id")
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_health_checks_id")
+
+
+def _add_service_schedule_columns(conn: Connection) -> None:
+    _add_column_if_missing(conn, "services", "check_interval_seconds", "INTEGER")
+    _add_column_if_missing(conn, "services", "jitter_seconds", "FLOAT")
+
+
+def _create_health_check_rollup_tables(conn: Connection) -> None:
+    HealthCheckMinuteRollupORM.__table__.create(bind=conn, checkfirst=True)
+    HealthCheckHourRollupORM.__table__.create(bind=conn, checkfirst=True)
+
+
+def _create_alert_outbox_table(conn: Connection) -> None:
+    AlertOutboxORM.__table__.create(bind=conn, checkfirst=True)
+
+
+def _create_scheduler_lease_tables(conn: Connection) -> None:
+    SchedulerWorkerORM.__table__.create(bind=conn, checkfirst=True)
+    SchedulerLeaseORM.__table__.create(bind=conn, checkfirst=True)
+
+
+def _add_health_check_breaker_state(conn: Connection) -> None:
+    _add_column_if_missing(conn, "health_checks", "breaker_state", "VARCHAR")
+
+
+def _add_service_probe_mode(conn: Connection) -> None:
+    _add_column_if_missing(conn, "services", "probe_mode", "VARCHAR")
+
+
+# Ordered list of schema changes. Append new migrations at the end; never edit applied ones.
+MIGRATIONS: List[Migration] = [
+    Migration(1, "add health_checks.connect_ms", _add_health_check_connect_ms),
+    Migration(2, "index health_checks (service_id, timestamp desc)", _add_health_check_service_timestamp_index),
+    Migration(3, "add services.check_interval_seconds/jitter_seconds", _add_service_schedule_columns),
+    Migration(4, "create health_check_rollups_1m/1h tables", _create_health_check_rollup_tables),
+    Migration(5, "create alert_outbox table", _create_alert_outbox_table),
+    Migration(6, "create scheduler_workers/scheduler_leases tables", _create_scheduler_lease_tables),
+    Migration(7, "add health_checks.breaker_state", _add_health_check_breaker_state),
+    Migration(8, "add services.probe_mode", _add_service_probe_mode),
+]
+
+
+def _already_applied(exc: OperationalError) -> bool:
+    # What re-running a migration another process already applied looks like
+    message = str(exc.orig).lower()
+    return "duplicate column name" in message or "already exists" in message
+
+
+def run_migrations(engine: Engine) -> None:
+    """
+    Bring the database schema up to date.
+    - Fresh database: create all tables from the ORM models and mark every
+      migration as applied.
+    - Existing database: create any missing tables, then apply pending
+      migrations in order.
+    Everything runs in one transaction that takes SQLite's exclusive lock
+    first, and the applied versions are read only once it is held, so
+    several processes starting at once (uvicorn --workers N) apply each
+    migration once: the others wait, then find nothing to do. A migration
+    failing with "duplicate column" / "already exists" (e.g. applied by a
+    process that wasn't using this lock) counts as applied.
+    """
+    table = SchemaMigrationORM.__table__
+    with engine.connect() as conn:
+        begin_locked(conn, "EXCLUSIVE")
+        fresh = not inspect(conn).has_table("health_checks")
+        Base.metadata.create_all(bind=conn)
+        applied = {row[0] for row in conn.execute(table.select().with_only_columns(table.c.version))}
+        pending = [m for m in MIGRATIONS if m.version not in applied]
+
+        if not fresh:
+            for migration in pending:
+                logger.info("Applying DB migration %s: %s", migration.version, migration.name)
+                try:
+                    migration.apply(conn)
+                except OperationalError as exc:
+                    if not _already_applied(exc):
+                        raise
+                    logger.info("DB migration %s was already applied: %s", migration.version, exc.orig)
+        if pending:
+            conn.execute(
+                table.insert(),
+                [{"version": m.version, "name": m.name, "applied_at": datetime.utcnow()} for m in pending],
+            )
+        conn.commit()
@@ -1,5 +1,5 @@
 # app/infrastructure/db/models.py
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Index, Text
 from app.infrastructure.db.base import Base
 
 class ServiceORM(Base):
@@ -11,16 +11,108 @@ class ServiceORM(Base):
     expected_version = Column(String, nullable=True)
     environment = Column(String, nullable=True)
     enabled = Column(Boolean, default=True)
+    check_interval_seconds = Column(Integer, nullable=True)
+    jitter_seconds = Column(Float, nullable=True)
+    probe_mode = Column(String, nullable=True)  # NULL = "get"
 
 
 class HealthCheckORM(Base):
     __tablename__ = "health_checks"
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    service_id = Column(String, nullable=False, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    service_id = Column(String, nullable=False)
     timestamp = Column(DateTime, nullable=False)
     status = Column(String, nullable=False)
     latency_ms = Column(Integer, nullable=True)
     version = Column(String, nullable=True)
     version_matches_expected = Column(Boolean, nullable=True)
     error_message = Column(String, nullable=True)
+    connect_ms = Column(Integer, nullable=True)
+    breaker_state = Column(String, nullable=True)  # probe circuit breaker transition caused by this check
+
+
+# Every read path filters by service and sorts by newest first; this index serves
+# both without a sort step (and also covers plain service_id lookups).
+Index(
+    "ix_health_checks_service_id_timestamp",
+    HealthCheckORM.service_id,
+    HealthCheckORM.timestamp.desc(),
+)
+
+
+class HealthCheckRollupMixin:
+    """
+    Aggregate of the health checks of one service in one time bucket.
+    Sums (not averages) are stored so buckets can be merged and re-rolled.
+    """
+    service_id = Column(String, primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    count = Column(Integer, nullable=False)
+    up_count = Column(Integer, nullable=False)
+    latency_samples = Column(Integer, nullable=False)  # checks that had a latency
+    latency_sum_ms = Column(Integer, nullable=False)
+    latency_min_ms = Column(Integer, nullable=True)
+    latency_max_ms = Column(Integer, nullable=True)
+    last_version = Column(String, nullable=True)
+
+
+class HealthCheckMinuteRollupORM(HealthCheckRollupMixin, Base):
+    __tablename__ = "health_check_rollups_1m"
+
+
+class HealthCheckHourRollupORM(HealthCheckRollupMixin, Base):
+    __tablename__ = "health_check_rollups_1h"
+
+
+class AlertOutboxORM(Base):
+    """
+    Alert webhook deliveries that have not succeeded yet. Rows are deleted
+    once delivered; `dead` rows ran out of attempts and are kept for inspection.
+    """
+    __tablename__ = "alert_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    service_id = Column(String, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    payload = Column(Text, nullable=False)  # JSON of one alert
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False)
+    last_error = Column(String, nullable=True)
+    dead = Column(Boolean, nullable=False, default=False)
+
+
+# The delivery worker only ever reads live rows that are due, oldest first.
+Index("ix_alert_outbox_dead_next_attempt_at", AlertOutboxORM.dead, AlertOutboxORM.next_attempt_at)
+
+
+class SchedulerWorkerORM(Base):
+    """
+    Scheduler processes that are alive: each one refreshes its heartbeat
+    while it runs and deletes its row on a clean shutdown.
+    """
+    __tablename__ = "scheduler_workers"
+
+    worker_id = Column(String, primary_key=True)
+    started_at = Column(DateTime, nullable=False)
+    heartbeat_at = Column(DateTime, nullable=False)
+
+
+class SchedulerLeaseORM(Base):
+    """
+    Which worker checks the services of each shard, until `expires_at`.
+    A lease is renewed by its owner and can be taken over once it expires.
+    """
+    __tablename__ = "scheduler_leases"
+
+    shard = Column(Integer, primary_key=True)
+    owner = Column(String, nullable=False)
+    acquired_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+
+class SchemaMigrationORM(Base):
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    applied_at = Column(DateTime, nullable=False)
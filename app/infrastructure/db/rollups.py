@@ -0,0 +1,140 @@
+# app/infrastructure/db/rollups.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.domain.model.health_check import HealthCheckBucket, HistoryResolution
+from app.domain.model.value_objects import HealthStatus, ServiceId, Version
+from app.infrastructure.db.models import (
+    HealthCheckHourRollupORM,
+    HealthCheckMinuteRollupORM,
+    HealthCheckRollupMixin,
+)
+
+ROLLUP_TABLES: Dict[HistoryResolution, Type[HealthCheckRollupMixin]] = {
+    HistoryResolution.MINUTE: HealthCheckMinuteRollupORM,
+    HistoryResolution.HOUR: HealthCheckHourRollupORM,
+}
+
+
+def floor_to(resolution: HistoryResolution, ts: datetime) -> datetime:
+    if resolution is HistoryResolution.MINUTE:
+        return ts.replace(second=0, microsecond=0)
+    if resolution is HistoryResolution.HOUR:
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts
+
+
+@dataclass
+class RollupAccumulator:
+    """
+    Mergeable aggregate for one (service, bucket). Raw checks and rollup rows
+    both fold into it, so the same code builds 1m from raw and 1h from 1m.
+    Inputs must be added oldest first (last_version keeps the latest).
+    """
+    count: int = 0
+    up_count: int = 0
+    latency_samples: int = 0
+    latency_sum_ms: int = 0
+    latency_min_ms: Optional[int] = None
+    latency_max_ms: Optional[int] = None
+    last_version: Optional[str] = None
+
+    def add_check(self, status: str, latency_ms: Optional[int], version: Optional[str]) -> None:
+        self.count += 1
+        if status == HealthStatus.UP.value:
+            self.up_count += 1
+        if latency_ms is not None:
+            self._add_latency(1, latency_ms, latency_ms, latency_ms)
+        if version:
+            self.last_version = version
+
+    def add_rollup(self, row: "HealthCheckRollupMixin | RollupAccumulator") -> None:
+        """
+        Fold in an already aggregated bucket (a rollup row or another accumulator)
+        covering later checks than this one.
+        """
+        self.count += row.count
+        self.up_count += row.up_count
+        if row.latency_samples:
+            self._add_latency(row.latency_samples, row.latency_sum_ms, row.latency_min_ms, row.latency_max_ms)
+        if row.last_version:
+            self.last_version = row.last_version
+
+    def _add_latency(self, samples: int, total: int, low: Optional[int], high: Optional[int]) -> None:
+        self.latency_samples += samples
+        self.latency_sum_ms += total
+        if low is not None and (self.latency_min_ms is None or low < self.latency_min_ms):
+            self.latency_min_ms = low
+        if high is not None and (self.latency_max_ms is None or high > self.latency_max_ms):
+            self.latency_max_ms = high
+
+    def to_row(self, service_id: str, bucket_start: datetime) -> Dict[str, Any]:
+        return {
+            "service_id": service_id,
+            "bucket_start": bucket_start,
+            "count": self.count,
+            "up_count": self.up_count,
+            "latency_samples": self.latency_samples,
+            "latency_sum_ms": self.latency_sum_ms,
+            "latency_min_ms": self.latency_min_ms,
+            "latency_max_ms": self.latency_max_ms,
+            "last_version": self.last_version,
+        }
+
+    def to_domain(self, service_id: str, bucket_start: datetime, resolution: HistoryResolution) -> HealthCheckBucket:
+        return HealthCheckBucket(
+            service_id=ServiceId(service_id),
+            bucket_start=bucket_start,
+            resolution=resolution,
+            count=self.count,
+            up_count=self.up_count,
+            latency_min_ms=self.latency_min_ms,
+            latency_avg_ms=round(self.latency_sum_ms / self.latency_samples, 1) if self.latency_samples else None,
+            latency_max_ms=self.latency_max_ms,
+            version=Version(self.last_version) if self.last_version else None,
+        )
+
+
+def upsert_rollups(
+    db: Session,
+    resolution: HistoryResolution,
+    buckets: Iterable[Tuple[Tuple[str, datetime], RollupAccumulator]],
+) -> None:
+    """
+    Insert rollup rows, merging into rows that already exist for the same
+    (service, bucket), e.g. a bucket split across two compaction batches.
+    Does not commit.
+    """
+    rows: List[Dict[str, Any]] = [acc.to_row(sid, start) for (sid, start), acc in buckets]
+    if not rows:
+        return
+    table = ROLLUP_TABLES[resolution].__table__
+    stmt = sqlite_insert(table)
+    new = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.service_id, table.c.bucket_start],
+        set_={
+            "count": table.c.count + new.count,
+            "up_count": table.c.up_count + new.up_count,
+            "latency_samples": table.c.latency_samples + new.latency_samples,
+            "latency_sum_ms": table.c.latency_sum_ms + new.latency_sum_ms,
+            # Two-argument min()/max() are scalar in SQLite, and NULL if either side is
+            "latency_min_ms": func.min(
+                func.coalesce(table.c.latency_min_ms, new.latency_min_ms),
+                func.coalesce(new.latency_min_ms, table.c.latency_min_ms),
+            ),
+            "latency_max_ms": func.max(
+                func.coalesce(table.c.latency_max_ms, new.latency_max_ms),
+                func.coalesce(new.latency_max_ms, table.c.latency_max_ms),
+            ),
+            "last_version": func.coalesce(new.last_version, table.c.last_version),
+        },
+    )
+    db.execute(stmt, rows)
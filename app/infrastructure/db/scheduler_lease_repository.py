@@ -0,0 +1,98 @@
+# app/infrastructure/db/scheduler_lease_repository.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Set
+
+from sqlalchemy import case, delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models import SchedulerLeaseORM, SchedulerWorkerORM
+
+
+class SQLiteSchedulerLeaseRepository:
+    """
+    Worker heartbeats and shard leases (scheduler_workers / scheduler_leases).
+    Every method is one short transaction; SQLite serialises writers, so a
+    claim either sees a lease as free/expired and takes it, or leaves it alone.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def heartbeat(self, worker_id: str, started_at: datetime, now: datetime, alive_since: datetime) -> List[str]:
+        """
+        Record that `worker_id` is alive, forget workers that stopped
+        heart-beating, and return the live workers (sorted).
+        """
+        stmt = sqlite_insert(SchedulerWorkerORM).values(worker_id=worker_id, started_at=started_at, heartbeat_at=now)
+        self._db.execute(stmt.on_conflict_do_update(
+            index_elements=[SchedulerWorkerORM.worker_id],
+            set_={"heartbeat_at": stmt.excluded.heartbeat_at},
+        ))
+        self._db.execute(delete(SchedulerWorkerORM).where(SchedulerWorkerORM.heartbeat_at < alive_since))
+        self._db.commit()
+        return list(self._db.execute(
+            select(SchedulerWorkerORM.worker_id).order_by(SchedulerWorkerORM.worker_id)
+        ).scalars())
+
+    def claim(self, worker_id: str, shards: Iterable[int], now: datetime, expires_at: datetime) -> Set[int]:
+        """
+        Make `worker_id` hold exactly the leases on `shards` that it can get:
+        renew the ones it holds, take free or expired ones, skip shards another
+        worker still holds, and release its leases on shards not in `shards`.
+        Returns the shards it holds now.
+        """
+        wanted = sorted(set(shards))
+        self._db.execute(
+            delete(SchedulerLeaseORM).where(
+                SchedulerLeaseORM.owner == worker_id,
+                SchedulerLeaseORM.shard.not_in(wanted),
+            )
+        )
+        if wanted:
+            stmt = sqlite_insert(SchedulerLeaseORM)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[SchedulerLeaseORM.shard],
+                set_={
+                    "owner": stmt.excluded.owner,
+                    "expires_at": stmt.excluded.expires_at,
+                    # keep acquired_at on a renewal, reset it on a takeover
+                    "acquired_at": case(
+                        (SchedulerLeaseORM.owner == stmt.excluded.owner, SchedulerLeaseORM.acquired_at),
+                        else_=stmt.excluded.acquired_at,
+                    ),
+                },
+                where=(SchedulerLeaseORM.owner == stmt.excluded.owner) | (SchedulerLeaseORM.expires_at < now),
+            )
+            self._db.connection().execute(stmt, [
+                {"shard": shard, "owner": worker_id, "acquired_at": now, "expires_at": expires_at}
+                for shard in wanted
+            ])
+        self._db.commit()
+        return set(self._db.execute(
+            select(SchedulerLeaseORM.shard).where(
+                SchedulerLeaseORM.owner == worker_id,
+                SchedulerLeaseORM.expires_at > now,
+            )
+        ).scalars())
+
+    def retire(self, worker_id: str) -> None:
+        """
+        Clean shutdown: give up every lease and leave the live set at once,
+        so the other workers take over without waiting for expiry.
+        """
+        self._db.execute(delete(SchedulerLeaseORM).where(SchedulerLeaseORM.owner == worker_id))
+        self._db.execute(delete(SchedulerWorkerORM).where(SchedulerWorkerORM.worker_id == worker_id))
+        self._db.commit()
+
+    def owners(self, now: datetime) -> Dict[int, str]:
+        """
+        Current (unexpired) lease holder per shard.
+        """
+        rows = self._db.execute(
+            select(SchedulerLeaseORM.shard, SchedulerLeaseORM.owner).where(SchedulerLeaseORM.expires_at > now)
+        ).all()
+        return {row.shard: row.owner for row in rows}
+
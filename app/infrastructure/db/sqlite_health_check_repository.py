@@ -1,15 +1,36 @@
 # app/infrastructure/db/sqlite_health_check_repository.py
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+import numpy as np
+from sqlalchemy import desc, func, insert, or_, select
+from sqlalchemy.orm import Session, aliased
 
-from app.domain.model.health_check import HealthCheckResult
-from app.domain.model.value_objects import ServiceId, HealthStatus, Version
+from app.domain.model.health_check import HealthCheckBucket, HealthCheckResult, HistoryResolution
+from app.domain.model.health_check_series import HealthCheckSeries
+from app.domain.model.value_objects import BreakerState, ServiceId, HealthStatus, Version
 from app.domain.repository.health_check_repository import HealthCheckRepository
 from app.infrastructure.db.models import HealthCheckORM
+from app.infrastructure.db.rollups import ROLLUP_TABLES, RollupAccumulator, floor_to
+from app.infrastructure.metrics.app_metrics import db_save_seconds
+
+# Children resolved once; observe() runs on the DB threads without locking
+_SAVE_SECONDS = db_save_seconds.labels("save")
+_SAVE_MANY_SECONDS = db_save_seconds.labels("save_many")
+
+# load_series(): epoch ms, UP as 0/1, latency (-1 = none), oldest first.
+# julianday() is days since noon 4714 BC; 2440587.5 of them is the Unix epoch.
+_SERIES_SQL = """
+    SELECT CAST((julianday(timestamp) - 2440587.5) * 86400000 AS INTEGER),
+           status = 'UP',
+           COALESCE(latency_ms, -1)
+    FROM health_checks
+    WHERE service_id = ? AND timestamp >= ? AND timestamp < ?
+    ORDER BY timestamp
+"""
 
 
 class SQLiteHealthCheckRepository(HealthCheckRepository):
@@ -17,17 +38,23 @@ class SQLiteHealthCheckRepository(HealthCheckRepository):
         self._db = db
 
     def save(self, result: HealthCheckResult) -> None:
-        row = HealthCheckORM(
-            service_id=str(result.service_id),
-            timestamp=result.timestamp,
-            status=result.status.value,
-            latency_ms=result.latency_ms,
-            version=result.version.value if result.version else None,
-            version_matches_expected=result.version_matches_expected,
-            error_message=result.error_message,
-        )
+        started = time.perf_counter()
+        row = HealthCheckORM(**self._to_row(result))
         self._db.add(row)
         self._db.commit()
+        _SAVE_SECONDS.observe(time.perf_counter() - started)
+
+    def save_many(self, results: Iterable[HealthCheckResult]) -> None:
+        """
+        Multi-row insert in one transaction (one commit/fsync for the whole batch).
+        """
+        rows = [self._to_row(r) for r in results]
+        if not rows:
+            return
+        started = time.perf_counter()
+        self._db.execute(insert(HealthCheckORM), rows)
+        self._db.commit()
+        _SAVE_MANY_SECONDS.observe(time.perf_counter() - started)
 
     def find_latest_by_service_id(self, service_id: ServiceId) -> Optional[HealthCheckResult]:
         row = (
@@ -42,32 +69,28 @@ class SQLiteHealthCheckRepository(HealthCheckRepository):
 
     def find_latest_for_all_services(self) -> Dict[ServiceId, HealthCheckResult]:
         """
-        Simple but not super-optimised implementation:
-        - For each distinct service_id, fetch the latest row.
-        This is perfectly fine for MVP and small scale.
+        Single round trip: for each distinct service_id, pick the id of its
+        latest row with a correlated ORDER BY/LIMIT 1 subquery, then fetch
+        those rows by primary key.
+        With an index on (service_id, timestamp) every subquery is one index
+        seek, so this stays fast no matter how much history there is
+        (a window function or max-timestamp join has to scan/sort all rows).
         """
-        results: Dict[ServiceId, HealthCheckResult] = {}
-
-        # Get distinct service_ids
-        service_ids = [
-            r[0]
-            for r in self._db.query(HealthCheckORM.service_id)
-            .distinct(HealthCheckORM.service_id)
+        latest = aliased(HealthCheckORM)
+        service_ids = select(HealthCheckORM.service_id).distinct().subquery("service_ids")
+        latest_id = (
+            select(latest.id)
+            .where(latest.service_id == service_ids.c.service_id)
+            .order_by(desc(latest.timestamp))
+            .limit(1)
+            .scalar_subquery()
+        )
+        rows = (
+            self._db.query(HealthCheckORM)
+            .filter(HealthCheckORM.id.in_(select(latest_id).select_from(service_ids)))
             .all()
-        ]
-
-        for sid in service_ids:
-            row = (
-                self._db.query(HealthCheckORM)
-                .filter(HealthCheckORM.service_id == sid)
-                .order_by(desc(HealthCheckORM.timestamp))
-                .first()
-            )
-            if row:
-                domain_result = self._to_domain(row)
-                results[ServiceId(sid)] = domain_result
-
-        return results
+        )
+        return {ServiceId(row.service_id): self._to_domain(row) for row in rows}
 
     def find_recent_by_service_id(self, service_id: ServiceId, limit: int = 20) -> List[HealthCheckResult]:
         rows = (
@@ -79,6 +102,149 @@ class SQLiteHealthCheckRepository(HealthCheckRepository):
         )
         return [self._to_domain(r) for r in rows]
 
+    def find_page_by_service_id(
+        self,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 1_000,
+    ) -> List[HealthCheckResult]:
+        """
+        Seeks straight to `after` on the (service_id, timestamp) index, so
+        page N costs the same as page 1, unlike OFFSET.
+        Ties on timestamp are ordered by id descending: index entries are
+        (timestamp DESC, rowid ASC), and reading them backwards gives exactly
+        that order without a sort step.
+        """
+        h = HealthCheckORM
+        # Plain columns rather than ORM entities: no identity map work per row
+        query = self._db.query(
+            h.id, h.service_id, h.timestamp, h.status, h.latency_ms,
+            h.version, h.version_matches_expected, h.error_message, h.connect_ms, h.breaker_state,
+        )
+        if after is None:
+            query = query.filter(h.service_id == str(service_id), h.timestamp >= start, h.timestamp < end)
+        else:
+            after_timestamp, after_id = after
+            # One lower bound only, so SQLite starts the index range at the cursor
+            # (with two, it may pick `start` and re-walk every earlier page).
+            query = query.filter(
+                h.service_id == str(service_id),
+                h.timestamp >= max(start, after_timestamp),
+                h.timestamp < end,
+                or_(h.timestamp > after_timestamp, h.id < after_id),
+            )
+        rows = query.order_by(h.timestamp, desc(h.id)).limit(limit).all()
+        return [self._to_domain(r) for r in rows]
+
+    def find_history(
+        self,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+        resolution: HistoryResolution,
+    ) -> List[HealthCheckBucket]:
+        """
+        Older data lives only in rollups and recent data only in raw rows, so
+        coarser resolutions read every tier at or below them (oldest tier
+        first) and merge into buckets on the fly.
+        """
+        sid = str(service_id)
+        # Whole buckets: widen the start down to the bucket boundary
+        first_bucket = floor_to(resolution, start)
+        h = HealthCheckORM
+        raw = (
+            self._db.query(h.timestamp, h.status, h.latency_ms, h.version)
+            .filter(h.service_id == sid, h.timestamp >= first_bucket, h.timestamp < end)
+            .order_by(h.timestamp)
+        )
+
+        if resolution is HistoryResolution.RAW:
+            buckets = []
+            for row in raw:
+                acc = RollupAccumulator()
+                acc.add_check(row.status, row.latency_ms, row.version)
+                buckets.append(acc.to_domain(sid, row.timestamp, resolution))
+            return buckets
+
+        merged: Dict[datetime, RollupAccumulator] = {}
+        tiers = [HistoryResolution.HOUR, HistoryResolution.MINUTE]
+        for tier in tiers[tiers.index(resolution):]:
+            table = ROLLUP_TABLES[tier]
+            rows = (
+                self._db.query(table)
+                .filter(
+                    table.service_id == sid,
+                    table.bucket_start >= first_bucket,
+                    table.bucket_start < end,
+                )
+                .order_by(table.bucket_start)
+            )
+            for row in rows:
+                key = floor_to(resolution, row.bucket_start)
+                merged.setdefault(key, RollupAccumulator()).add_rollup(row)
+        for row in raw:
+            key = floor_to(resolution, row.timestamp)
+            merged.setdefault(key, RollupAccumulator()).add_check(row.status, row.latency_ms, row.version)
+
+        return [merged[key].to_domain(sid, key, resolution) for key in sorted(merged)]
+
+    def load_series(self, service_id: ServiceId, start: datetime, end: datetime) -> HealthCheckSeries:
+        """
+        Pull the raw checks in [start, end) as columns: SQLite converts
+        timestamps to epoch ms and status to 0/1, and the rows go straight
+        into one NumPy array (no ORM, Row or domain objects).
+        """
+        sid = str(service_id)
+        conn = self._db.connection()
+        timestamp_type = HealthCheckORM.timestamp.type.dialect_impl(conn.dialect)
+        to_db = timestamp_type.bind_processor(conn.dialect)  # same text format the ORM stores
+        # Plain DBAPI cursor: rows come back as tuples of ints, which NumPy
+        # converts in C; Row objects would cost more than the query itself.
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(_SERIES_SQL, (sid, to_db(start), to_db(end)))
+            columns = np.array(cursor.fetchall(), dtype=np.int64).reshape(-1, 3)
+        finally:
+            cursor.close()
+        latency = columns[:, 2].astype(np.float64)
+        latency[columns[:, 2] < 0] = np.nan
+
+        rolled_up_checks = rolled_up_up_checks = 0
+        for table in ROLLUP_TABLES.values():
+            count, up_count = self._db.execute(
+                select(func.coalesce(func.sum(table.count), 0), func.coalesce(func.sum(table.up_count), 0))
+                .where(table.service_id == sid, table.bucket_start >= start, table.bucket_start < end)
+            ).one()
+            rolled_up_checks += count
+            rolled_up_up_checks += up_count
+
+        return HealthCheckSeries(
+            service_id=service_id,
+            start=start,
+            end=end,
+            timestamps_ms=columns[:, 0],
+            up=columns[:, 1].astype(bool),
+            latency_ms=latency,
+            rolled_up_checks=rolled_up_checks,
+            rolled_up_up_checks=rolled_up_up_checks,
+        )
+
+    @staticmethod
+    def _to_row(result: HealthCheckResult) -> Dict[str, Any]:
+        return {
+            "service_id": str(result.service_id),
+            "timestamp": result.timestamp,
+            "status": result.status.value,
+            "latency_ms": result.latency_ms,
+            "version": result.version.value if result.version else None,
+            "version_matches_expected": result.version_matches_expected,
+            "error_message": result.error_message,
+            "connect_ms": result.connect_ms,
+            "breaker_state": result.breaker_state.value if result.breaker_state else None,
+        }
+
     @staticmethod
     def _to_domain(row: HealthCheckORM) -> HealthCheckResult:
         return HealthCheckResult(
@@ -89,4 +255,7 @@ class SQLiteHealthCheckRepository(HealthCheckRepository):
             version=Version(row.version) if row.version else None,
             version_matches_expected=row.version_matches_expected,
             error_message=row.error_message,
+            connect_ms=row.connect_ms,
+            breaker_state=BreakerState(row.breaker_state) if row.breaker_state else None,
+            id=row.id,
         )
@@ -1,8 +1,9 @@
 # app/infrastructure/db/sqlite_service_repository.py
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.domain.model.service import Service
@@ -10,6 +11,12 @@ from app.domain.model.value_objects import ServiceId
 from app.domain.repository.service_repository import ServiceRepository
 from app.infrastructure.db.models import ServiceORM
 
+# Columns an upsert overwrites on an existing row (everything but the id)
+_UPSERT_COLUMNS = (
+    "name", "url", "expected_version", "environment", "enabled", "check_interval_seconds", "jitter_seconds",
+    "probe_mode",
+)
+
 
 class SQLiteServiceRepository(ServiceRepository):
     def __init__(self, db: Session) -> None:
@@ -30,39 +37,46 @@ class SQLiteServiceRepository(ServiceRepository):
         return self._to_domain(row)
 
     def save(self, service: Service) -> None:
-        existing = (
-            self._db.query(ServiceORM)
-            .filter(ServiceORM.id == str(service.id))
-            .first()
-        )
-        if existing:
-            existing.name = service.name
-            existing.url = service.url
-            existing.expected_version = (
-                service.expected_version.value if service.expected_version else None
-            )
-            existing.environment = service.environment.value
-            existing.enabled = service.enabled
-        else:
-            row = ServiceORM(
-                id=str(service.id),
-                name=service.name,
-                url=service.url,
-                expected_version=service.expected_version.value if service.expected_version else None,
-                environment=service.environment.value,
-                enabled=service.enabled,
-            )
-            self._db.add(row)
-        self._db.commit()
+        self.save_or_update_many([service])
 
     def save_or_update_many(self, services: Iterable[Service]) -> None:
-        for service in services:
-            self.save(service)
+        """
+        Upsert all services in one transaction: a single INSERT ... ON CONFLICT
+        DO UPDATE statement, compiled once and executed for every row
+        (executemany), instead of a SELECT + write + commit per service.
+        If an id appears more than once the last one wins.
+        """
+        rows = list({str(service.id): self._to_row(service) for service in services}.values())
+        if not rows:
+            return
+        stmt = sqlite_insert(ServiceORM)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ServiceORM.id],
+            set_={column: stmt.excluded[column] for column in _UPSERT_COLUMNS},
+        )
+        # Core execution on the session's connection: the ORM bulk path would
+        # re-process every row dict, which costs more than the SQL itself
+        self._db.connection().execute(stmt, rows)
+        self._db.commit()
 
     def list_all(self) -> List[Service]:
         rows = self._db.query(ServiceORM).all()
         return [self._to_domain(row) for row in rows]
 
+    @staticmethod
+    def _to_row(service: Service) -> Dict[str, Any]:
+        return {
+            "id": str(service.id),
+            "name": service.name,
+            "url": service.url,
+            "expected_version": service.expected_version.value if service.expected_version else None,
+            "environment": service.environment.value,
+            "enabled": service.enabled,
+            "check_interval_seconds": service.check_interval_seconds,
+            "jitter_seconds": service.jitter_seconds,
+            "probe_mode": service.probe_mode.value,
+        }
+
     @staticmethod
     def _to_domain(row: ServiceORM) -> Service:
         return Service.from_primitives(
@@ -72,4 +86,7 @@ class SQLiteServiceRepository(ServiceRepository):
             expected_version=row.expected_version,
             environment=row.environment,
             enabled=row.enabled,
+            check_interval_seconds=row.check_interval_seconds,
+            jitter_seconds=row.jitter_seconds,
+            probe_mode=row.probe_mode,
         )
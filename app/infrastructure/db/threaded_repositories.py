@@ -0,0 +1,108 @@
+# app/infrastructure/db/threaded_repositories.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.domain.model.health_check import HealthCheckBucket, HealthCheckResult, HistoryResolution
+from app.domain.model.health_check_series import HealthCheckSeries
+from app.domain.model.service import Service
+from app.domain.model.value_objects import ServiceId
+from app.domain.repository.async_health_check_repository import AsyncHealthCheckRepository
+from app.domain.repository.async_service_repository import AsyncServiceRepository
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.db.db_executor import run_with_session
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository
+
+
+class ThreadedServiceRepository(AsyncServiceRepository):
+    """
+    AsyncServiceRepository that runs SQLiteServiceRepository on the DB thread pool,
+    one short-lived session per call.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal) -> None:
+        self._session_factory = session_factory
+
+    async def find_all_enabled(self) -> List[Service]:
+        return await run_with_session(lambda db: SQLiteServiceRepository(db).find_all_enabled(), self._session_factory)
+
+    async def find_by_id(self, service_id: ServiceId) -> Optional[Service]:
+        return await run_with_session(lambda db: SQLiteServiceRepository(db).find_by_id(service_id), self._session_factory)
+
+    async def save(self, service: Service) -> None:
+        await run_with_session(lambda db: SQLiteServiceRepository(db).save(service), self._session_factory)
+
+    async def save_or_update_many(self, services: Iterable[Service]) -> None:
+        services = list(services)
+        await run_with_session(lambda db: SQLiteServiceRepository(db).save_or_update_many(services), self._session_factory)
+
+    async def list_all(self) -> List[Service]:
+        return await run_with_session(lambda db: SQLiteServiceRepository(db).list_all(), self._session_factory)
+
+
+class ThreadedHealthCheckRepository(AsyncHealthCheckRepository):
+    """
+    AsyncHealthCheckRepository that runs SQLiteHealthCheckRepository on the DB thread pool,
+    one short-lived session per call.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal) -> None:
+        self._session_factory = session_factory
+
+    async def save(self, result: HealthCheckResult) -> None:
+        await run_with_session(lambda db: SQLiteHealthCheckRepository(db).save(result), self._session_factory)
+
+    async def save_many(self, results: Iterable[HealthCheckResult]) -> None:
+        results = list(results)
+        await run_with_session(lambda db: SQLiteHealthCheckRepository(db).save_many(results), self._session_factory)
+
+    async def find_latest_by_service_id(self, service_id: ServiceId) -> Optional[HealthCheckResult]:
+        return await run_with_session(
+            lambda db: SQLiteHealthCheckRepository(db).find_latest_by_service_id(service_id), self._session_factory
+        )
+
+    async def find_latest_for_all_services(self) -> Dict[ServiceId, HealthCheckResult]:
+        return await run_with_session(
+            lambda db: SQLiteHealthCheckRepository(db).find_latest_for_all_services(), self._session_factory
+        )
+
+    async def find_recent_by_service_id(self, service_id: ServiceId, limit: int = 20) -> List[HealthCheckResult]:
+        return await run_with_session(
+            lambda db: SQLiteHealthCheckRepository(db).find_recent_by_service_id(service_id, limit=limit),
+            self._session_factory,
+        )
+
+    async def find_history(
+        self,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+        resolution: HistoryResolution,
+    ) -> List[HealthCheckBucket]:
+        return await run_with_session(
+            lambda db: SQLiteHealthCheckRepository(db).find_history(service_id, start, end, resolution),
+            self._session_factory,
+        )
+
+    async def load_series(self, service_id: ServiceId, start: datetime, end: datetime) -> HealthCheckSeries:
+        return await run_with_session(
+            lambda db: SQLiteHealthCheckRepository(db).load_series(service_id, start, end),
+            self._session_factory,
+        )
+
+    async def find_page_by_service_id(
+        self,
+        service_id: ServiceId,
+        start: datetime,
+        end: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 1_000,
+    ) -> List[HealthCheckResult]:
+        return await run_with_session(
+            lambda db: SQLiteHealthCheckRepository(db).find_page_by_service_id(service_id, start, end, after, limit),
+            self._session_factory,
+        )
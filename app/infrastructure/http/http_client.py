@@ -0,0 +1,65 @@
+# app/infrastructure/http/http_client.py
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+import httpx
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# One pooled client for the whole app; created/closed in the FastAPI startup/shutdown hooks.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """
+    Build an AsyncClient from settings (timeouts, pool limits, keep-alive, HTTP/2).
+    """
+    http2 = settings.http_http2
+    if http2 and not _http2_available():
+        logger.warning("HTTP_HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    return httpx.AsyncClient(
+        timeout=settings.http_timeout_seconds,
+        limits=limits,
+        http2=http2,
+    )
+
+
+def start_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = build_http_client()
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared client, creating it lazily (e.g. for scripts that
+    don't go through the FastAPI startup hook).
+    """
+    return start_http_client()
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
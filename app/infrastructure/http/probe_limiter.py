@@ -0,0 +1,56 @@
+# app/infrastructure/http/probe_limiter.py
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+from urllib.parse import urlsplit
+
+
+class _HostSlots:
+    def __init__(self, limit: int) -> None:
+        self.semaphore = asyncio.Semaphore(limit)
+        self.users = 0  # probes holding or waiting for one of this host's slots
+
+
+class ProbeLimiter:
+    """
+    Bounds how many probes are in flight at once.
+    - A global limit across all services.
+    - An optional per-host limit, so many services behind one host
+      don't all hit it at the same time. A host's semaphore only exists
+      while probes hold or wait for it, so hosts that left the catalogue
+      don't pile up in a long-lived limiter.
+    """
+
+    def __init__(self, max_concurrency: int, max_per_host: int | None = None) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if max_per_host is not None and max_per_host < 1:
+            raise ValueError("max_per_host must be >= 1 (or None for no limit)")
+
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._max_per_host = max_per_host
+        self._per_host: Dict[str, _HostSlots] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        if self._max_per_host is None:
+            async with self._global:
+                yield
+            return
+
+        host = (urlsplit(url).netloc or url).lower()
+        slots = self._per_host.get(host)
+        if slots is None:
+            slots = self._per_host[host] = _HostSlots(self._max_per_host)
+        slots.users += 1
+        try:
+            # Take the host slot first so a busy host doesn't hold global slots while waiting.
+            async with slots.semaphore:
+                async with self._global:
+                    yield
+        finally:
+            slots.users -= 1
+            if slots.users == 0:
+                del self._per_host[host]
@@ -0,0 +1,142 @@
+# app/infrastructure/http/probe_worker.py
+"""
+Probe worker process for ProcessProbePool (see process_probe_pool.py).
+
+Reads batches of check requests from stdin, pings and evaluates each one
+on its own event loop with its own pooled HTTP client, and writes compact
+result tuples back to stdout. Started by the pool as:
+
+    python -m app.infrastructure.http.probe_worker
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+import sys
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from app.domain.model.service import Service
+from app.domain.model.value_objects import Environment, ProbeMode, ServiceId, Version
+from app.domain.services.health_evaluation_service import HealthCheckInput, HealthEvaluationService
+from app.infrastructure.http.http_client import build_http_client
+from app.infrastructure.http.process_probe_pool import read_frame, write_frame
+from app.infrastructure.http.service_pinger import HttpServicePinger
+
+# (request id, service id, url, expected version, probe mode, timeout)
+Request = Tuple[int, str, str, Optional[str], str, Optional[float]]
+
+
+class _ProbeWorker:
+    """
+    Keeps the Service built for each service id while its request fields
+    stay the same. An edited service replaces its entry, and at most
+    `max_services` are kept (least recently checked dropped first), so
+    deleted services don't pile up for the life of the process.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, max_services: int = 10_000) -> None:
+        self._writer = writer
+        self._pinger = HttpServicePinger(build_http_client())
+        self._evaluator = HealthEvaluationService()
+        # service id -> ((url, expected version, probe mode), service)
+        self._services: "OrderedDict[str, Tuple[Tuple[str, Optional[str], str], Service]]" = OrderedDict()
+        self._max_services = max_services
+        self._results: List[tuple] = []
+        self._flush_scheduled = False
+
+    def _service(self, service_id: str, url: str, expected_version: Optional[str], probe_mode: str) -> Service:
+        fields = (url, expected_version, probe_mode)
+        cached = self._services.get(service_id)
+        if cached is not None and cached[0] == fields:
+            self._services.move_to_end(service_id)
+            return cached[1]
+        service = Service(
+            id=ServiceId(service_id),
+            name=service_id,
+            url=url,
+            expected_version=Version(expected_version) if expected_version is not None else None,
+            environment=Environment.UNKNOWN,
+            probe_mode=ProbeMode(probe_mode),
+        )
+        self._services[service_id] = (fields, service)
+        self._services.move_to_end(service_id)
+        if len(self._services) > self._max_services:
+            self._services.popitem(last=False)
+        return service
+
+    async def check(self, request: Request) -> None:
+        request_id, service_id, url, expected_version, probe_mode, timeout = request
+        service = self._service(service_id, url, expected_version, probe_mode)
+        ping = await self._pinger.ping(service, timeout)
+        pinged = time.perf_counter()
+        result = self._evaluator.evaluate(service, HealthCheckInput(
+            http_status_code=ping.http_status_code,
+            latency_ms=ping.latency_ms,
+            reported_version=ping.reported_version,
+            error_message=ping.error_message,
+            connect_ms=ping.connect_ms,
+            tcp_connected=ping.tcp_connected,
+        ))
+        self._results.append((
+            request_id,
+            result.timestamp,
+            result.status.value,
+            result.latency_ms,
+            result.version.value if result.version is not None else None,
+            result.version_matches_expected,
+            result.error_message,
+            result.connect_ms,
+            time.perf_counter() - pinged,
+        ))
+        if not self._flush_scheduled:
+            # Everything that finishes in this loop iteration goes out as one frame
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        results, self._results = self._results, []
+        if results:
+            write_frame(self._writer, results)
+
+
+async def _serve() -> None:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=2 ** 24)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer)
+    transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout.buffer)
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+    # stdout carries frames only; anything printed goes to stderr
+    sys.stdout = sys.stderr
+
+    worker = _ProbeWorker(writer)
+    tasks = set()
+    while True:
+        requests = await read_frame(reader)
+        if requests is None:  # the pool closed our stdin
+            break
+        for request in requests:
+            task = asyncio.create_task(worker.check(request))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await writer.drain()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+        worker._flush()
+    await writer.drain()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+    # Ctrl-C / SIGTERM reach the whole process group; the pool decides when we
+    # stop by closing stdin (which also happens if the parent dies)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# app/infrastructure/http/process_probe_pool.py
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import pickle
+import struct
+import sys
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.service import Service
+from app.domain.model.value_objects import HealthStatus, Version
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">I")
+
+
+def write_frame(writer: asyncio.StreamWriter, items: list) -> None:
+    """
+    One frame = 4-byte big-endian length + a pickled list of plain tuples.
+    """
+    payload = pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL)
+    writer.write(_HEADER.pack(len(payload)) + payload)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[list]:
+    """
+    Next frame's list, or None once the other side has closed the pipe.
+    """
+    try:
+        header = await reader.readexactly(_HEADER.size)
+        return pickle.loads(await reader.readexactly(_HEADER.unpack(header)[0]))
+    except asyncio.IncompleteReadError:
+        return None
+
+
+class ProbeWorkerError(RuntimeError):
+    """
+    The worker process running a check exited before answering.
+    """
+
+
+class _Worker:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self.reader_task: Optional[asyncio.Task] = None
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.outbox: List[tuple] = []
+        self.flush_scheduled = False
+
+
+class ProcessProbePool:
+    """
+    Runs ping + evaluate for health checks in `processes` worker processes
+    (python -m app.infrastructure.http.probe_worker), each with its own event
+    loop and pooled HTTP client, so probing a very large fleet isn't capped
+    by one interpreter's CPU. Scheduling, concurrency limits, persistence
+    and hooks stay in this (the persisting) process.
+    - A service always goes to the same worker (hash of its id), so its
+      keep-alive connections are reused from cycle to cycle.
+    - Requests and results travel as compact tuples over the workers'
+      stdin/stdout; everything queued or finished in the same loop iteration
+      goes out as one frame.
+    - A worker that exits fails its in-flight checks with ProbeWorkerError
+      and is restarted.
+    """
+
+    def __init__(self, processes: int) -> None:
+        self.processes = processes
+        self._workers: List[_Worker] = []
+        self._ids = itertools.count()
+        self._stopping = False
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def in_flight(self) -> int:
+        return sum(len(worker.pending) for worker in self._workers)
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._stopping = False
+        self._workers = [_Worker(index) for index in range(self.processes)]
+        for worker in self._workers:
+            await self._spawn(worker)
+        logger.info("Started %s probe worker processes", self.processes)
+
+    async def stop(self) -> None:
+        """
+        Close the workers' stdin (they finish in-flight checks and exit) and
+        wait for them.
+        """
+        self._stopping = True
+        for worker in self._workers:
+            if worker.proc is not None and worker.proc.stdin is not None:
+                self._flush(worker)
+                worker.proc.stdin.close()
+        for worker in self._workers:
+            if worker.proc is None:
+                continue
+            try:
+                await asyncio.wait_for(worker.proc.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                worker.proc.kill()
+                await worker.proc.wait()
+            if worker.reader_task is not None:
+                await worker.reader_task
+        self._workers = []
+
+    async def check(self, service: Service, timeout: Optional[float] = None) -> Tuple[HealthCheckResult, float]:
+        """
+        Ping (with `timeout`, if given) and evaluate `service` in its worker.
+        Returns the result and the seconds the worker spent evaluating it.
+        """
+        if not self._workers:
+            raise ProbeWorkerError("probe pool is not started")
+        worker = self._workers[zlib.crc32(str(service.id).encode("utf-8")) % len(self._workers)]
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        worker.pending[request_id] = future
+        worker.outbox.append((
+            request_id,
+            str(service.id),
+            service.url,
+            service.expected_version.value if service.expected_version is not None else None,
+            service.probe_mode.value,
+            timeout,
+        ))
+        if not worker.flush_scheduled:
+            worker.flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush, worker)
+
+        _, timestamp, status, latency_ms, version, matches, error, connect_ms, evaluate_seconds = await future
+        result = HealthCheckResult(
+            service_id=service.id,
+            timestamp=timestamp,
+            status=HealthStatus(status),
+            latency_ms=latency_ms,
+            version=Version(version) if version is not None else None,
+            version_matches_expected=matches,
+            error_message=error,
+            connect_ms=connect_ms,
+        )
+        return result, evaluate_seconds
+
+    def _flush(self, worker: _Worker) -> None:
+        worker.flush_scheduled = False
+        requests, worker.outbox = worker.outbox, []
+        if requests and worker.proc is not None and not worker.proc.stdin.is_closing():
+            write_frame(worker.proc.stdin, requests)
+
+    async def _spawn(self, worker: _Worker) -> None:
+        worker.proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "app.infrastructure.http.probe_worker",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=2 ** 24,
+        )
+        worker.reader_task = asyncio.create_task(self._read_results(worker, worker.proc))
+
+    async def _read_results(self, worker: _Worker, proc: asyncio.subprocess.Process) -> None:
+        while True:
+            results = await read_frame(proc.stdout)
+            if results is None:
+                break
+            for result in results:
+                future = worker.pending.pop(result[0], None)
+                if future is not None and not future.done():
+                    future.set_result(result)
+
+        code = await proc.wait()
+        lost, worker.pending = worker.pending, {}
+        for future in lost.values():
+            if not future.done():
+                future.set_exception(ProbeWorkerError(f"probe worker {worker.index} exited with code {code}"))
+        if self._stopping:
+            return
+        logger.error(
+            "Probe worker %s (pid %s) exited with code %s; %s checks lost, restarting it",
+            worker.index, proc.pid, code, len(lost),
+        )
+        worker.outbox = []
+        await self._spawn(worker)
@@ -1,14 +1,24 @@
 # app/infrastructure/http/service_pinger.py
 from __future__ import annotations
 
+import asyncio
 import json
+import re
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
 from app.domain.model.service import Service
+from app.domain.model.value_objects import ProbeMode
+from app.infrastructure.http.http_client import get_http_client
+from config.settings import settings
+
+# headers-only still reads bodies up to this size, to keep the connection reusable
+_DRAIN_MAX_BYTES = 4_096
+# A "version" member with a string or number value, for bodies cut off at the byte cap
+_VERSION_FIELD = re.compile(rb'"version"\s*:\s*("(?:[^"\\]|\\.)*"|-?\d[\d.eE+-]*)')
 
 
 @dataclass
@@ -17,56 +27,196 @@ class PingResult:
     latency_ms: Optional[int]
     reported_version: Optional[str]
     error_message: Optional[str] = None
+    # Time spent on TCP connect + TLS handshake; 0 when a pooled connection was reused.
+    # latency_ms - connect_ms is the latency without connection setup.
+    connect_ms: Optional[int] = None
+    # TCP probes: the connection was accepted
+    tcp_connected: bool = False
+    # Response bytes read off the wire (body, before decompression); None if no response
+    bytes_received: Optional[int] = None
+
+
+class _ConnectTimer:
+    """
+    httpx trace hook that sums the time spent opening a new connection
+    (TCP connect and TLS handshake) for one request.
+    """
+
+    _PHASES = ("connection.connect_tcp", "connection.start_tls")
+
+    def __init__(self) -> None:
+        self.connect_seconds = 0.0
+        self._started: Dict[str, float] = {}
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        for phase in self._PHASES:
+            if event_name == f"{phase}.started":
+                self._started[phase] = time.perf_counter()
+            elif event_name in (f"{phase}.complete", f"{phase}.failed"):
+                started = self._started.pop(phase, None)
+                if started is not None:
+                    self.connect_seconds += time.perf_counter() - started
+
+    @property
+    def connect_ms(self) -> int:
+        return int(self.connect_seconds * 1000)
 
 
 class HttpServicePinger:
     """
     Infrastructure service that pings a given service URL and returns raw data
-    for the domain to interpret.
+    for the domain to interpret, the way the service's probe_mode says:
+    - get: GET, reading at most `max_body_bytes` of the body (default
+      settings.probe_max_body_bytes); a longer body is cut off and the
+      version looked up in the part that was read,
+    - head: HEAD; version from the X-Service-Version header,
+    - headers-only: GET, body not read (unless it is tiny); version from the header,
+    - tcp: TCP connect to the URL's host/port; no HTTP at all.
+    Uses one pooled AsyncClient, so connections are reused across cycles,
+    except after a response whose body was left unread (cut off at the cap,
+    or headers-only), which has to be closed.
     """
 
-    async def ping(self, service: Service) -> PingResult:
+    def __init__(self, client: httpx.AsyncClient | None = None, max_body_bytes: int | None = None) -> None:
+        self._client = client
+        self._max_body_bytes = max_body_bytes if max_body_bytes is not None else settings.probe_max_body_bytes
+
+    async def ping(self, service: Service, timeout: float | None = None) -> PingResult:
+        """
+        `timeout` (seconds, for connect and for the response) overrides the
+        client's default for this request.
+        """
+        client = self._client or get_http_client()
+        if service.probe_mode == ProbeMode.TCP:
+            return await self._connect(service, timeout if timeout is not None else client.timeout.connect)
+
+        timer = _ConnectTimer()
         start = time.perf_counter()
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(service.url)
-            elapsed_ms = int((time.perf_counter() - start) * 1000)
+            async with client.stream(
+                "HEAD" if service.probe_mode == ProbeMode.HEAD else "GET",
+                service.url,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+                extensions={"trace": timer},
+            ) as response:
+                body, truncated = b"", False
+                if service.probe_mode == ProbeMode.GET:
+                    body, truncated = await self._read_body(response)
+                elif service.probe_mode == ProbeMode.HEAD or self._declared_length(response) <= _DRAIN_MAX_BYTES:
+                    # Reading a (near) empty body is cheaper than losing the keep-alive connection
+                    await response.aread()
+                elapsed_ms = int((time.perf_counter() - start) * 1000)
 
-            reported_version = self._extract_version(response)
+                reported_version = self._extract_version(body, truncated, response.headers)
 
+                return PingResult(
+                    http_status_code=response.status_code,
+                    latency_ms=elapsed_ms,
+                    reported_version=reported_version,
+                    error_message=None,
+                    connect_ms=timer.connect_ms,
+                    bytes_received=response.num_bytes_downloaded,
+                )
+        except Exception as exc:  # noqa: BLE001
+            # On error, we still consider this a ping result but DOWN
+            elapsed_ms = int((time.perf_counter() - start) * 1000)
+            if isinstance(exc, httpx.TimeoutException):
+                # httpx timeout messages are often empty; say which limit was hit
+                error_message = f"{type(exc).__name__} after {elapsed_ms} ms"
+            else:
+                error_message = str(exc)
             return PingResult(
-                http_status_code=response.status_code,
+                http_status_code=None,
                 latency_ms=elapsed_ms,
-                reported_version=reported_version,
-                error_message=None,
+                reported_version=None,
+                error_message=error_message,
+                connect_ms=timer.connect_ms,
             )
+
+    async def _read_body(self, response: httpx.Response) -> Tuple[bytes, bool]:
+        """
+        Read the body up to max_body_bytes. Returns (body, truncated).
+        """
+        chunks: List[bytes] = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self._max_body_bytes:
+                return b"".join(chunks)[: self._max_body_bytes], True
+        return b"".join(chunks), False
+
+    @staticmethod
+    def _declared_length(response: httpx.Response) -> float:
+        try:
+            return int(response.headers.get("Content-Length", ""))
+        except ValueError:
+            return float("inf")  # unknown (e.g. chunked): don't read it
+
+    async def _connect(self, service: Service, timeout: Optional[float]) -> PingResult:
+        url = httpx.URL(service.url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(url.host, port), timeout)
         except Exception as exc:  # noqa: BLE001
-            # On error, we still consider this a ping result but DOWN
             elapsed_ms = int((time.perf_counter() - start) * 1000)
+            if isinstance(exc, asyncio.TimeoutError):
+                error_message = f"TCP connect timed out after {elapsed_ms} ms"
+            else:
+                error_message = str(exc) or type(exc).__name__
             return PingResult(
                 http_status_code=None,
                 latency_ms=elapsed_ms,
                 reported_version=None,
-                error_message=str(exc),
+                error_message=error_message,
+                connect_ms=elapsed_ms,
             )
+        try:
+            elapsed_ms = int((time.perf_counter() - start) * 1000)
+            return PingResult(
+                http_status_code=None,
+                latency_ms=elapsed_ms,
+                reported_version=None,
+                connect_ms=elapsed_ms,
+                tcp_connected=True,
+                bytes_received=0,
+            )
+        finally:
+            # Wait for the socket to be released, so tcp probes don't leave
+            # transports behind until the loop gets round to them
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:  # noqa: BLE001  (e.g. reset by the peer; the probe already succeeded)
+                pass
 
-    def _extract_version(self, response: httpx.Response) -> Optional[str]:
+    def _extract_version(self, body: bytes, truncated: bool, headers: httpx.Headers) -> Optional[str]:
         """
         Very simple version extraction:
-        - Try JSON body with 'version' key
+        - Try JSON body with 'version' key (in a body cut off at the byte cap,
+          the first '"version": ...' found in the part that was read)
         - If that fails, try 'X-Service-Version' header
         - Otherwise return None
         """
         # JSON body
-        try:
-            data = response.json()
-            if isinstance(data, dict) and "version" in data:
-                return str(data["version"])
-        except (json.JSONDecodeError, ValueError):
-            pass
+        if truncated:
+            match = _VERSION_FIELD.search(body)
+            if match is not None:
+                try:
+                    return str(json.loads(match.group(1)))
+                except ValueError:
+                    pass
+        elif body:
+            try:
+                data = json.loads(body)
+                if isinstance(data, dict) and "version" in data:
+                    return str(data["version"])
+            except ValueError:
+                pass
 
         # Header
-        version_header = response.headers.get("X-Service-Version")
+        version_header = headers.get("X-Service-Version")
         if version_header:
             return version_header
 
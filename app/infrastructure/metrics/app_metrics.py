@@ -0,0 +1,60 @@
+# app/infrastructure/metrics/app_metrics.py
+from __future__ import annotations
+
+from app.infrastructure.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+from config.settings import settings
+
+# Process-wide registry rendered by GET /metrics. Modules that own state
+# (scheduler, response cache, ...) add CallbackMetrics to it for their gauges.
+metrics_registry = MetricsRegistry()
+
+_SLOW_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+_DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+_API_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+check_cycle_seconds = metrics_registry.register(Histogram(
+    "srm_check_cycle_duration_seconds",
+    "Time from dispatching a batch of due checks until the last of them finished.",
+    buckets=_SLOW_BUCKETS,
+))
+ping_latency_seconds = metrics_registry.register(Histogram(
+    "srm_ping_latency_seconds",
+    "Latency of health check pings per service (failed pings included).",
+    labelnames=("service",),
+    buckets=_SLOW_BUCKETS,
+    max_series=settings.metrics_max_service_series,
+))
+db_save_seconds = metrics_registry.register(Histogram(
+    "srm_db_save_duration_seconds",
+    "Time to persist health check results (save = one row, save_many = one batch).",
+    labelnames=("operation",),
+    buckets=_DB_BUCKETS,
+))
+http_request_seconds = metrics_registry.register(Histogram(
+    "srm_http_request_duration_seconds",
+    "API handler latency until the response starts, by route template.",
+    labelnames=("method", "route", "status"),
+    buckets=_API_BUCKETS,
+    max_series=500,
+))
+checks_total = metrics_registry.register(Counter(
+    "srm_checks_total",
+    "Health checks completed, by resulting status.",
+    labelnames=("status",),
+))
+health_check_writes_dropped_total = metrics_registry.register(Counter(
+    "srm_health_check_writes_dropped_total",
+    "Health check results dropped by the write-behind writer after repeated failed writes.",
+))
+alerts_sent_total = metrics_registry.register(Counter(
+    "srm_alerts_sent_total",
+    "Alerts raised for services that were DOWN for the consecutive-failure threshold.",
+))
+alert_webhook_failures_total = metrics_registry.register(Counter(
+    "srm_alert_webhook_failures_total",
+    "Alert webhook delivery attempts (one per batch) that raised or got a non-2xx response.",
+))
+pings_in_flight = metrics_registry.register(Gauge(
+    "srm_pings_in_flight",
+    "Pings currently holding a concurrency slot.",
+))
@@ -0,0 +1,282 @@
+# app/infrastructure/metrics/registry.py
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Label values used once a metric has reached its series limit
+OVERFLOW_LABEL = "_other"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+class _Shards:
+    """
+    Per-thread copies of a child's numbers, summed when scraped. Each thread
+    only ever writes its own list, so updates need no lock; dict get/setdefault
+    are atomic under the GIL.
+    """
+
+    __slots__ = ("_size", "_by_thread")
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._by_thread: Dict[int, List[float]] = {}
+
+    def mine(self) -> List[float]:
+        ident = threading.get_ident()
+        shard = self._by_thread.get(ident)
+        if shard is None:
+            shard = self._by_thread.setdefault(ident, [0.0] * self._size)
+        return shard
+
+    def total(self) -> List[float]:
+        totals = [0.0] * self._size
+        for shard in list(self._by_thread.values()):
+            for i, value in enumerate(shard):
+                totals[i] += value
+        return totals
+
+
+class _Metric:
+    """
+    A metric family with fixed label names. Children (one per label-value
+    combination) are created on first use and cached. At most `max_series`
+    children exist: once the limit is reached, new combinations share one
+    OVERFLOW_LABEL child, so a high-cardinality label can't grow memory or
+    scrape size without bound.
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), max_series: int = 1_000) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._max_series = max_series
+        self._children: Dict[LabelValues, object] = {}
+        self._default = self._new_child() if not self.labelnames else None
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            if len(self._children) >= self._max_series - 1:
+                # keep the last slot for the overflow child
+                values = (OVERFLOW_LABEL,) * len(self.labelnames)
+            child = self._children.get(values)
+            if child is None:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):  # noqa: ANN202
+        raise NotImplementedError
+
+    def _series(self) -> Iterable[Tuple[LabelValues, object]]:
+        if self._default is not None:
+            return [((), self._default)]
+        return sorted(list(self._children.items()))
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for values, child in self._series():
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values: LabelValues, child) -> List[str]:  # noqa: ANN001
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("_shards",)
+
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._shards.mine()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._shards.total()[0]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    def _render_child(self, values: LabelValues, child: _CounterChild) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"]
+
+
+class _GaugeChild:
+    """
+    Gauges are only set from the event loop thread, so a plain float suffices.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default.dec(amount)
+
+    def _render_child(self, values: LabelValues, child: _GaugeChild) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"]
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_shards")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self._bounds = bounds
+        # [count per bucket (non-cumulative, last = +Inf)..., sum]
+        self._shards = _Shards(len(bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        shard = self._shards.mine()
+        shard[bisect_left(self._bounds, value)] += 1
+        shard[-1] += value
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        max_series: int = 1_000,
+    ) -> None:
+        self._bounds = tuple(sorted(buckets))
+        self._le = [_format_value(bound) for bound in self._bounds + (math.inf,)]
+        super().__init__(name, documentation, labelnames, max_series)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._bounds)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def _render_child(self, values: LabelValues, child: _HistogramChild) -> List[str]:
+        totals = child._shards.total()
+        labels = _format_labels(self.labelnames, values)
+        # label pairs without the braces, so each bucket only appends le="..."
+        inner = labels[1:-1] + "," if labels else ""
+        bucket = f"{self.name}_bucket{{{inner}le="
+        lines, cumulative = [], 0.0
+        for le, count in zip(self._le, totals[:-1]):
+            cumulative += count
+            lines.append(f'{bucket}"{le}"}} {_format_value(cumulative)}')
+        lines.append(f"{self.name}_sum{labels} {_format_value(totals[-1])}")
+        lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class CallbackMetric:
+    """
+    A metric read from existing state when scraped (queue depths, cache
+    counters, ...), so it costs nothing between scrapes.
+    `collect` returns (label values, value) pairs.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        type_name: str,
+        collect: Callable[[], Iterable[Tuple[LabelValues, float]]],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.type_name = type_name
+        self.labelnames = tuple(labelnames)
+        self._collect = collect
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for values, value in self._collect():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(float(value))}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Holds the process's metrics and renders them in the Prometheus text
+    exposition format (version 0.0.4).
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, object] = {}
+
+    def register(self, metric):  # noqa: ANN001, ANN201
+        if metric.name in self._metrics:
+            raise ValueError(f"metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[object]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,212 @@
+# app/infrastructure/scheduling/check_schedule.py
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from app.domain.model.service import Service
+from app.domain.model.value_objects import ServiceId
+
+
+@dataclass(order=True)
+class _Slot:
+    fire_at: float  # heap key: base due time + this firing's jitter
+    seq: int
+    service_id: ServiceId = field(compare=False)
+    generation: int = field(compare=False)
+
+
+@dataclass
+class _Entry:
+    service: Service
+    interval: float
+    jitter: float
+    base_due: float  # fixed-rate timeline; jitter is never folded back into it
+    generation: int
+
+
+# Shortest interval the schedule runs at (the API's and services.json's lower
+# limit). Both validate it already; this keeps a bad value that got through
+# anyway (<= 0 makes pop_due loop forever) from freezing the event loop.
+MIN_INTERVAL_SECONDS = 1.0
+
+
+def _clamp(interval: float, jitter: float) -> Tuple[float, float]:
+    return max(MIN_INTERVAL_SECONDS, float(interval)), max(0.0, float(jitter))
+
+
+class CheckSchedule:
+    """
+    Priority queue of per-service checks keyed by next-due time.
+    - Each service has its own interval and jitter.
+    - Fixed rate: the next due time is the previous due time + interval,
+      so the period doesn't drift with how long a check takes.
+    - New services get a stable phase offset inside their interval (hash of
+      the id), which spreads probes across the period instead of bursting.
+    Times are monotonic seconds (e.g. loop.time()).
+    """
+
+    def __init__(self, default_interval: float, default_jitter: float = 0.0) -> None:
+        self._default_interval = default_interval
+        self._default_jitter = default_jitter
+        self._entries: Dict[ServiceId, _Entry] = {}
+        self._heap: List[_Slot] = []
+        self._seq = itertools.count()
+        self._generations = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, service_id: object) -> bool:
+        return service_id in self._entries
+
+    def sync(self, services: Iterable[Service], now: float) -> None:
+        """
+        Make the schedule match `services` (the enabled catalogue):
+        add new ones, drop missing ones, and keep the existing phase of
+        unchanged ones.
+        """
+        wanted = {service.id: service for service in services}
+
+        for sid in list(self._entries):
+            if sid not in wanted:
+                del self._entries[sid]  # its heap slot becomes stale and is skipped
+
+        for service in wanted.values():
+            self._upsert(service, now)
+
+    def update(self, services: Iterable[Service], now: float) -> None:
+        """
+        Apply changes to just these services, the way sync() would:
+        disabled ones are dropped, the rest added or updated in place.
+        Costs O(len(services)) instead of a pass over the whole catalogue.
+        """
+        for service in services:
+            if service.enabled:
+                self._upsert(service, now)
+            else:
+                self._entries.pop(service.id, None)
+
+    def remove(self, service_ids: Iterable[ServiceId]) -> None:
+        for sid in service_ids:
+            self._entries.pop(sid, None)  # its heap slot becomes stale and is skipped
+
+    def next_fire_at(self) -> Optional[float]:
+        self._drop_stale()
+        return self._heap[0].fire_at if self._heap else None
+
+    def pop_due(self, now: float) -> List[Tuple[Service, float]]:
+        """
+        Return (service, scheduled time) for every check due at `now`, and
+        schedule each one's next run.
+        """
+        due: List[Tuple[Service, float]] = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0].fire_at > now:
+                return due
+            slot = heapq.heappop(self._heap)
+            entry = self._entries[slot.service_id]
+            due.append((entry.service, slot.fire_at))
+
+            entry.base_due += entry.interval
+            if entry.base_due <= now:
+                # We fell behind by more than a period: skip the missed slots
+                # instead of firing them back to back, but stay on the same phase.
+                missed = int((now - entry.base_due) // entry.interval) + 1
+                entry.base_due += missed * entry.interval
+            self._push(entry)
+
+    def _upsert(self, service: Service, now: float) -> None:
+        interval, jitter = _clamp(
+            service.check_interval_seconds if service.check_interval_seconds is not None else self._default_interval,
+            service.jitter_seconds if service.jitter_seconds is not None else self._default_jitter,
+        )
+        entry = self._entries.get(service.id)
+
+        if entry is None:
+            base_due = now + self._phase(service.id) * interval
+            self._add(service, interval, jitter, base_due)
+        elif entry.interval != interval or entry.jitter != jitter:
+            # Keep the current due time, then run at the new cadence
+            self._add(service, interval, jitter, entry.base_due)
+        else:
+            entry.service = service
+
+    def _add(self, service: Service, interval: float, jitter: float, base_due: float) -> None:
+        interval, jitter = _clamp(interval, jitter)
+        entry = _Entry(
+            service=service,
+            interval=interval,
+            jitter=jitter,
+            base_due=base_due,
+            generation=next(self._generations),
+        )
+        self._entries[service.id] = entry
+        self._push(entry)
+
+    def _push(self, entry: _Entry) -> None:
+        offset = random.uniform(-entry.jitter, entry.jitter) if entry.jitter > 0 else 0.0
+        heapq.heappush(
+            self._heap,
+            _Slot(
+                fire_at=entry.base_due + offset,
+                seq=next(self._seq),
+                service_id=entry.service.id,
+                generation=entry.generation,
+            ),
+        )
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap:
+            entry = self._entries.get(heap[0].service_id)
+            if entry is not None and entry.generation == heap[0].generation:
+                return
+            heapq.heappop(heap)
+
+    @staticmethod
+    def _phase(service_id: ServiceId) -> float:
+        # Stable across restarts, roughly uniform in [0, 1)
+        return (zlib.crc32(str(service_id).encode("utf-8")) % 10_000) / 10_000
+
+
+class LagStats:
+    """
+    How late checks started compared with when they were due.
+    Keeps the last `window` samples for percentiles.
+    """
+
+    def __init__(self, window: int = 1_024) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._count = 0
+        self._max = 0.0
+
+    def record(self, lag_seconds: float) -> None:
+        lag = max(0.0, lag_seconds)
+        self._samples.append(lag)
+        self._count += 1
+        if lag > self._max:
+            self._max = lag
+
+    def summary(self) -> Dict[str, float]:
+        samples = sorted(self._samples)
+
+        def pct(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(p * len(samples)))] * 1000
+
+        return {
+            "checks": self._count,
+            "p50Ms": round(pct(0.50), 1),
+            "p95Ms": round(pct(0.95), 1),
+            "p99Ms": round(pct(0.99), 1),
+            "maxMs": round(self._max * 1000, 1),
+            "lastMs": round(self._samples[-1] * 1000 if self._samples else 0.0, 1),
+        }
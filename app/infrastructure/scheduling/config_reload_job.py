@@ -0,0 +1,117 @@
+# app/infrastructure/scheduling/config_reload_job.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, Optional
+
+from app.application.use_cases.apply_service_catalogue_diff import ApplyServiceCatalogueDiff
+from app.domain.model.service import Service
+from app.domain.model.value_objects import ServiceId
+from app.domain.services.service_catalogue_diff import ServiceCatalogueDiff
+from app.infrastructure.cache.response_cache import SERVICES, STATUS, response_cache
+from app.infrastructure.cache.status_snapshot import status_snapshot
+from app.infrastructure.config.service_config_watcher import ServiceConfigWatcher
+from app.infrastructure.db.threaded_repositories import ThreadedServiceRepository
+from app.infrastructure.scheduling.health_check_scheduler import notify_services_changed
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_reload_task: Optional[asyncio.Task] = None
+
+
+class ServiceConfigReloader:
+    """
+    Applies edits of the services config file without a restart.
+    - `catalogue` is what the file said last time it was applied (seeded at
+      startup), so the diff only covers services the file itself changed;
+      services created through the API are left alone.
+    - Reading, hashing, parsing and diffing run in a worker thread and the
+      writes on the DB thread pool, so a 10k-entry file doesn't stall the loop.
+    - Unchanged services are not written and keep their place in the check
+      schedule (and their pooled connections); the scheduler is told about
+      the written services only, not asked to re-read the whole catalogue.
+    - A missing, empty or malformed file changes nothing (the watcher raises
+      and the loop logs a warning); an edit is applied only once the file
+      has stopped changing for a poll interval.
+    """
+
+    def __init__(
+        self,
+        watcher: ServiceConfigWatcher,
+        use_case: ApplyServiceCatalogueDiff,
+        catalogue: Iterable[Service] = (),
+    ) -> None:
+        self._watcher = watcher
+        self._use_case = use_case
+        self._catalogue: Dict[ServiceId, Service] = {service.id: service for service in catalogue}
+
+    async def reload(self) -> Optional[ServiceCatalogueDiff]:
+        """
+        Apply the file if it changed; returns the diff, or None if there was nothing to do.
+        """
+        services = await asyncio.to_thread(self._watcher.poll)
+        if services is None:
+            return None
+        started = time.perf_counter()
+        diff = await asyncio.to_thread(ServiceCatalogueDiff.between, self._catalogue, services)
+        if diff.empty:
+            return None
+        try:
+            written = await self._use_case.execute(diff)
+        except Exception:
+            self._watcher.forget()  # retry the same file on the next poll
+            raise
+        self._catalogue = {service.id: service for service in services}
+
+        response_cache.invalidate(SERVICES, STATUS)
+        notify_services_changed(written)
+        logger.info(
+            "Reloaded %s: %s added, %s changed, %s removed (disabled) in %.0f ms",
+            self._watcher.path, len(diff.added), len(diff.changed), len(diff.removed),
+            (time.perf_counter() - started) * 1000,
+        )
+        return diff
+
+
+async def config_reload_loop(reloader: ServiceConfigReloader) -> None:
+    interval = settings.services_config_reload_seconds
+    logger.info("Watching %s for changes (every %s seconds)", settings.services_config_path, interval)
+    while True:
+        try:
+            await reloader.reload()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not reload %s, keeping the current services: %s",
+                           settings.services_config_path, exc)
+        await asyncio.sleep(interval)
+
+
+def start_config_reload_job(seeded: Iterable[Service]) -> None:
+    """
+    Start watching the services config file (no-op if SERVICES_CONFIG_RELOAD_SECONDS is 0).
+    `seeded` is what startup loaded from the file. Should be called from FastAPI startup event.
+    """
+    global _reload_task
+    if settings.services_config_reload_seconds > 0 and _reload_task is None:
+        reloader = ServiceConfigReloader(
+            ServiceConfigWatcher(settings.services_config_path),
+            ApplyServiceCatalogueDiff(ThreadedServiceRepository(), status_snapshot),
+            seeded,
+        )
+        _reload_task = asyncio.create_task(config_reload_loop(reloader))
+
+
+async def stop_config_reload_job() -> None:
+    """
+    Should be called from FastAPI shutdown event.
+    """
+    global _reload_task
+    if _reload_task is not None:
+        _reload_task.cancel()
+        try:
+            await _reload_task
+        except asyncio.CancelledError:
+            pass
+        _reload_task = None
@@ -0,0 +1,232 @@
+# app/infrastructure/scheduling/cycle_profiler.py
+from __future__ import annotations
+
+import cProfile
+import heapq
+import itertools
+import logging
+import os
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Phases of one check, in the order they happen
+QUEUED = "queued"  # due time -> probe slot acquired (scheduler lag + concurrency limits)
+CONNECT = "connect"  # DNS, TCP connect and TLS handshake (0 on a reused connection)
+RESPONSE = "response"  # waiting on the target after the connection was ready
+EVALUATE = "evaluate"  # HealthEvaluationService.evaluate
+PERSIST = "persist"  # save (direct) or enqueue on the write-behind writer
+HOOKS = "hooks"  # on_result callbacks: snapshot, caches, metrics, failure streaks
+ALERTS = "alerts"  # alert evaluation and delivery
+PHASES = (QUEUED, CONNECT, RESPONSE, EVALUATE, PERSIST, HOOKS, ALERTS)
+
+
+class CycleProfile:
+    """
+    Timing breakdown of one scheduler cycle: every check dispatched during
+    one window of `health_check_interval_seconds` (a sweep at the default
+    cadence). Checks are folded in as they finish, so memory is O(phases +
+    slowest services), not O(checks). Write-behind commits that ran while
+    the cycle was open are added as `dbCommit`.
+    """
+
+    def __init__(self, cycle_id: int, opened_at: float, closes_at: float, slowest: int) -> None:
+        self.id = cycle_id
+        self.started_at = datetime.utcnow()
+        self.opened_at = opened_at
+        self.closes_at = closes_at
+        self.last_at = opened_at
+        self.finished_at: Optional[float] = None
+        self.dispatched = 0
+        self.completed = 0
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self.maxima = dict.fromkeys(PHASES, 0.0)
+        self.db_commit_seconds = 0.0
+        self.db_commit_batches = 0
+        self.db_commit_rows = 0
+        self._slowest = slowest
+        # min-heap of (check seconds, seq, service id, phases): the N slowest checks
+        self._slowest_heap: List[Tuple[float, int, str, Dict[str, float]]] = []
+        self._seq = itertools.count()
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+    def add_check(self, service_id: str, phases: Dict[str, float], now: float) -> None:
+        self.last_at = now
+        total = 0.0
+        for phase, seconds in phases.items():
+            self.totals[phase] += seconds
+            if seconds > self.maxima[phase]:
+                self.maxima[phase] = seconds
+            total += seconds
+        self.completed += 1
+        entry = (total, next(self._seq), service_id, phases)
+        if len(self._slowest_heap) < self._slowest:
+            heapq.heappush(self._slowest_heap, entry)
+        elif total > self._slowest_heap[0][0]:
+            heapq.heapreplace(self._slowest_heap, entry)
+
+    def to_dict(self) -> Dict[str, Any]:
+        checks = max(1, self.completed)
+        phase_time = sum(self.totals.values()) or 1.0
+        phases = sorted(
+            (
+                {
+                    "phase": phase,
+                    "totalMs": round(total * 1000, 1),
+                    "avgMs": round(total * 1000 / checks, 2),
+                    "maxMs": round(self.maxima[phase] * 1000, 1),
+                    "share": round(total / phase_time, 3),
+                }
+                for phase, total in self.totals.items()
+            ),
+            key=lambda row: row["totalMs"],
+            reverse=True,
+        )
+        slowest = [
+            {
+                "serviceId": service_id,
+                "totalMs": round(total * 1000, 1),
+                "phasesMs": {phase: round(seconds * 1000, 1) for phase, seconds in phases_.items()},
+            }
+            for total, _, service_id, phases_ in sorted(self._slowest_heap, reverse=True)
+        ]
+        return {
+            "id": self.id,
+            "startedAt": self.started_at,
+            "durationMs": round((self.last_at - self.opened_at) * 1000, 1),
+            "checks": self.completed,
+            "complete": self.done,
+            "phases": phases,
+            "slowestServices": slowest,
+            "dbCommit": {
+                "batches": self.db_commit_batches,
+                "rows": self.db_commit_rows,
+                "totalMs": round(self.db_commit_seconds * 1000, 1),
+            },
+        }
+
+
+class CycleProfiler:
+    """
+    Keeps the last `history` cycle profiles in a ring buffer.
+    - begin(now) is called for every dispatched check and returns the cycle
+      it belongs to (opening a new one when the current window has passed);
+      finish(cycle, service_id, phases) folds the check's timings in.
+    - A cycle is complete once its window has passed and all of its checks
+      finished; it is then appended to the ring.
+    - capture_next() arms a one-shot cProfile capture of the next cycle
+      (event loop thread, i.e. everything the scheduler does in the cycle),
+      written to `profiler_dir` as a .prof file for pstats/snakeviz.
+    All calls happen on the event loop thread.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        history: int = 20,
+        slowest: int = 10,
+        profiler_dir: str = "profiles",
+    ) -> None:
+        self._window = window_seconds
+        self._slowest = slowest
+        self._profiler_dir = profiler_dir
+        self._recent: Deque[CycleProfile] = deque(maxlen=history)
+        self._open: List[CycleProfile] = []
+        self._current: Optional[CycleProfile] = None
+        self._ids = itertools.count(1)
+        self._capture_armed = False
+        self._capture: Optional[Tuple[CycleProfile, cProfile.Profile]] = None
+        self.last_capture: Optional[str] = None
+
+    def begin(self, now: float) -> CycleProfile:
+        cycle = self._current
+        if cycle is None or now >= cycle.closes_at:
+            cycle = self._current = CycleProfile(next(self._ids), now, now + self._window, self._slowest)
+            self._open.append(cycle)
+            if self._capture_armed and self._capture is None:
+                self._start_capture(cycle)
+        cycle.dispatched += 1
+        return cycle
+
+    def finish(self, cycle: CycleProfile, service_id: str, phases: Dict[str, float], now: float) -> None:
+        cycle.add_check(service_id, phases, now)
+        self._close_finished(now)
+
+    def record_db_commit(self, rows: int, seconds: float) -> None:
+        """
+        A write-behind batch was committed: charge it to every open cycle.
+        """
+        for cycle in self._open:
+            cycle.db_commit_batches += 1
+            cycle.db_commit_rows += rows
+            cycle.db_commit_seconds += seconds
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        cycles = list(self._recent)[::-1]
+        return [cycle.to_dict() for cycle in cycles[:limit]]
+
+    def current(self) -> Optional[Dict[str, Any]]:
+        return self._current.to_dict() if self._current is not None and not self._current.done else None
+
+    def capture_next(self) -> None:
+        self._capture_armed = True
+
+    def capture_status(self) -> Dict[str, Any]:
+        return {
+            "armed": self._capture_armed,
+            "capturingCycle": self._capture[0].id if self._capture is not None else None,
+            "lastCapture": self.last_capture,
+        }
+
+    def _close_finished(self, now: float) -> None:
+        still_open = []
+        for cycle in self._open:
+            if cycle.completed >= cycle.dispatched and now >= cycle.closes_at:
+                cycle.finished_at = now
+                self._recent.append(cycle)
+                if self._capture is not None and self._capture[0] is cycle:
+                    self._stop_capture()
+            else:
+                still_open.append(cycle)
+        self._open = still_open
+
+    def _start_capture(self, cycle: CycleProfile) -> None:
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as exc:  # another profiler is already active on this thread
+            logger.warning("Could not start cycle profile capture: %s", exc)
+            return
+        self._capture_armed = False
+        self._capture = (cycle, profile)
+        logger.info("Capturing a profile of scheduler cycle %s", cycle.id)
+
+    def _stop_capture(self) -> None:
+        cycle, profile = self._capture
+        self._capture = None
+        profile.disable()
+        path = os.path.join(self._profiler_dir, f"cycle-{cycle.started_at:%Y%m%dT%H%M%S}-{cycle.id}.prof")
+        try:
+            os.makedirs(self._profiler_dir, exist_ok=True)
+            profile.dump_stats(path)
+        except OSError as exc:
+            logger.warning("Could not write cycle profile to %s: %s", path, exc)
+            return
+        self.last_capture = path
+        logger.info("Wrote profile of scheduler cycle %s to %s", cycle.id, path)
+
+
+# Process-wide profiler fed by the health check scheduler.
+cycle_profiler = CycleProfiler(
+    window_seconds=settings.health_check_interval_seconds,
+    history=settings.scheduler_cycle_history,
+    slowest=settings.scheduler_cycle_slowest_services,
+    profiler_dir=settings.scheduler_profiler_dir,
+)
@@ -3,123 +3,464 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import multiprocessing
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from app.application.use_cases.run_health_check_for_service import RunHealthCheckForService
-from app.application.use_cases.run_health_check_cycle import RunHealthCheckCycle
+from app.application.use_cases.rebuild_failure_streaks import RebuildFailureStreaks
+from app.application.use_cases.refresh_peer_statuses import RefreshPeerStatuses
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.service import Service
+from app.domain.model.value_objects import BreakerState, ServiceId
+from app.domain.services.adaptive_timeout_policy import AdaptiveTimeoutPolicy
+from app.domain.services.failure_streak_tracker import FailureStreakTracker
 from app.domain.services.health_evaluation_service import HealthEvaluationService
+from app.domain.services.probe_circuit_breaker import ProbeCircuitBreaker
+from app.infrastructure.alerting.alert_dispatcher import alert_dispatcher
 from app.infrastructure.alerting.alert_notifier import AlertNotifier
-from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.cache.response_cache import SERVICES, STATUS, response_cache
+from app.infrastructure.cache.status_snapshot import status_snapshot
+from app.infrastructure.db.db_executor import run_with_session
+from app.infrastructure.db.health_check_writer import HealthCheckWriter
 from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository
 from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+from app.infrastructure.db.threaded_repositories import (
+    ThreadedHealthCheckRepository,
+    ThreadedServiceRepository,
+)
+from app.infrastructure.http.probe_limiter import ProbeLimiter
+from app.infrastructure.http.process_probe_pool import ProcessProbePool
+from app.infrastructure.metrics.app_metrics import (
+    check_cycle_seconds,
+    checks_total,
+    metrics_registry,
+    ping_latency_seconds,
+    pings_in_flight,
+)
+from app.infrastructure.metrics.registry import CallbackMetric
 from app.infrastructure.http.service_pinger import HttpServicePinger
+from app.infrastructure.scheduling.check_schedule import CheckSchedule, LagStats
+from app.infrastructure.scheduling.cycle_profiler import (
+    ALERTS,
+    CONNECT,
+    EVALUATE,
+    HOOKS,
+    PERSIST,
+    QUEUED,
+    RESPONSE,
+    CycleProfile,
+    cycle_profiler,
+)
+from app.infrastructure.scheduling.shard_coordinator import ShardCoordinator, shard_coordinator
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_scheduler_task: Optional[asyncio.Task] = None
+_peer_refresh_task: Optional[asyncio.Task] = None
+_coordinator: Optional[ShardCoordinator] = None
+_writer: Optional[HealthCheckWriter] = None
+_probe_pool: Optional[ProcessProbePool] = None
+_schedule: Optional[CheckSchedule] = None
+_breaker: Optional[ProbeCircuitBreaker] = None
+_lag_stats = LagStats()
+_in_flight: Set[asyncio.Task] = set()
+_catalogue_changed = asyncio.Event()  # wakes the loop for either of the two below
+_resync_requested = False
+_catalogue_updates: List[Service] = []
 
-async def health_check_loop() -> None:
+
+class _AlertCollector:
     """
-    Background loop that runs the health check cycle at a fixed interval.
+    on_result hook: feeds every result into the failure-streak tracker and
+    remembers services whose streak just reached the threshold.
     """
-    interval = settings.health_check_interval_seconds
-    logger.info("Starting health check scheduler with interval=%s seconds", interval)
 
-    while True:
-        logger.info("Starting health check cycle")
-        db = SessionLocal()
-        try:
-            service_repo = SQLiteServiceRepository(db)
-            health_repo = SQLiteHealthCheckRepository(db)
-            pinger = HttpServicePinger()
-            evaluator = HealthEvaluationService()
+    def __init__(self, tracker: FailureStreakTracker) -> None:
+        self._tracker = tracker
+        self._pending: List[Tuple[Service, List[HealthCheckResult]]] = []
+
+    def __call__(self, service: Service, result: HealthCheckResult) -> None:
+        if self._tracker.record(result):
+            self._pending.append((service, self._tracker.recent(service.id)))
+
+    def drain(self) -> List[Tuple[Service, List[HealthCheckResult]]]:
+        pending, self._pending = self._pending, []
+        return pending
+
+
+class _CycleTimer:
+    """
+    Times one batch of checks that became due together, from dispatch until
+    the last of them finished (a done-callback per task; no extra task).
+    """
+
+    __slots__ = ("_remaining", "_started")
+
+    def __init__(self, size: int, started: float) -> None:
+        self._remaining = size
+        self._started = started
+
+    def check_done(self, task: asyncio.Task) -> None:
+        self._remaining -= 1
+        if self._remaining == 0:
+            check_cycle_seconds.observe(asyncio.get_running_loop().time() - self._started)
+
+
+def _record_check_metrics(service: Service, result: HealthCheckResult) -> None:
+    checks_total.labels(result.status.value).inc()
+    if result.latency_ms is not None:
+        ping_latency_seconds.labels(str(service.id)).observe(result.latency_ms / 1000)
+
+
+def _check_phases(
+    queued: float,
+    timings: Dict[str, float],
+    result: Optional[HealthCheckResult],
+    alerts: float,
+) -> Dict[str, float]:
+    """
+    Split one check's time into the cycle profiler's phases. The pinger
+    reports connection setup (DNS/TCP/TLS) inside the ping, so that part of
+    the ping is `connect` and the rest is waiting on the target.
+    """
+    ping = timings.get("ping", 0.0)
+    connect = min(ping, (result.connect_ms or 0) / 1000) if result is not None else 0.0
+    return {
+        QUEUED: max(0.0, queued),
+        CONNECT: connect,
+        RESPONSE: ping - connect,
+        EVALUATE: timings.get("evaluate", 0.0),
+        PERSIST: timings.get("persist", 0.0),
+        HOOKS: timings.get("hooks", 0.0),
+        ALERTS: alerts,
+    }
+
 
+def _status_changed(service: Service, result: HealthCheckResult) -> None:
+    response_cache.invalidate(STATUS)
+
+
+def _check_saved(service: Service, result: HealthCheckResult) -> None:
+    response_cache.invalidate_checks([service.id])
+
+
+def _checks_written(results: List[HealthCheckResult]) -> None:
+    response_cache.invalidate_checks(result.service_id for result in results)
+
+
+def _send_alerts(collector: _AlertCollector, notifier: AlertNotifier, threshold: int) -> None:
+    """
+    Alert on services that have just been DOWN for `threshold` consecutive checks.
+    Webhook delivery happens in the background (AlertDispatcher).
+    """
+    for service, recent in collector.drain():
+        notifier.service_down_repeatedly(service, recent, threshold)
+
+
+async def _run_check(
+    service: Service,
+    scheduled_at: float,
+    limiter: ProbeLimiter,
+    pinger: HttpServicePinger,
+    evaluator: HealthEvaluationService,
+    health_repo: ThreadedHealthCheckRepository,
+    writer: HealthCheckWriter | None,
+    collector: _AlertCollector,
+    notifier: AlertNotifier,
+    threshold: int,
+    cycle: CycleProfile,
+    probe_pool: ProcessProbePool | None = None,
+    timeouts: AdaptiveTimeoutPolicy | None = None,
+    breaker: ProbeCircuitBreaker | None = None,
+) -> None:
+    loop = asyncio.get_running_loop()
+    queued = alerts = 0.0
+    timings: Dict[str, float] = {}
+    result: Optional[HealthCheckResult] = None
+    try:
+        async with limiter.slot(service.url):
+            queued = loop.time() - scheduled_at
+            _lag_stats.record(queued)
             run_single = RunHealthCheckForService(
                 pinger=pinger,
                 evaluator=evaluator,
                 health_repo=health_repo,
+                writer=writer,
+                # Without a writer the result is already saved when the hooks run
+                on_result=[status_snapshot.record, _status_changed, _record_check_metrics, collector]
+                + ([] if writer is not None else [_check_saved]),
+                probe_pool=probe_pool,
+                timeouts=timeouts,
+                breaker=breaker,
             )
-            cycle = RunHealthCheckCycle(
-                service_repo=service_repo,
-                run_health_check_for_service=run_single,
-            )
+            pings_in_flight.inc()
+            try:
+                result = await run_single.execute(service, timings)
+            finally:
+                pings_in_flight.dec()
 
-            await cycle.execute()
-            logger.info("Completed health check cycle")
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Error during health check cycle: %s", exc)
-        finally:
-            db.close()
+        # Alert on streaks that just crossed the threshold
+        alerts_started = time.perf_counter()
+        _send_alerts(collector, notifier, threshold)
+        alerts = time.perf_counter() - alerts_started
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Health check failed for service %s: %s", service.id, exc)
+    finally:
+        cycle_profiler.finish(cycle, str(service.id), _check_phases(queued, timings, result, alerts), loop.time())
 
-        await asyncio.sleep(interval)
 
-async def _evaluate_alerts(
-    service_repo: SQLiteServiceRepository,
-    health_repo: SQLiteHealthCheckRepository,
-    notifier: AlertNotifier,
-) -> None:
+async def _seed_streaks(tracker: FailureStreakTracker, service_ids: List[ServiceId]) -> None:
     """
-    After a health check cycle, inspect recent results and trigger alerts
-    for services that have been DOWN for N consecutive checks.
+    Seed the failure streaks of services this worker just took over (its
+    tracker has not seen their recent checks): one DB round trip, and the
+    tracker itself is only touched on the event loop.
     """
-    threshold = settings.alert_consecutive_failures_threshold
-    services = service_repo.find_all_enabled()
-
-    for service in services:
-        recent = health_repo.find_recent_by_service_id(service.id, limit=threshold)
-        if len(recent) < threshold:
-            continue
+    if not service_ids:
+        return
+    recent = await run_with_session(
+        lambda db: {
+            sid: SQLiteHealthCheckRepository(db).find_recent_by_service_id(sid, limit=tracker.threshold)
+            for sid in service_ids
+        }
+    )
+    for sid, checks in recent.items():
+        tracker.seed(sid, checks)
 
-        # We want the MOST recent 'threshold' checks; our repo returns them desc by timestamp
-        # so recent[0] is the latest.
-        all_down = all(check.status.name == "DOWN" for check in recent[:threshold])
-        if all_down:
-            await notifier.service_down_repeatedly(service, recent[:threshold], threshold)
 
-async def health_check_loop() -> None:
+async def health_check_loop(
+    writer: HealthCheckWriter | None = None,
+    coordinator: ShardCoordinator | None = None,
+    probe_pool: ProcessProbePool | None = None,
+) -> None:
     """
-    Background loop that runs the health check cycle at a fixed interval.
+    Background loop that runs each service's check when it is due.
+    Services have their own interval/jitter (default: settings), kept in a
+    CheckSchedule priority queue; the enabled catalogue is re-synced every
+    `health_check_catalogue_refresh_seconds` or when notify_catalogue_changed() is called.
+    With a coordinator, only services in the shards this worker holds are
+    scheduled, and a change of shards triggers a re-sync.
+    With a probe_pool, the pings run in its worker processes; results are
+    still persisted and alerted on here.
+    Each service's pings use its adaptive timeout, and due checks of
+    services whose circuit breaker is open are skipped (see settings.probe_*).
     """
+    global _schedule, _resync_requested, _breaker
     interval = settings.health_check_interval_seconds
-    logger.info("Starting health check scheduler with interval=%s seconds", interval)
+    logger.info("Starting health check scheduler with default interval=%s seconds", interval)
 
+    loop = asyncio.get_running_loop()
     notifier = AlertNotifier()
+    tracker = FailureStreakTracker(settings.alert_consecutive_failures_threshold)
+    collector = _AlertCollector(tracker)
 
-    while True:
-        logger.info("Starting health check cycle")
-        db = SessionLocal()
+    # With a coordinator, streaks are seeded per service as its shard is taken over
+    if coordinator is None:
         try:
-            service_repo = SQLiteServiceRepository(db)
-            health_repo = SQLiteHealthCheckRepository(db)
-            pinger = HttpServicePinger()
-            evaluator = HealthEvaluationService()
-
-            run_single = RunHealthCheckForService(
-                pinger=pinger,
-                evaluator=evaluator,
-                health_repo=health_repo,
-            )
-            cycle = RunHealthCheckCycle(
-                service_repo=service_repo,
-                run_health_check_for_service=run_single,
+            await run_with_session(
+                lambda db: RebuildFailureStreaks(
+                    SQLiteServiceRepository(db), SQLiteHealthCheckRepository(db), tracker
+                ).execute()
             )
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Could not rebuild failure streaks from history: %s", exc)
 
-            # Run the health checks
-            await cycle.execute()
+    if probe_pool is not None:
+        await probe_pool.start()
+
+    timeouts = AdaptiveTimeoutPolicy(
+        max_seconds=settings.http_timeout_seconds,
+        min_seconds=settings.probe_timeout_min_seconds,
+        percentile=settings.probe_timeout_percentile,
+        multiplier=settings.probe_timeout_multiplier,
+        window=settings.probe_timeout_window,
+    ) if settings.probe_adaptive_timeouts else None
+    breaker = ProbeCircuitBreaker(
+        settings.probe_breaker_failure_threshold, settings.probe_breaker_open_seconds
+    ) if settings.probe_breaker_failure_threshold > 0 else None
+    _breaker = breaker
+
+    schedule = CheckSchedule(interval, settings.health_check_jitter_seconds)
+    _schedule = schedule
+    limiter = ProbeLimiter(
+        settings.health_check_max_concurrency,
+        settings.health_check_max_concurrency_per_host,
+    )
+    pinger = HttpServicePinger()
+    evaluator = HealthEvaluationService()
+    service_repo = ThreadedServiceRepository()
+    health_repo = ThreadedHealthCheckRepository()
+    next_refresh = loop.time()
+
+    try:
+        while True:
+            now = loop.time()
+            _catalogue_changed.clear()
+            if now >= next_refresh or _resync_requested:
+                _resync_requested = False
+                _catalogue_updates.clear()  # the full re-sync covers them
+                try:
+                    enabled = await service_repo.find_all_enabled()
+                    if coordinator is None:
+                        schedule.sync(enabled, now)
+                    else:
+                        owned = [service for service in enabled if coordinator.owns(service.id)]
+                        taken_over = [service.id for service in owned if service.id not in schedule]
+                        schedule.sync(owned, now)
+                        await _seed_streaks(tracker, taken_over)
+                except Exception as exc:  # noqa: BLE001
+                    logger.exception("Could not refresh the service catalogue: %s", exc)
+                next_refresh = now + settings.health_check_catalogue_refresh_seconds
+            elif _catalogue_updates:
+                updates = list(_catalogue_updates)
+                _catalogue_updates.clear()
+                for service in updates:
+                    # A new URL or a re-enabled service starts from scratch
+                    if breaker is not None:
+                        breaker.forget(service.id)
+                    if timeouts is not None:
+                        timeouts.forget(service.id)
+                if coordinator is not None:
+                    schedule.remove(service.id for service in updates if not coordinator.owns(service.id))
+                    updates = [service for service in updates if coordinator.owns(service.id)]
+                schedule.update(updates, now)
+
+            due = schedule.pop_due(now)
+            if breaker is not None:
+                due = [(service, scheduled_at) for service, scheduled_at in due if breaker.allow(service.id)]
+            cycle = _CycleTimer(len(due), now) if due else None
+            for service, scheduled_at in due:
+                task = asyncio.create_task(
+                    _run_check(
+                        service, scheduled_at, limiter, pinger, evaluator,
+                        health_repo, writer, collector, notifier, tracker.threshold,
+                        cycle_profiler.begin(now), probe_pool, timeouts, breaker,
+                    )
+                )
+                _in_flight.add(task)
+                task.add_done_callback(_in_flight.discard)
+                task.add_done_callback(cycle.check_done)
+
+            next_fire = schedule.next_fire_at()
+            wake_at = next_refresh if next_fire is None else min(next_fire, next_refresh)
+            waiter = asyncio.ensure_future(_catalogue_changed.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=max(0.0, wake_at - loop.time()))
+            finally:
+                waiter.cancel()
+    finally:
+        for task in list(_in_flight):
+            task.cancel()
+        await asyncio.gather(*_in_flight, return_exceptions=True)
+
+
+def notify_catalogue_changed() -> None:
+    """
+    Ask the scheduler to re-sync its schedule with the enabled services now
+    (e.g. after a service was created, enabled or disabled).
+    """
+    global _resync_requested
+    _resync_requested = True
+    _catalogue_changed.set()
 
-            # Evaluate alerts based on recent results
-            await _evaluate_alerts(
-                service_repo=service_repo,
-                health_repo=health_repo,
-                notifier=notifier,
-            )
 
-            logger.info("Completed health check cycle")
+def notify_services_changed(services: Iterable[Service]) -> None:
+    """
+    Incremental alternative to notify_catalogue_changed() when the caller knows
+    exactly which services were written: only those are (re)scheduled, and
+    disabled ones dropped, without re-reading the whole catalogue.
+    """
+    _catalogue_updates.extend(services)
+    _catalogue_changed.set()
+
+
+async def _peer_refresh_loop(coordinator: ShardCoordinator) -> None:
+    """
+    While other workers share the services, pull their latest results into
+    this worker's status snapshot every `scheduler_peer_refresh_seconds`.
+    When another worker changed the service catalogue, cached /services
+    responses are dropped and the schedule is re-synced (so e.g. a service
+    disabled there stops being checked here too).
+    """
+    refresh = RefreshPeerStatuses(
+        ThreadedServiceRepository(), ThreadedHealthCheckRepository(), status_snapshot, coordinator.owns
+    )
+    while True:
+        await asyncio.sleep(settings.scheduler_peer_refresh_seconds)
+        if not coordinator.peers:
+            continue
+        try:
+            result = await refresh.execute()
         except Exception as exc:  # noqa: BLE001
-            logger.exception("Error during health check cycle: %s", exc)
-        finally:
-            db.close()
+            logger.exception("Could not refresh results of other scheduler workers: %s", exc)
+            continue
+        if result.updated:
+            response_cache.invalidate(STATUS)
+            response_cache.invalidate_checks(result.updated)
+        if result.catalogue_changed:
+            response_cache.invalidate(SERVICES, STATUS)
+            notify_catalogue_changed()
 
-        await asyncio.sleep(interval)
+
+def get_scheduler_status() -> Dict[str, Any]:
+    loop_time = asyncio.get_running_loop().time()
+    next_fire = _schedule.next_fire_at() if _schedule is not None else None
+    breakers = _breaker.counts() if _breaker is not None else {}
+    return {
+        "scheduledServices": len(_schedule) if _schedule is not None else 0,
+        "inFlight": len(_in_flight),
+        "nextCheckInSeconds": None if next_fire is None else round(max(0.0, next_fire - loop_time), 3),
+        "lag": _lag_stats.summary(),
+        "sharding": None if _coordinator is None else {
+            "workerId": _coordinator.worker_id,
+            "shards": _coordinator.shards,
+            "ownedShards": len(_coordinator.owned),
+            "workers": _coordinator.workers,
+        },
+        "breakers": None if _breaker is None else {
+            "open": breakers[BreakerState.OPEN],
+            "halfOpen": breakers[BreakerState.HALF_OPEN],
+            "skippedChecks": _breaker.skipped,
+        },
+    }
+
+
+def _lag_quantiles():  # noqa: ANN202
+    summary = _lag_stats.summary()
+    return [
+        (("0.5",), summary["p50Ms"] / 1000),
+        (("0.95",), summary["p95Ms"] / 1000),
+        (("0.99",), summary["p99Ms"] / 1000),
+        (("1",), summary["maxMs"] / 1000),
+    ]
+
+
+metrics_registry.register(CallbackMetric(
+    "srm_scheduler_lag_seconds",
+    "How late recent checks started vs. when they were due (quantiles over the recent window).",
+    "gauge", _lag_quantiles, ("quantile",),
+))
+metrics_registry.register(CallbackMetric(
+    "srm_scheduled_services",
+    "Services in the check schedule.",
+    "gauge", lambda: [((), len(_schedule) if _schedule is not None else 0)],
+))
+metrics_registry.register(CallbackMetric(
+    "srm_checks_skipped_total",
+    "Due checks not run because the service's probe circuit breaker was open.",
+    "counter", lambda: [((), _breaker.skipped if _breaker is not None else 0)],
+))
+metrics_registry.register(CallbackMetric(
+    "srm_check_tasks",
+    "Check tasks started and not yet finished (pinging or waiting for a concurrency slot).",
+    "gauge", lambda: [((), len(_in_flight))],
+))
+metrics_registry.register(CallbackMetric(
+    "srm_write_queue_depth",
+    "Health check results waiting in the write-behind queue.",
+    "gauge", lambda: [((), _writer.pending if _writer is not None else 0)],
+))
 
 
 def start_health_check_scheduler() -> None:
@@ -127,4 +468,57 @@ def start_health_check_scheduler() -> None:
     Kick off the background health check loop.
     Should be called from FastAPI startup event.
     """
-    asyncio.create_task(health_check_loop())
+    global _scheduler_task, _writer, _coordinator, _peer_refresh_task, _probe_pool
+    if settings.health_check_write_behind:
+        _writer = HealthCheckWriter(
+            max_queue_size=settings.health_check_write_queue_size,
+            flush_interval_ms=settings.health_check_write_flush_interval_ms,
+            max_batch_size=settings.health_check_write_max_batch,
+            on_written=_checks_written,
+            on_committed=cycle_profiler.record_db_commit,
+            max_attempts=settings.health_check_write_max_attempts,
+            retry_base_seconds=settings.health_check_write_retry_base_seconds,
+            retry_max_seconds=settings.health_check_write_retry_max_seconds,
+        )
+        _writer.start()
+    alert_dispatcher.start()
+    if settings.scheduler_shards > 0:
+        _coordinator = shard_coordinator
+        _coordinator.add_listener(notify_catalogue_changed)
+        _coordinator.start()
+        _peer_refresh_task = asyncio.create_task(_peer_refresh_loop(_coordinator))
+    elif multiprocessing.parent_process() is not None:
+        # uvicorn --workers N spawns the workers as multiprocessing children
+        logger.warning(
+            "SCHEDULER_SHARDS=0 in a worker process (uvicorn --workers N?): every worker checks "
+            "every service and stores its own results; set SCHEDULER_SHARDS > 0 to split them"
+        )
+    if settings.probe_processes > 0:
+        _probe_pool = ProcessProbePool(settings.probe_processes)
+    _scheduler_task = asyncio.create_task(health_check_loop(_writer, _coordinator, _probe_pool))
+
+
+async def stop_health_check_scheduler() -> None:
+    """
+    Stop the loop, flush buffered results, persist undelivered alerts and
+    hand this worker's shards over. Should be called from FastAPI shutdown event.
+    """
+    global _scheduler_task, _writer, _coordinator, _peer_refresh_task, _probe_pool
+    for task in (_scheduler_task, _peer_refresh_task):
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    _scheduler_task = _peer_refresh_task = None
+    if _probe_pool is not None:
+        await _probe_pool.stop()
+        _probe_pool = None
+    if _writer is not None:
+        await _writer.stop()
+        _writer = None
+    await alert_dispatcher.stop()
+    if _coordinator is not None:
+        await _coordinator.stop()
+        _coordinator = None
@@ -0,0 +1,121 @@
+# app/infrastructure/scheduling/retention_job.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Optional
+
+from app.domain.services.history_resolution_policy import HistoryResolutionPolicy
+from app.infrastructure.cache.response_cache import CHECKS, response_cache
+from app.infrastructure.db.db_executor import run_in_db_thread
+from app.infrastructure.db.health_check_compactor import CompactionStats, HealthCheckCompactor
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_retention_task: Optional[asyncio.Task] = None
+
+
+def build_compactor() -> HealthCheckCompactor:
+    hour_days = settings.retention_hour_rollup_days
+    return HealthCheckCompactor(
+        raw_retention=timedelta(hours=settings.retention_raw_hours),
+        minute_retention=timedelta(days=settings.retention_minute_rollup_days),
+        hour_retention=timedelta(days=hour_days) if hour_days > 0 else None,
+        batch_size=settings.retention_batch_size,
+    )
+
+
+def raw_history_horizon() -> Optional[timedelta]:
+    """
+    How long raw checks are kept before being rolled up; None = forever.
+    """
+    return timedelta(hours=settings.retention_raw_hours) if settings.retention_enabled else None
+
+
+def history_horizon() -> Optional[timedelta]:
+    """
+    How far back any history (raw or rolled up) is kept; None = forever.
+    """
+    if not settings.retention_enabled or settings.retention_hour_rollup_days <= 0:
+        return None
+    return max(
+        timedelta(days=settings.retention_hour_rollup_days),
+        timedelta(days=settings.retention_minute_rollup_days),
+        timedelta(hours=settings.retention_raw_hours),
+    )
+
+
+def build_resolution_policy() -> HistoryResolutionPolicy:
+    return HistoryResolutionPolicy(
+        raw_retention=timedelta(hours=settings.retention_raw_hours),
+        minute_retention=timedelta(days=settings.retention_minute_rollup_days),
+    )
+
+
+async def compact_once(compactor: HealthCheckCompactor, pause_seconds: float = 0.0) -> CompactionStats:
+    """
+    One compaction pass. Each batch is its own short transaction on the DB
+    thread pool; between batches we yield (and optionally pause) so
+    health check writes and API reads aren't starved.
+    """
+    stats = CompactionStats()
+    for step in await run_in_db_thread(partial(compactor.plan, datetime.utcnow())):
+        while True:
+            started = time.perf_counter()
+            rows = await run_in_db_thread(partial(compactor.run_batch, step))
+            stats.record(step, rows, (time.perf_counter() - started) * 1000)
+            if rows < compactor.batch_size:
+                break
+            await asyncio.sleep(pause_seconds)
+    return stats
+
+
+async def retention_loop() -> None:
+    compactor = build_compactor()
+    interval = settings.retention_compaction_interval_seconds
+    pause = settings.retention_batch_pause_ms / 1000
+    logger.info("Starting health check retention job (every %s seconds)", interval)
+    while True:
+        try:
+            stats = await compact_once(compactor, pause)
+            if stats.raw_rows_folded:
+                response_cache.invalidate(CHECKS)
+            if stats.raw_rows_folded or stats.minute_rows_folded or stats.hour_rows_deleted:
+                logger.info(
+                    "Compacted health checks: %s raw rows -> 1m, %s 1m rollups -> 1h, "
+                    "%s expired 1h rollups deleted (%s batches, longest %.0f ms)",
+                    stats.raw_rows_folded, stats.minute_rows_folded, stats.hour_rows_deleted,
+                    stats.batches, stats.max_batch_ms,
+                )
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Health check compaction failed: %s", exc)
+        await asyncio.sleep(interval)
+
+
+def start_retention_job() -> None:
+    """
+    Kick off the background compaction loop (no-op if retention is disabled).
+    Should be called from FastAPI startup event.
+    """
+    global _retention_task
+    if settings.retention_enabled and _retention_task is None:
+        _retention_task = asyncio.create_task(retention_loop())
+
+
+async def stop_retention_job() -> None:
+    """
+    Should be called from FastAPI shutdown event. A batch already running on
+    the DB thread pool finishes its transaction.
+    """
+    global _retention_task
+    if _retention_task is not None:
+        _retention_task.cancel()
+        try:
+            await _retention_task
+        except asyncio.CancelledError:
+            pass
+        _retention_task = None
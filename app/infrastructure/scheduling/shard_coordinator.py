@@ -0,0 +1,172 @@
+# app/infrastructure/scheduling/shard_coordinator.py
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import socket
+import uuid
+import zlib
+from datetime import datetime, timedelta
+from typing import Callable, FrozenSet, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.domain.model.value_objects import ServiceId
+from app.infrastructure.db.base import SessionLocal
+from app.infrastructure.db.db_executor import run_with_session
+from app.infrastructure.db.scheduler_lease_repository import SQLiteSchedulerLeaseRepository
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def shard_of(service_id: ServiceId, shards: int) -> int:
+    # Salted so shard membership doesn't line up with CheckSchedule's phase hash
+    return zlib.crc32(b"shard:" + str(service_id).encode("utf-8")) % shards
+
+
+def preferred_owner(shard: int, workers: Sequence[str]) -> str:
+    """
+    Rendezvous (highest random weight) hashing: every worker computes the
+    same owner for a shard from the same live set, and a worker joining or
+    leaving only moves ~1/N of the shards.
+    """
+    return max(workers, key=lambda worker: _weight(f"{worker}/{shard}"))
+
+
+def _weight(key: str) -> int:
+    # crc32 is too linear here: similar worker ids would win runs of shards
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ShardCoordinator:
+    """
+    Splits the service set between scheduler processes (e.g. uvicorn
+    --workers N) through the shared database, so adding workers divides the
+    probing instead of multiplying it.
+    - Services are hashed into `shards` fixed shards.
+    - Every `lease_ttl / 3` seconds a worker heart-beats, computes which shards
+      it should own among the live workers (rendezvous hashing), releases
+      leases it shouldn't hold and claims/renews the ones it should.
+    - A lease is only taken over once it has expired, so two workers never
+      check the same shard at the same time while both are healthy. A worker
+      that dies stops renewing; its shards move once its heartbeat and
+      leases are `lease_ttl` old. A clean stop() hands them over at once.
+    - If renewing fails for longer than the lease lasts, the worker drops
+      all shards rather than risk checking ones someone else took over.
+    Listeners are called (on the event loop) whenever the owned set changes.
+    Lease times come from the wall clock, so workers on different hosts need
+    synchronised clocks.
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        lease_ttl_seconds: float = 15.0,
+        session_factory: Callable[[], Session] = SessionLocal,
+        worker_id: Optional[str] = None,
+    ) -> None:
+        self.shards = shards
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._ttl = lease_ttl_seconds
+        self._session_factory = session_factory
+        self._started_at = datetime.utcnow()
+        self._owned: FrozenSet[int] = frozenset()
+        self._workers: List[str] = []
+        self._valid_until = 0.0  # loop time until which the owned leases are known to hold
+        self._listeners: List[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def owned(self) -> FrozenSet[int]:
+        return self._owned
+
+    @property
+    def workers(self) -> List[str]:
+        return list(self._workers)
+
+    @property
+    def peers(self) -> int:
+        return max(0, len(self._workers) - 1)
+
+    def owns(self, service_id: ServiceId) -> bool:
+        return shard_of(service_id, self.shards) in self._owned
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await run_with_session(
+                lambda db: SQLiteSchedulerLeaseRepository(db).retire(self.worker_id), self._session_factory
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not release scheduler leases of %s: %s", self.worker_id, exc)
+        self._set_owned(frozenset())
+
+    async def renew(self) -> None:
+        """
+        One heartbeat + claim round.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        now = datetime.utcnow()
+        ttl = timedelta(seconds=self._ttl)
+        workers = await run_with_session(
+            lambda db: SQLiteSchedulerLeaseRepository(db).heartbeat(self.worker_id, self._started_at, now, now - ttl),
+            self._session_factory,
+        )
+        if self.worker_id not in workers:
+            workers = sorted(workers + [self.worker_id])
+        wanted = [shard for shard in range(self.shards) if preferred_owner(shard, workers) == self.worker_id]
+        owned = await run_with_session(
+            lambda db: SQLiteSchedulerLeaseRepository(db).claim(self.worker_id, wanted, now, now + ttl),
+            self._session_factory,
+        )
+        if workers != self._workers:
+            logger.info("Scheduler workers: %s (this one: %s)", ", ".join(workers), self.worker_id)
+        self._workers = workers
+        self._valid_until = started + self._ttl
+        self._set_owned(frozenset(owned))
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await self.renew()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Could not renew scheduler leases: %s", exc)
+                if loop.time() >= self._valid_until:
+                    self._set_owned(frozenset())
+            await asyncio.sleep(self._ttl / 3)
+
+    def _set_owned(self, owned: FrozenSet[int]) -> None:
+        if owned == self._owned:
+            return
+        gained, lost = len(owned - self._owned), len(self._owned - owned)
+        self._owned = owned
+        logger.info("Scheduler %s now owns %s/%s shards (+%s, -%s)", self.worker_id, len(owned), self.shards, gained, lost)
+        for listener in list(self._listeners):
+            listener()
+
+
+# Process-wide coordinator, started with the health check scheduler when sharding is on.
+shard_coordinator = ShardCoordinator(
+    shards=max(1, settings.scheduler_shards),
+    lease_ttl_seconds=settings.scheduler_lease_ttl_seconds,
+)
@@ -0,0 +1,53 @@
+# app/interfaces/api/admin_router.py
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.application.dto.scheduler_dto import ProfileCaptureDto, SchedulerCyclesDto, SchedulerStatusDto
+from app.infrastructure.scheduling.cycle_profiler import cycle_profiler
+from app.infrastructure.scheduling.health_check_scheduler import get_scheduler_status
+from config.settings import settings
+
+router = APIRouter()
+
+
+@router.get(
+    "/scheduler",
+    summary="Scheduler state and check lag (how late checks ran vs. when they were due)",
+    response_model=SchedulerStatusDto,
+)
+async def scheduler_status() -> SchedulerStatusDto:
+    return SchedulerStatusDto(**get_scheduler_status())
+
+
+@router.get(
+    "/scheduler/cycles",
+    summary="Phase-by-phase timing of recent scheduler cycles, with their slowest checks",
+    response_model=SchedulerCyclesDto,
+)
+async def scheduler_cycles(
+    limit: Optional[int] = Query(None, ge=1, description="Most recent cycles to return (default: all kept)"),
+) -> SchedulerCyclesDto:
+    return SchedulerCyclesDto(current=cycle_profiler.current(), recent=cycle_profiler.recent(limit))
+
+
+@router.get(
+    "/scheduler/profile",
+    summary="State of the one-shot cycle profiler",
+    response_model=ProfileCaptureDto,
+)
+async def scheduler_profile_status() -> ProfileCaptureDto:
+    return ProfileCaptureDto(**cycle_profiler.capture_status())
+
+
+@router.post(
+    "/scheduler/profile",
+    summary="Capture a cProfile of the next scheduler cycle to a .prof file",
+    response_model=ProfileCaptureDto,
+    status_code=202,
+)
+async def capture_scheduler_profile() -> ProfileCaptureDto:
+    if not settings.scheduler_profiler_enabled:
+        raise HTTPException(status_code=403, detail="Profiling is disabled (set SCHEDULER_PROFILER_ENABLED=true)")
+    cycle_profiler.capture_next()
+    return ProfileCaptureDto(**cycle_profiler.capture_status())
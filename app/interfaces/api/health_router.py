@@ -1,17 +1,34 @@
 # app/interfaces/api/health_router.py
 # from datetime import datetime
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-from app.application.dto.service_health_summary_dto import ServiceHealthSummaryDto
+from app.application.dto.service_health_summary_dto import ServiceHealthSummaryDto, StatusVersionDto
 from app.application.dto.service_details_dto import ServiceDetailsDto
-from app.application.use_cases.get_latest_health_status import GetLatestHealthStatusForAllServices
+from app.application.dto.health_history_dto import HealthHistoryDto
+from app.application.dto.health_stats_dto import HealthStatsDto
+from app.application.use_cases.get_latest_health_status import GetLatestHealthStatusFromSnapshot
 from app.application.use_cases.get_health_history_for_service import (GetHealthHistoryForService,ServiceNotFoundError)
-from app.infrastructure.db.base import get_db
-from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository
-from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+from app.application.use_cases.get_health_history_range import GetHealthHistoryRange, InvalidHistoryRangeError
+from app.application.use_cases.get_service_health_stats import GetServiceHealthStats
+from app.application.use_cases.export_health_history import ExportFormat, ExportHealthHistory
+from app.domain.model.health_check import HistoryResolution
+from app.infrastructure.cache.response_cache import CHECKS, SERVICES, STATUS, checks_tag
+from app.infrastructure.cache.status_broadcaster import status_broadcaster
+from app.infrastructure.cache.status_snapshot import status_snapshot
+from app.infrastructure.db.threaded_repositories import (
+    ThreadedHealthCheckRepository,
+    ThreadedServiceRepository,
+)
+from app.infrastructure.scheduling.retention_job import (
+    build_resolution_policy,
+    history_horizon,
+    raw_history_horizon,
+)
+from app.interfaces.api.http_cache import cached_response
 
 
 router = APIRouter()
@@ -55,14 +72,14 @@ router = APIRouter()
 #     return GetLatestHealthStatusForAllServices(service_repo, health_repo)
 
 #functions
-def get_repositories(db: Session = Depends(get_db)):
-    service_repo = SQLiteServiceRepository(db)
-    health_repo = SQLiteHealthCheckRepository(db)
+def get_repositories():
+    # DB calls run on the DB thread pool, so these async handlers never block the loop
+    service_repo = ThreadedServiceRepository()
+    health_repo = ThreadedHealthCheckRepository()
     return service_repo, health_repo
 
-def get_latest_health_use_case(repos = Depends(get_repositories)) -> GetLatestHealthStatusForAllServices:
-    service_repo, health_repo = repos
-    return GetLatestHealthStatusForAllServices(service_repo, health_repo)
+def get_latest_health_use_case() -> GetLatestHealthStatusFromSnapshot:
+    return GetLatestHealthStatusFromSnapshot(status_snapshot)
 
 def get_health_history_use_case(
     repos = Depends(get_repositories),
@@ -70,20 +87,119 @@ def get_health_history_use_case(
     service_repo, health_repo = repos
     return GetHealthHistoryForService(service_repo, health_repo)
 
+def get_health_history_range_use_case(
+    repos = Depends(get_repositories),
+) -> GetHealthHistoryRange:
+    service_repo, health_repo = repos
+    return GetHealthHistoryRange(service_repo, health_repo, build_resolution_policy())
+
+def get_service_health_stats_use_case(
+    repos = Depends(get_repositories),
+) -> GetServiceHealthStats:
+    service_repo, health_repo = repos
+    return GetServiceHealthStats(service_repo, health_repo, max_window=history_horizon())
+
+def get_export_health_history_use_case(
+    repos = Depends(get_repositories),
+) -> ExportHealthHistory:
+    service_repo, health_repo = repos
+    return ExportHealthHistory(service_repo, health_repo, raw_retention=raw_history_horizon())
+
+_EXPORT_MEDIA_TYPES = {ExportFormat.NDJSON: "application/x-ndjson", ExportFormat.CSV: "text/csv"}
+
 #routes
 @router.get("/",summary="Get latest health status for all services",response_model=List[ServiceHealthSummaryDto])
 async def get_all_health(
-    use_case: GetLatestHealthStatusForAllServices = Depends(get_latest_health_use_case),
-) -> List[ServiceHealthSummaryDto]:
-    return use_case.execute()
+    request: Request,
+    use_case: GetLatestHealthStatusFromSnapshot = Depends(get_latest_health_use_case),
+) -> Response:
+    async def build() -> List[ServiceHealthSummaryDto]:
+        return use_case.execute()
+
+    return await cached_response(request, (STATUS,), build)
+
+@router.get("/snapshot/version",summary="Version of the latest-status snapshot (changes whenever any status changes)",response_model=StatusVersionDto)
+async def get_snapshot_version() -> StatusVersionDto:
+    return StatusVersionDto(version=status_snapshot.version)
+
+@router.get(
+    "/stream",
+    summary="Live status changes as Server-Sent Events",
+    description=(
+        "A `snapshot` event with every service, then `update` events carrying only the services "
+        "whose status, latency or version changed (plus the ids of removed services)."
+    ),
+    response_class=StreamingResponse,
+)
+async def stream_health_changes() -> StreamingResponse:
+    return StreamingResponse(
+        status_broadcaster.stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @router.get("/{service_id}",summary="Get recent health history for a single service",response_model=ServiceDetailsDto)
 async def get_health_for_service(
+    request: Request,
     service_id: str,
     limit: int = Query(20, ge=1, le=100),
     use_case: GetHealthHistoryForService = Depends(get_health_history_use_case),
-) -> ServiceDetailsDto:
+) -> Response:
+    async def build() -> ServiceDetailsDto:
+        try:
+            return await use_case.execute(service_id_str=service_id, limit=limit)
+        except ServiceNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    return await cached_response(request, (SERVICES, CHECKS, checks_tag(service_id)), build)
+
+@router.get("/{service_id}/history",summary="Health history over a time range (raw, 1m or 1h buckets; auto-selected by default)",response_model=HealthHistoryDto)
+async def get_health_history_range(
+    service_id: str,
+    start: Optional[datetime] = Query(None, alias="from", description="Default: 24h before 'to'"),
+    end: Optional[datetime] = Query(None, alias="to", description="Default: now"),
+    resolution: Optional[HistoryResolution] = Query(None, description="raw, 1m or 1h; omit to pick automatically"),
+    use_case: GetHealthHistoryRange = Depends(get_health_history_range_use_case),
+) -> HealthHistoryDto:
+    try:
+        return await use_case.execute(service_id_str=service_id, start=start, end=end, resolution=resolution)
+    except ServiceNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except InvalidHistoryRangeError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+@router.get("/{service_id}/stats",summary="Latency percentiles, availability, error rate and MTTR over a window",response_model=HealthStatsDto)
+async def get_service_health_stats(
+    service_id: str,
+    window: str = Query("24h", description="Window length ending at 'to', e.g. 15m, 24h, 7d, 2w"),
+    end: Optional[datetime] = Query(None, alias="to", description="Default: now"),
+    use_case: GetServiceHealthStats = Depends(get_service_health_stats_use_case),
+) -> HealthStatsDto:
+    try:
+        return await use_case.execute(service_id_str=service_id, window=window, end=end)
+    except ServiceNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except InvalidHistoryRangeError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+@router.get("/{service_id}/export",summary="Stream raw health checks in a time range as NDJSON or CSV (keyset-paginated, constant memory)")
+async def export_health_history(
+    service_id: str,
+    start: Optional[datetime] = Query(None, alias="from", description="Default: 24h before 'to'"),
+    end: Optional[datetime] = Query(None, alias="to", description="Default: now"),
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    after: Optional[str] = Query(None, description="Resume after this record: '<timestamp>,<id>' of the last one received"),
+    use_case: ExportHealthHistory = Depends(get_export_health_history_use_case),
+) -> StreamingResponse:
     try:
-        return use_case.execute(service_id_str=service_id, limit=limit)
+        chunks = await use_case.open(service_id_str=service_id, start=start, end=end, fmt=fmt, after=after)
     except ServiceNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except InvalidHistoryRangeError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    filename = f"{service_id}-health.{fmt.value}"
+    return StreamingResponse(
+        chunks,
+        media_type=_EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
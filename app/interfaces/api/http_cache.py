@@ -0,0 +1,69 @@
+# app/interfaces/api/http_cache.py
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Sequence
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Request, Response
+from pydantic_core import to_json
+
+from app.infrastructure.cache.response_cache import ResponseCache, response_cache
+from config.settings import settings
+
+
+def cache_control() -> str:
+    max_age = settings.http_cache_max_age_seconds
+    # no-cache: clients may store the response but must revalidate (cheap with If-None-Match)
+    return f"max-age={max_age}, must-revalidate" if max_age > 0 else "no-cache"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 13.1.2): W/"x" matches "x"
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return etag in candidates
+
+
+def request_variant(request: Request) -> str:
+    """
+    Path plus the query with its parameters sorted, so '?a=1&b=2' and
+    '?b=2&a=1' share an ETag and a cache entry while other queries don't.
+    """
+    query = urlencode(sorted(parse_qsl(request.url.query, keep_blank_values=True)))
+    return f"{request.url.path}?{query}"
+
+
+async def cached_response(
+    request: Request,
+    tags: Sequence[str],
+    build: Callable[[], Awaitable[Any]],
+    render: Callable[[Any], bytes] | None = None,
+    media_type: str = "application/json",
+    cache: ResponseCache = response_cache,
+) -> Response:
+    """
+    Conditional GET over the response cache:
+    - 304 Not Modified if If-None-Match already names the current ETag,
+    - else the cached body for (path, normalized query) if the data hasn't changed,
+    - else `build()` (the endpoint's normal work), rendered once and cached.
+    Exceptions from build() (e.g. HTTPException for a 404) pass through uncached.
+    """
+    variant = request_variant(request)
+    etag = cache.etag(tags, variant)
+    headers = {"ETag": etag, "Cache-Control": cache_control()}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        cache.not_modified += 1
+        return Response(status_code=304, headers=headers)
+
+    entry = cache.get(variant, etag)
+    if entry is None:
+        result = await build()
+        # pydantic's serializer handles DTOs and lists of DTOs directly
+        body = render(result) if render is not None else to_json(result)
+        # The ETag was taken before build(); if a write landed meanwhile the
+        # entry is simply never matched again.
+        entry = cache.put(variant, etag, body, media_type)
+    return Response(content=entry.body, media_type=entry.media_type, headers=headers)
@@ -0,0 +1,16 @@
+# app/interfaces/api/metrics_router.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.infrastructure.metrics.app_metrics import metrics_registry
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    summary="Monitor's own metrics in Prometheus text exposition format",
+    response_class=PlainTextResponse,
+)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics_registry.render(), media_type=metrics_registry.CONTENT_TYPE)
@@ -0,0 +1,52 @@
+# app/interfaces/api/request_metrics.py
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.metrics.app_metrics import http_request_seconds
+
+
+class RequestMetricsMiddleware:
+    """
+    Pure ASGI middleware that records handler latency per route template
+    (e.g. /health/{service_id}, never the raw path, so label cardinality is
+    bounded by the number of routes). Latency is measured until the response
+    starts, so long-lived streams (SSE, exports) are timed like any other
+    handler rather than by how long the client stays connected.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        recorded = False
+
+        def record(status: int) -> None:
+            nonlocal recorded
+            recorded = True
+            # Routes of included routers only know their own path; FastAPI keeps
+            # the prefixed template on the effective route context.
+            route = scope.get("fastapi", {}).get("effective_route_context") or scope.get("route")
+            template = getattr(route, "path_format", None) or "unmatched"
+            http_request_seconds.labels(scope["method"], template, f"{status // 100}xx").observe(
+                time.perf_counter() - started
+            )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and not recorded:
+                record(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            if not recorded:
+                record(500)
+            raise
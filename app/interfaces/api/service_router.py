@@ -1,45 +1,56 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.application.dto.service_dto import ServiceDto, CreateServiceRequest
+from app.application.dto.service_dto import BulkCreateServicesResponse, ServiceDto, CreateServiceRequest
 from app.application.use_cases.service_list_services import ListServices
 from app.application.use_cases.service_get_details import GetServiceDetails, ServiceNotFoundError
 from app.application.use_cases.service_create import CreateService
+from app.application.use_cases.service_bulk_create import BulkCreateServices, InvalidServiceRequestError
 from app.application.use_cases.service_set_enabled import SetServiceEnabled
-from app.infrastructure.db.base import get_db
-from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository
+from app.infrastructure.cache.response_cache import SERVICES, STATUS, response_cache
+from app.infrastructure.cache.status_snapshot import status_snapshot
+from app.infrastructure.db.threaded_repositories import ThreadedServiceRepository
+from app.infrastructure.scheduling.health_check_scheduler import notify_catalogue_changed
+from app.interfaces.api.http_cache import cached_response
+from config.settings import settings
 
 router = APIRouter()
 
 
-def get_service_repo(db: Session = Depends(get_db)) -> SQLiteServiceRepository:
-    return SQLiteServiceRepository(db)
+def get_service_repo() -> ThreadedServiceRepository:
+    # DB calls run on the DB thread pool, so these async handlers never block the loop
+    return ThreadedServiceRepository()
 
 
 def get_list_services_uc(
-    repo: SQLiteServiceRepository = Depends(get_service_repo),
+    repo: ThreadedServiceRepository = Depends(get_service_repo),
 ) -> ListServices:
     return ListServices(repo)
 
 
 def get_get_details_uc(
-    repo: SQLiteServiceRepository = Depends(get_service_repo),
+    repo: ThreadedServiceRepository = Depends(get_service_repo),
 ) -> GetServiceDetails:
     return GetServiceDetails(repo)
 
 
 def get_create_service_uc(
-    repo: SQLiteServiceRepository = Depends(get_service_repo),
+    repo: ThreadedServiceRepository = Depends(get_service_repo),
 ) -> CreateService:
-    return CreateService(repo)
+    return CreateService(repo, status_snapshot)
+
+
+def get_bulk_create_services_uc(
+    repo: ThreadedServiceRepository = Depends(get_service_repo),
+) -> BulkCreateServices:
+    return BulkCreateServices(repo, status_snapshot)
 
 
 def get_set_enabled_uc(
-    repo: SQLiteServiceRepository = Depends(get_service_repo),
+    repo: ThreadedServiceRepository = Depends(get_service_repo),
 ) -> SetServiceEnabled:
-    return SetServiceEnabled(repo)
+    return SetServiceEnabled(repo, status_snapshot)
 
 
 @router.get(
@@ -48,9 +59,10 @@ def get_set_enabled_uc(
     response_model=List[ServiceDto],
 )
 async def list_services(
+    request: Request,
     use_case: ListServices = Depends(get_list_services_uc),
-) -> List[ServiceDto]:
-    return use_case.execute()
+) -> Response:
+    return await cached_response(request, (SERVICES,), use_case.execute)
 
 
 @router.get(
@@ -59,13 +71,25 @@ async def list_services(
     response_model=ServiceDto,
 )
 async def get_service(
+    request: Request,
     service_id: str,
     use_case: GetServiceDetails = Depends(get_get_details_uc),
-) -> ServiceDto:
-    try:
-        return use_case.execute(service_id_str=service_id)
-    except ServiceNotFoundError as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+) -> Response:
+    async def build() -> ServiceDto:
+        try:
+            return await use_case.execute(service_id_str=service_id)
+        except ServiceNotFoundError as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    return await cached_response(request, (SERVICES,), build)
+
+
+def _on_catalogue_changed() -> None:
+    """
+    After a service write: cached reads are stale and the scheduler must re-sync.
+    """
+    response_cache.invalidate(SERVICES, STATUS)
+    notify_catalogue_changed()
 
 
 @router.post(
@@ -78,7 +102,33 @@ async def create_service(
     req: CreateServiceRequest,
     use_case: CreateService = Depends(get_create_service_uc),
 ) -> ServiceDto:
-    return use_case.execute(req)
+    dto = await use_case.execute(req)
+    _on_catalogue_changed()
+    return dto
+
+
+@router.post(
+    ":bulk",
+    summary="Create or update many services in one transaction",
+    response_model=BulkCreateServicesResponse,
+)
+async def bulk_create_services(
+    reqs: List[CreateServiceRequest],
+    use_case: BulkCreateServices = Depends(get_bulk_create_services_uc),
+) -> BulkCreateServicesResponse:
+    # Plain 413/422: Starlette renamed these status constants, and neither
+    # spelling works without warnings on every release requirements.txt allows
+    if len(reqs) > settings.services_bulk_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.services_bulk_max_items} services per request",
+        )
+    try:
+        result = await use_case.execute(reqs)
+    except InvalidServiceRequestError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    _on_catalogue_changed()
+    return result
 
 
 @router.patch(
@@ -91,9 +141,11 @@ async def enable_service(
     use_case: SetServiceEnabled = Depends(get_set_enabled_uc),
 ) -> ServiceDto:
     try:
-        return use_case.execute(service_id_str=service_id, enabled=True)
+        dto = await use_case.execute(service_id_str=service_id, enabled=True)
     except ServiceNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    _on_catalogue_changed()
+    return dto
 
 
 @router.patch(
@@ -106,6 +158,8 @@ async def disable_service(
     use_case: SetServiceEnabled = Depends(get_set_enabled_uc),
 ) -> ServiceDto:
     try:
-        return use_case.execute(service_id_str=service_id, enabled=False)
+        dto = await use_case.execute(service_id_str=service_id, enabled=False)
     except ServiceNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    _on_catalogue_changed()
+    return dto
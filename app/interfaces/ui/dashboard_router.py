@@ -3,13 +3,12 @@ from typing import List
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
 
 from app.application.dto.service_health_summary_dto import ServiceHealthSummaryDto
-from app.application.use_cases.get_latest_health_status import GetLatestHealthStatusForAllServices
-from app.infrastructure.db.base import get_db
-from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository
-from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+from app.application.use_cases.get_latest_health_status import GetLatestHealthStatusFromSnapshot
+from app.infrastructure.cache.response_cache import STATUS
+from app.infrastructure.cache.status_snapshot import status_snapshot
+from app.interfaces.api.http_cache import cached_response
 
 router = APIRouter()
 
@@ -17,12 +16,9 @@ router = APIRouter()
 templates = Jinja2Templates(directory="app/interfaces/ui/templates")
 
 
-def get_latest_health_use_case(
-    db: Session = Depends(get_db),
-) -> GetLatestHealthStatusForAllServices:
-    service_repo = SQLiteServiceRepository(db)
-    health_repo = SQLiteHealthCheckRepository(db)
-    return GetLatestHealthStatusForAllServices(service_repo, health_repo)
+def get_latest_health_use_case() -> GetLatestHealthStatusFromSnapshot:
+    # Served from the in-memory snapshot; no DB access per page view.
+    return GetLatestHealthStatusFromSnapshot(status_snapshot)
 
 
 @router.get(
@@ -32,13 +28,19 @@ def get_latest_health_use_case(
 )
 async def dashboard(
     request: Request,
-    use_case: GetLatestHealthStatusForAllServices = Depends(get_latest_health_use_case),
+    use_case: GetLatestHealthStatusFromSnapshot = Depends(get_latest_health_use_case),
 ):
-    services: List[ServiceHealthSummaryDto] = use_case.execute()
-    return templates.TemplateResponse(
-        "dashboard.html",
-        {
-            "request": request,
-            "services": services,
-        },
-    )
+    async def build() -> List[ServiceHealthSummaryDto]:
+        return use_case.execute()
+
+    def render(services: List[ServiceHealthSummaryDto]) -> bytes:
+        return templates.TemplateResponse(
+            request,
+            "dashboard.html",
+            {
+                "services": services,
+            },
+        ).body
+
+    # Rendered once per data version, however many viewers load the page
+    return await cached_response(request, (STATUS,), build, render, media_type="text/html; charset=utf-8")
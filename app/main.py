@@ -1,14 +1,29 @@
 # app/main.py
 from fastapi import FastAPI
 
+from app.interfaces.api.admin_router import router as admin_router
 from app.interfaces.api.health_router import router as health_router
+from app.interfaces.api.metrics_router import router as metrics_router
+from app.interfaces.api.request_metrics import RequestMetricsMiddleware
 from app.interfaces.api.service_router import router as service_router
 from app.interfaces.ui.dashboard_router import router as dashboard_router
-from app.infrastructure.db.base import Base, engine, SessionLocal
-from app.infrastructure.scheduling.health_check_scheduler import start_health_check_scheduler
+from app.infrastructure.db.base import engine, SessionLocal
+from app.infrastructure.db.db_executor import shutdown_db_executor
+from app.infrastructure.db.migrations import run_migrations
+from app.infrastructure.http.http_client import start_http_client, close_http_client
+from app.infrastructure.scheduling.health_check_scheduler import (
+    start_health_check_scheduler,
+    stop_health_check_scheduler,
+)
+from app.infrastructure.scheduling.retention_job import start_retention_job, stop_retention_job
+from app.infrastructure.scheduling.config_reload_job import start_config_reload_job, stop_config_reload_job
 from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository
 from app.infrastructure.config.service_config_loader import ServiceConfigLoader
 from app.application.use_cases.initialize_services_from_config import InitializeServicesFromConfig
+from app.application.use_cases.warm_status_snapshot import WarmStatusSnapshot
+from app.infrastructure.cache.status_broadcaster import status_broadcaster
+from app.infrastructure.cache.status_snapshot import status_snapshot
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
 from config.settings import settings
 
 def service_reliability_app() -> FastAPI:
@@ -18,28 +33,50 @@ def service_reliability_app() -> FastAPI:
         description="Lightweight service reliability monitor.",
     )
 
-    # Create DB tables on startup (for MVP; you can move to migrations later)
+    # Create DB tables / apply pending schema migrations on startup
     @app.on_event("startup")
     async def on_startup():
-        Base.metadata.create_all(bind=engine)
+        run_migrations(engine)
+        start_http_client()
 
         db = SessionLocal()
         try:
             service_repo = SQLiteServiceRepository(db)
             loader = ServiceConfigLoader(settings.services_config_path)
             init_uc = InitializeServicesFromConfig(service_repo, loader)
-            init_uc.execute()
+            seeded = init_uc.execute()
+
+            # Serve /health and the dashboard from memory from the first request on
+            warm_uc = WarmStatusSnapshot(service_repo, SQLiteHealthCheckRepository(db), status_snapshot)
+            warm_uc.execute()
         finally:
             db.close()
 
+        status_broadcaster.start()
         start_health_check_scheduler()
+        start_retention_job()
+        start_config_reload_job(seeded)
+
+    @app.on_event("shutdown")
+    async def on_shutdown():
+        await stop_config_reload_job()
+        await stop_retention_job()
+        await stop_health_check_scheduler()
+        await status_broadcaster.stop()
+        await close_http_client()
+        shutdown_db_executor()
 
     # Routers
     app.include_router(health_router, prefix="/health", tags=["health"])
     app.include_router(service_router, prefix="/services", tags=["services"])
+    app.include_router(admin_router, prefix="/admin", tags=["admin"])
 
     app.include_router(dashboard_router, tags=["dashboard"])
 
+    if settings.metrics_enabled:
+        app.include_router(metrics_router, tags=["metrics"])
+        app.add_middleware(RequestMetricsMiddleware)
+
     @app.get("/ping")
     async def ping():
         return {"status": "ok"}
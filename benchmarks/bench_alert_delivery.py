@@ -0,0 +1,205 @@
+# benchmarks/bench_alert_delivery.py
+"""
+Alert webhook delivery: inline POSTs vs the background AlertDispatcher.
+
+A local webhook stub answers after --webhook-ms. For an outage that takes
+down --alerts services at once it reports:
+- inline:     the old behaviour, one new client and one awaited POST per alert
+              (what the check cycle used to wait for),
+- dispatcher: time spent raising the alerts (what the check cycle waits for
+              now), then how long until all were delivered and in how many POSTs.
+and checks that:
+- a webhook that fails the first attempts still gets every alert (retry with backoff),
+- alerts still in the outbox when the dispatcher stops are delivered by the
+  next one (survive restarts).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_alert_delivery --alerts 200 --webhook-ms 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import List
+
+_tmp = tempfile.TemporaryDirectory()
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'alerts.db')}"
+
+import httpx  # noqa: E402
+
+from app.domain.model.health_check import HealthCheckResult  # noqa: E402
+from app.domain.model.service import Service  # noqa: E402
+from app.domain.model.value_objects import Environment, HealthStatus, ServiceId  # noqa: E402
+from app.infrastructure.alerting.alert_dispatcher import AlertDispatcher  # noqa: E402
+from app.infrastructure.alerting.alert_notifier import AlertNotifier  # noqa: E402
+from app.infrastructure.db.base import engine  # noqa: E402
+from app.infrastructure.db.migrations import run_migrations  # noqa: E402
+
+
+class WebhookStub:
+    """
+    Records POSTed batches; answers 500 while `failures_left` > 0.
+    """
+
+    def __init__(self, latency_ms: float) -> None:
+        self.latency = latency_ms / 1000
+        self.failures_left = 0
+        self.posts = 0
+        self.alerts: List[dict] = []
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                if not await reader.readline():
+                    return
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                body = await reader.readexactly(length)
+                await asyncio.sleep(self.latency)
+                self.posts += 1
+                if self.failures_left > 0:
+                    self.failures_left -= 1
+                    status = b"500 Internal Server Error"
+                else:
+                    status = b"200 OK"
+                    payload = json.loads(body)
+                    self.alerts.extend(payload["alerts"] if "alerts" in payload else [payload])
+                writer.write(b"HTTP/1.1 " + status + b"\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _service(n: int) -> Service:
+    return Service(
+        id=ServiceId(f"svc-{n}"), name=f"Service {n}", url=f"http://svc-{n}.invalid",
+        environment=Environment.PRODUCTION, expected_version=None,
+    )
+
+
+def _down(service: Service) -> List[HealthCheckResult]:
+    return [HealthCheckResult(service.id, datetime.utcnow(), HealthStatus.DOWN, None, None, None)]
+
+
+def _dispatcher(url: str, **overrides) -> AlertDispatcher:  # noqa: ANN003
+    params = dict(batch_window_ms=200, batch_max_size=100, timeout_seconds=5.0,
+                  retry_base_seconds=0.2, retry_max_seconds=1.0, max_attempts=10)
+    params.update(overrides)
+    return AlertDispatcher(webhook_url=url, **params)
+
+
+async def _wait_for(condition, timeout: float) -> float:  # noqa: ANN001
+    started = time.perf_counter()
+    while not condition():
+        if time.perf_counter() - started > timeout:
+            raise TimeoutError("condition not met in time")
+        await asyncio.sleep(0.01)
+    return time.perf_counter() - started
+
+
+def _outbox_rows() -> int:
+    conn = sqlite3.connect(engine.url.database)
+    try:
+        return conn.execute("SELECT count(*) FROM alert_outbox WHERE dead = 0").fetchone()[0]
+    finally:
+        conn.close()
+
+
+async def _run(args: argparse.Namespace) -> List[str]:
+    stub = WebhookStub(args.webhook_ms)
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/hook"
+    services = [_service(n) for n in range(args.alerts)]
+    problems: List[str] = []
+
+    # Inline: what service_down_repeatedly used to do for each alert
+    started = time.perf_counter()
+    for service in services:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            await client.post(url, content=json.dumps({"serviceId": str(service.id)}))
+    inline = time.perf_counter() - started
+    stub.alerts.clear()
+    stub.posts = 0
+
+    # Dispatcher: the check cycle only pays for enqueue()
+    dispatcher = _dispatcher(url)
+    notifier = AlertNotifier(dispatcher)
+    dispatcher.start()
+    started = time.perf_counter()
+    for service in services:
+        notifier.service_down_repeatedly(service, _down(service), 3)
+    raise_ms = 1000 * (time.perf_counter() - started)
+    delivered_in = await _wait_for(lambda: len(stub.alerts) >= args.alerts, 30)
+    print(f"{args.alerts} alerts, webhook answering in {args.webhook_ms:.0f} ms:")
+    print(f"  inline      {inline * 1000:9.1f} ms blocking the check cycle ({args.alerts} POSTs)")
+    print(f"  dispatcher  {raise_ms:9.2f} ms blocking the check cycle; all delivered after "
+          f"{delivered_in * 1000:.0f} ms in {stub.posts} POST(s)")
+    if stub.posts > -(-args.alerts // 100):
+        problems.append(f"expected at most {-(-args.alerts // 100)} POSTs, got {stub.posts}")
+
+    # Retry: the webhook fails the next attempts, every alert still arrives once it recovers
+    stub.alerts.clear()
+    stub.failures_left = 3
+    for service in services[:10]:
+        notifier.service_down_repeatedly(service, _down(service), 3)
+    retried_in = await _wait_for(lambda: len(stub.alerts) >= 10, 30)
+    print(f"\nwebhook failing 3 attempts: 10 alerts delivered after {retried_in * 1000:.0f} ms")
+    await dispatcher.stop()
+
+    # Restart: stop while alerts sit in the outbox (inside the batch window,
+    # before any delivery); the next dispatcher delivers them
+    stub.alerts.clear()
+    dispatcher = _dispatcher(url, batch_window_ms=5_000)
+    notifier = AlertNotifier(dispatcher)
+    dispatcher.start()
+    for service in services[:25]:
+        notifier.service_down_repeatedly(service, _down(service), 3)
+    await _wait_for(lambda: _outbox_rows() == 25, 10)
+    await dispatcher.stop()
+    pending = _outbox_rows()
+    dispatcher = _dispatcher(url)
+    dispatcher.start()
+    restarted_in = await _wait_for(lambda: len(stub.alerts) >= 25, 30)
+    await dispatcher.stop()
+    print(f"restart: {pending} alerts left in the outbox, delivered {restarted_in * 1000:.0f} ms "
+          f"after the next start; outbox now holds {_outbox_rows()}")
+    if pending != 25 or _outbox_rows() != 0:
+        problems.append(f"restart delivery: {pending} pending before, {_outbox_rows()} after")
+
+    server.close()
+    await server.wait_closed()
+    return problems
+
+
+def main() -> int:
+    logging.getLogger("app.infrastructure.alerting.alert_notifier").setLevel(logging.ERROR)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alerts", type=int, default=200)
+    parser.add_argument("--webhook-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    run_migrations(engine)
+    problems = asyncio.run(_run(args))
+    engine.dispose()
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
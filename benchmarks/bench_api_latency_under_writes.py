@@ -0,0 +1,149 @@
+# benchmarks/bench_api_latency_under_writes.py
+"""
+API latency while the scheduler is writing heavily.
+
+Drives GET /services and GET /health/{id} through the ASGI app in the same
+event loop as a write load, and reports p50/p99 for:
+- idle:             no writes
+- writes on loop:   synchronous per-row commits on the event loop (the old behaviour)
+- writes off loop:  HealthCheckWriter batches on the DB thread pool (current path)
+
+Usage (from the repo root):
+    python -m benchmarks.bench_api_latency_under_writes --requests 300 --write-rows 20000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from typing import List
+
+_tmp = tempfile.TemporaryDirectory()
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'api_latency.db')}"
+# Measure the reads themselves, not response cache hits
+os.environ["RESPONSE_CACHE_MAX_ENTRIES"] = "0"
+
+import httpx  # noqa: E402
+
+from app.domain.model.health_check import HealthCheckResult  # noqa: E402
+from app.domain.model.service import Service  # noqa: E402
+from app.domain.model.value_objects import HealthStatus, ServiceId  # noqa: E402
+from app.infrastructure.db.base import SessionLocal, engine  # noqa: E402
+from app.infrastructure.db.health_check_writer import HealthCheckWriter  # noqa: E402
+from app.infrastructure.db.migrations import run_migrations  # noqa: E402
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository  # noqa: E402
+from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository  # noqa: E402
+from app.main import service_reliability_app  # noqa: E402
+
+SERVICES = 200
+
+
+def _results(n: int) -> List[HealthCheckResult]:
+    now = datetime.utcnow()
+    return [
+        HealthCheckResult(
+            service_id=ServiceId(f"svc-{i % SERVICES}"),
+            timestamp=now,
+            status=HealthStatus.UP,
+            latency_ms=i % 300,
+            version=None,
+            version_matches_expected=None,
+        )
+        for i in range(n)
+    ]
+
+
+def _seed() -> None:
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        SQLiteServiceRepository(db).save_or_update_many(
+            Service.from_primitives(f"svc-{i}", f"Service {i}", f"http://svc-{i}.invalid/health", None, "dev")
+            for i in range(SERVICES)
+        )
+        SQLiteHealthCheckRepository(db).save_many(_results(SERVICES * 50))
+    finally:
+        db.close()
+
+
+async def _measure(client: httpx.AsyncClient, requests: int) -> List[float]:
+    latencies = []
+    for i in range(requests):
+        path = "/services/" if i % 2 else f"/health/svc-{i % SERVICES}?limit=20"
+        start = time.perf_counter()
+        response = await client.get(path)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return latencies
+
+
+async def _writes_on_loop(rows: int, stop: asyncio.Event) -> None:
+    db = SessionLocal()
+    repo = SQLiteHealthCheckRepository(db)
+    try:
+        for result in _results(rows):
+            if stop.is_set():
+                return
+            repo.save(result)  # blocking commit on the event loop
+            await asyncio.sleep(0)
+    finally:
+        db.close()
+
+
+async def _writes_off_loop(rows: int, stop: asyncio.Event) -> None:
+    writer = HealthCheckWriter(max_batch_size=500, flush_interval_ms=50)
+    writer.start()
+    try:
+        for result in _results(rows):
+            if stop.is_set():
+                break
+            await writer.put(result)
+    finally:
+        await writer.stop()
+
+
+def _report(name: str, latencies: List[float]) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+    print(f"  {name:<16} p50 {statistics.median(ordered):8.2f} ms   p99 {p99:8.2f} ms   max {ordered[-1]:8.2f} ms")
+
+
+async def main_async(requests: int, write_rows: int) -> None:
+    app = service_reliability_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await _measure(client, 20)  # warm-up
+        _report("idle", await _measure(client, requests))
+
+        for name, load in (("writes on loop", _writes_on_loop), ("writes off loop", _writes_off_loop)):
+            stop = asyncio.Event()
+            load_task = asyncio.create_task(load(write_rows, stop))
+            await asyncio.sleep(0.05)
+            latencies = await _measure(client, requests)
+            stop.set()
+            await load_task
+            _report(name, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--write-rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    _seed()
+    print(f"{SERVICES} services, {args.requests} requests per scenario")
+    try:
+        asyncio.run(main_async(args.requests, args.write_rows))
+    finally:
+        engine.dispose()
+        _tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
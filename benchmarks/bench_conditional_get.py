@@ -0,0 +1,177 @@
+# benchmarks/bench_conditional_get.py
+"""
+Read API cost with the response cache and conditional GETs.
+
+Seeds --services services with --checks checks each, warms the status
+snapshot, then drives GET /health, /health/{id}, /services and the dashboard
+through the ASGI app and reports the median time per request for:
+- uncached:  response cache disabled, no If-None-Match (every request does the full work)
+- cached:    body served from the response cache (200)
+- 304:       client sends the ETag it already has (no body)
+and checks that:
+- a repeated request with If-None-Match gets 304 with an empty body,
+- a write invalidates exactly what it should: a check landing for one
+  service changes /health and that service's /health/{id} ETag, but not
+  another service's; a catalogue write changes /services,
+- a write the process never sees (straight to the DB, like another worker
+  or a script) is served, under a new ETag, once RESPONSE_CACHE_TTL_SECONDS
+  has passed.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_conditional_get --services 500 --checks 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_tmp = tempfile.TemporaryDirectory()
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'conditional_get.db')}"
+os.environ["SERVICES_CONFIG_PATH"] = os.path.join(_tmp.name, "none.json")
+
+import httpx  # noqa: E402
+
+from app.application.use_cases.warm_status_snapshot import WarmStatusSnapshot  # noqa: E402
+from app.infrastructure.cache.response_cache import STATUS, response_cache  # noqa: E402
+from app.infrastructure.cache.status_snapshot import status_snapshot  # noqa: E402
+from app.infrastructure.db.base import SessionLocal, engine  # noqa: E402
+from app.infrastructure.db.migrations import run_migrations  # noqa: E402
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository  # noqa: E402
+from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository  # noqa: E402
+from app.main import service_reliability_app  # noqa: E402
+
+TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"  # how SQLAlchemy stores DateTime in SQLite
+
+
+def _seed(services: int, checks: int) -> None:
+    run_migrations(engine)
+    conn = sqlite3.connect(engine.url.database)
+    conn.executemany(
+        "INSERT INTO services (id, name, url, environment, expected_version, enabled) VALUES (?, ?, ?, 'production', '1.0.0', 1)",
+        [(f"svc-{i}", f"Service {i}", f"http://svc-{i}.invalid") for i in range(services)],
+    )
+    now = datetime.utcnow()
+    conn.executemany(
+        "INSERT INTO health_checks (service_id, timestamp, status, latency_ms, version, version_matches_expected) "
+        "VALUES (?, ?, 'UP', ?, '1.0.0', 1)",
+        [
+            (f"svc-{i}", (now - timedelta(seconds=60 * c)).strftime(TS_FORMAT), 20 + c % 50)
+            for i in range(services)
+            for c in range(checks)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    db = SessionLocal()
+    try:
+        WarmStatusSnapshot(SQLiteServiceRepository(db), SQLiteHealthCheckRepository(db), status_snapshot).execute()
+    finally:
+        db.close()
+
+
+async def _median_ms(client: httpx.AsyncClient, path: str, repeat: int, headers=None) -> float:
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        response = await client.get(path, headers=headers or {})
+        timings.append((time.perf_counter() - t0) * 1000)
+        assert response.status_code in (200, 304), (path, response.status_code)
+    return statistics.median(timings)
+
+
+async def _run(repeat: int) -> list:
+    problems = []
+    transport = httpx.ASGITransport(app=service_reliability_app())
+    ttl = response_cache._ttl
+    response_cache._ttl = 3600.0  # no TTL rollover while timing and comparing ETags
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        paths = ["/health/", "/health/svc-1", "/services/", "/"]
+        for path in paths:
+            max_entries = response_cache._max_entries
+            response_cache._max_entries = 0  # bodies aren't stored: every request does the full work
+            uncached = await _median_ms(client, path, repeat)
+            response_cache._max_entries = max_entries
+            await client.get(path)  # fill
+            cached = await _median_ms(client, path, repeat)
+            etag = (await client.get(path)).headers["etag"]
+            not_modified = await _median_ms(client, path, repeat, {"If-None-Match": etag})
+            print(
+                f"  {path:<14} uncached {uncached:7.2f} ms   cached {cached:6.2f} ms "
+                f"({uncached / cached:4.1f}x)   304 {not_modified:6.2f} ms ({uncached / not_modified:4.1f}x)"
+            )
+
+        # Conditional GET semantics
+        first = await client.get("/health/svc-1")
+        again = await client.get("/health/svc-1", headers={"If-None-Match": first.headers["etag"]})
+        if again.status_code != 304 or again.content:
+            problems.append(f"If-None-Match with the current ETag gave {again.status_code}, {len(again.content)} bytes")
+        if "cache-control" not in again.headers:
+            problems.append("304 without Cache-Control")
+
+        # Invalidation: a check landing for svc-1 (what the scheduler does)
+        before = {p: (await client.get(p)).headers["etag"] for p in ("/health/", "/health/svc-1", "/health/svc-2", "/services/")}
+        response_cache.invalidate(STATUS)
+        response_cache.invalidate_checks(["svc-1"])
+        after = {p: (await client.get(p)).headers["etag"] for p in before}
+        expected_changed = {"/health/", "/health/svc-1"}
+        changed = {p for p in before if before[p] != after[p]}
+        if changed != expected_changed:
+            problems.append(f"check for svc-1 changed ETags of {sorted(changed)}, expected {sorted(expected_changed)}")
+
+        # A catalogue write through the API
+        services_etag = (await client.get("/services/")).headers["etag"]
+        response = await client.patch("/services/svc-3/disable")
+        response.raise_for_status()
+        listed = await client.get("/services/", headers={"If-None-Match": services_etag})
+        if listed.status_code != 200:
+            problems.append(f"/services after a disable answered {listed.status_code} to the old ETag")
+
+        # A write this process never sees: only the TTL backstop can expose it
+        response_cache._ttl = 0.5
+        services_etag = (await client.get("/services/svc-4")).headers["etag"]
+        conn = sqlite3.connect(engine.url.database)
+        conn.execute("UPDATE services SET name = 'Renamed elsewhere' WHERE id = 'svc-4'")
+        conn.commit()
+        conn.close()
+        await asyncio.sleep(0.6)
+        revalidated = await client.get("/services/svc-4", headers={"If-None-Match": services_etag})
+        if revalidated.status_code != 200 or "Renamed elsewhere" not in revalidated.text:
+            problems.append(
+                f"external write still hidden after the TTL: {revalidated.status_code} to the old ETag"
+            )
+    response_cache._ttl = ttl
+    print(f"  cache: {response_cache.stats()}")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=500)
+    parser.add_argument("--checks", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    try:
+        _seed(args.services, args.checks)
+        problems = asyncio.run(_run(args.repeat))
+    finally:
+        engine.dispose()
+        _tmp.cleanup()
+
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
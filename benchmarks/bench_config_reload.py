@@ -0,0 +1,219 @@
+# benchmarks/bench_config_reload.py
+"""
+Hot reload of a large services.json: cost per poll and event-loop stalls.
+
+Writes a --services entry config file, seeds it like startup does, then:
+- no-change poll: stat only, per poll,
+- touch:          mtime changes but the contents don't (hash check, nothing applied),
+- edit:           --edits services changed, added and removed each, applied incrementally
+                  while a ticker measures the longest event-loop stall,
+- full reload:    the old way, every service upserted from the file on the loop, for reference,
+and checks that:
+- the diff has exactly the edited services and the DB matches (removed ones disabled),
+- services the edit didn't touch keep their slot in the CheckSchedule,
+- the loop never stalls longer than --max-stall-ms during the incremental reload.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_config_reload --services 10000 --edits 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+_tmp = tempfile.TemporaryDirectory()
+_config = os.path.join(_tmp.name, "services.json")
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'config_reload.db')}"
+os.environ["SERVICES_CONFIG_PATH"] = _config
+
+from app.application.use_cases.apply_service_catalogue_diff import ApplyServiceCatalogueDiff  # noqa: E402
+from app.application.use_cases.initialize_services_from_config import InitializeServicesFromConfig  # noqa: E402
+from app.infrastructure.cache.status_snapshot import status_snapshot  # noqa: E402
+from app.infrastructure.config.service_config_loader import ServiceConfigLoader  # noqa: E402
+from app.infrastructure.config.service_config_watcher import (  # noqa: E402
+    ServiceConfigUnavailableError,
+    ServiceConfigWatcher,
+)
+from app.infrastructure.db.base import SessionLocal, engine  # noqa: E402
+from app.infrastructure.db.migrations import run_migrations  # noqa: E402
+from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository  # noqa: E402
+from app.infrastructure.db.threaded_repositories import ThreadedServiceRepository  # noqa: E402
+from app.infrastructure.scheduling import health_check_scheduler  # noqa: E402
+from app.infrastructure.scheduling.check_schedule import CheckSchedule  # noqa: E402
+from app.infrastructure.scheduling.config_reload_job import ServiceConfigReloader  # noqa: E402
+
+
+def _entry(n: int, version: str = "1.0.0") -> Dict:
+    return {
+        "id": f"svc-{n}", "name": f"Service {n}", "url": f"http://svc-{n}.invalid/health",
+        "expectedVersion": version, "environment": "production", "enabled": True,
+    }
+
+
+def _write(entries: List[Dict]) -> None:
+    with open(_config, "w", encoding="utf-8") as f:
+        json.dump({"services": entries}, f, indent=2)
+
+
+class StallMeter:
+    """
+    Ticks every millisecond on the loop and keeps the longest gap.
+    """
+
+    def __init__(self) -> None:
+        self.max_gap = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _tick(self) -> None:
+        loop = asyncio.get_running_loop()
+        last = loop.time()
+        while True:
+            await asyncio.sleep(0.001)
+            now = loop.time()
+            self.max_gap = max(self.max_gap, now - last - 0.001)
+            last = now
+
+    async def __aenter__(self) -> "StallMeter":
+        self._task = asyncio.create_task(self._tick())
+        await asyncio.sleep(0.01)
+        self.max_gap = 0.0
+        return self
+
+    async def __aexit__(self, *exc) -> None:  # noqa: ANN002
+        self._task.cancel()
+
+
+def _db_counts() -> tuple:
+    conn = sqlite3.connect(engine.url.database)
+    try:
+        return conn.execute("SELECT count(*), sum(enabled = 0) FROM services").fetchone()
+    finally:
+        conn.close()
+
+
+async def _run(args: argparse.Namespace) -> List[str]:
+    problems: List[str] = []
+    count, edits = args.services, args.edits
+    entries = [_entry(n) for n in range(count)]
+    _write(entries)
+
+    db = SessionLocal()
+    try:
+        seeded = InitializeServicesFromConfig(SQLiteServiceRepository(db), ServiceConfigLoader(_config)).execute()
+    finally:
+        db.close()
+    repo = ThreadedServiceRepository()
+    loop = asyncio.get_running_loop()
+    schedule = CheckSchedule(60)
+    schedule.sync(await repo.find_all_enabled(), loop.time())
+    due_before = {sid: entry.base_due for sid, entry in schedule._entries.items()}
+
+    watcher = ServiceConfigWatcher(_config)
+    reloader = ServiceConfigReloader(watcher, ApplyServiceCatalogueDiff(repo, status_snapshot), seeded)
+    if await reloader.reload() is not None:
+        problems.append("first poll of the seeded file applied a diff")
+
+    started = time.perf_counter()
+    for _ in range(1_000):
+        watcher.poll()
+    poll_us = (time.perf_counter() - started) * 1_000
+
+    os.utime(_config, None)
+    os.utime(_config, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+    await reloader.reload()  # sees the new mtime; acts once it is stable on the next poll
+    started = time.perf_counter()
+    touched = await reloader.reload()
+    touch_ms = (time.perf_counter() - started) * 1000
+    if touched is not None:
+        problems.append("touching the file applied a diff")
+
+    # Edit: bump the version of the first `edits`, drop the last `edits`, add `edits` new ones
+    edited = [_entry(n, "2.0.0") for n in range(edits)] + entries[edits:count - edits]
+    edited += [_entry(count + n) for n in range(edits)]
+    _write(edited)
+    if await reloader.reload() is not None:
+        problems.append("an edit was applied before the file had settled")
+    async with StallMeter() as meter:
+        started = time.perf_counter()
+        diff = await reloader.reload()
+        # What the scheduler loop does with the services the reload announced
+        schedule.update(health_check_scheduler._catalogue_updates, loop.time())
+        health_check_scheduler._catalogue_updates.clear()
+        edit_ms = (time.perf_counter() - started) * 1000
+    edit_stall = meter.max_gap * 1000
+
+    if diff is None or (len(diff.added), len(diff.changed), len(diff.removed)) != (edits, edits, edits):
+        got = None if diff is None else (len(diff.added), len(diff.changed), len(diff.removed))
+        problems.append(f"diff (added, changed, removed) = {got}, expected ({edits}, {edits}, {edits})")
+    if _db_counts() != (count + edits, edits):
+        problems.append(f"DB (rows, disabled) = {_db_counts()}, expected ({count + edits}, {edits})")
+    moved = sum(
+        1 for sid, entry in schedule._entries.items()
+        if sid in due_before and entry.base_due != due_before[sid]
+    )
+    if moved or len(schedule) != count:
+        problems.append(f"{moved} untouched services were rescheduled; {len(schedule)} scheduled, expected {count}")
+    if edit_stall > args.max_stall_ms:
+        problems.append(f"incremental reload stalled the loop for {edit_stall:.1f} ms (max {args.max_stall_ms} ms)")
+
+    # Reference: the old startup path, a full upsert from the file, run on the loop
+    async with StallMeter() as meter:
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            InitializeServicesFromConfig(SQLiteServiceRepository(db), ServiceConfigLoader(_config)).execute()
+        finally:
+            db.close()
+        full_ms = (time.perf_counter() - started) * 1000
+        await asyncio.sleep(0.01)
+    full_stall = meter.max_gap * 1000
+
+    # An editor truncating the file mid-save, then the file going away: nothing may be disabled
+    rows_before = _db_counts()
+    size_mb = os.path.getsize(_config) / 1e6
+    for mutate in (lambda: open(_config, "w").close(), lambda: os.remove(_config)):
+        mutate()
+        for _ in range(2):
+            try:
+                if await reloader.reload() is not None:
+                    problems.append("an empty or missing file was applied")
+            except ServiceConfigUnavailableError:
+                pass
+    if _db_counts() != rows_before:
+        problems.append(f"DB (rows, disabled) = {_db_counts()} after emptying the file, expected {rows_before}")
+
+    print(f"{count} services in {_config} ({size_mb:.1f} MB):")
+    print(f"  no-change poll    {poll_us:9.1f} µs per poll")
+    print(f"  touch             {touch_ms:9.1f} ms (read + hash, nothing applied)")
+    print(f"  edit              {edit_ms:9.1f} ms for {edits} added / {edits} changed / {edits} removed; "
+          f"longest loop stall {edit_stall:.1f} ms")
+    print(f"  full reload       {full_ms:9.1f} ms on the loop; longest loop stall {full_stall:.1f} ms")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=10_000)
+    parser.add_argument("--edits", type=int, default=100)
+    parser.add_argument("--max-stall-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    run_migrations(engine)
+    problems = asyncio.run(_run(args))
+    engine.dispose()
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
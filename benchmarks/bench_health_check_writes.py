@@ -0,0 +1,117 @@
+# benchmarks/bench_health_check_writes.py
+"""
+Compare health check write throughput (rows/sec):
+- per-row:      SQLiteHealthCheckRepository.save (one commit per row)
+- save_many:    one multi-row insert per batch
+- write-behind: HealthCheckWriter fed with put() and flushed per "cycle"
+
+Usage (from the repo root):
+    python -m benchmarks.bench_health_check_writes --rows 5000 --batch 500
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.value_objects import HealthStatus, ServiceId
+from app.infrastructure.db.base import Base
+from app.infrastructure.db import models  # noqa: F401
+from app.infrastructure.db.health_check_writer import HealthCheckWriter
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+
+
+def _results(n: int, services: int = 500) -> List[HealthCheckResult]:
+    now = datetime.utcnow()
+    return [
+        HealthCheckResult(
+            service_id=ServiceId(f"svc-{i % services}"),
+            timestamp=now,
+            status=HealthStatus.UP if i % 10 else HealthStatus.DOWN,
+            latency_ms=i % 300,
+            version=None,
+            version_matches_expected=None,
+            connect_ms=0,
+        )
+        for i in range(n)
+    ]
+
+
+def _session_factory(path: str):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def bench_per_row(path: str, results: List[HealthCheckResult]) -> float:
+    engine, factory = _session_factory(path)
+    db = factory()
+    repo = SQLiteHealthCheckRepository(db)
+    start = time.perf_counter()
+    for r in results:
+        repo.save(r)
+    elapsed = time.perf_counter() - start
+    db.close()
+    engine.dispose()
+    return elapsed
+
+
+def bench_save_many(path: str, results: List[HealthCheckResult], batch: int) -> float:
+    engine, factory = _session_factory(path)
+    db = factory()
+    repo = SQLiteHealthCheckRepository(db)
+    start = time.perf_counter()
+    for i in range(0, len(results), batch):
+        repo.save_many(results[i:i + batch])
+    elapsed = time.perf_counter() - start
+    db.close()
+    engine.dispose()
+    return elapsed
+
+
+async def _bench_writer(path: str, results: List[HealthCheckResult], batch: int) -> float:
+    engine, factory = _session_factory(path)
+    writer = HealthCheckWriter(session_factory=factory, max_queue_size=batch * 2, max_batch_size=batch)
+    writer.start()
+    start = time.perf_counter()
+    for i in range(0, len(results), batch):
+        for r in results[i:i + batch]:
+            await writer.put(r)
+        await writer.flush()  # end of "cycle"
+    await writer.stop()
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--batch", type=int, default=500, help="rows per cycle / flush")
+    args = parser.parse_args()
+
+    results = _results(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = {
+            "per-row commit": bench_per_row(os.path.join(tmp, "per_row.db"), results),
+            "save_many": bench_save_many(os.path.join(tmp, "save_many.db"), results, args.batch),
+            "write-behind": asyncio.run(_bench_writer(os.path.join(tmp, "writer.db"), results, args.batch)),
+        }
+
+    print(f"{args.rows} rows, batch={args.batch}")
+    baseline = args.rows / timings["per-row commit"]
+    for name, elapsed in timings.items():
+        rate = args.rows / elapsed
+        print(f"  {name:<16} {elapsed:8.3f}s  {rate:12,.0f} rows/sec  ({rate / baseline:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# benchmarks/bench_history_export.py
+"""
+Memory and throughput of the streaming history export.
+
+Seeds one service with a year of checks (one per --interval seconds, plus
+some rows sharing a timestamp), then drains ExportHealthHistory for a
+1-day, 1-week and 1-year range in NDJSON and CSV while tracing Python
+allocations. Reports rows, bytes, time and peak traced memory, and checks:
+- every row in the range is exported exactly once (ties included),
+- resuming from a mid-export cursor yields exactly the remaining rows,
+- the 1-year peak stays within --max-ratio of the 1-week peak (a week
+  already spans several full pages, so any growth with range length shows).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_history_export --interval 60
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+_tmp = tempfile.TemporaryDirectory()
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'export.db')}"
+
+from app.application.use_cases.export_health_history import ExportFormat, ExportHealthHistory  # noqa: E402
+from app.infrastructure.db.base import engine  # noqa: E402
+from app.infrastructure.db.migrations import run_migrations  # noqa: E402
+from app.infrastructure.db.threaded_repositories import (  # noqa: E402
+    ThreadedHealthCheckRepository,
+    ThreadedServiceRepository,
+)
+
+TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"  # how SQLAlchemy stores DateTime in SQLite
+SERVICE = "svc-export"
+
+
+def _seed(end: datetime, interval: int) -> None:
+    run_migrations(engine)
+    conn = sqlite3.connect(engine.url.database)
+    conn.execute(
+        "INSERT INTO services (id, name, url, environment, enabled) VALUES (?, 'Export', 'http://export.invalid', 'dev', 0)",
+        (SERVICE,),
+    )
+    start = end - timedelta(days=365)
+    rows = []
+    for i in range(365 * 86_400 // interval):
+        ts = (start + timedelta(seconds=i * interval)).strftime(TS_FORMAT)
+        rows.append((SERVICE, ts, "UP", i % 250, "1.0.0"))
+        if i % 1_000 == 0:  # duplicate timestamps exercise the (timestamp, id) tie-break
+            rows.append((SERVICE, ts, "DOWN", None, None))
+    conn.executemany(
+        "INSERT INTO health_checks (service_id, timestamp, status, latency_ms, version) VALUES (?, ?, ?, ?, ?)", rows
+    )
+    conn.commit()
+    conn.close()
+
+
+def _expected(start: datetime, end: datetime) -> int:
+    conn = sqlite3.connect(engine.url.database)
+    try:
+        return conn.execute(
+            "SELECT count(*) FROM health_checks WHERE service_id = ? AND timestamp >= ? AND timestamp < ?",
+            (SERVICE, start.strftime(TS_FORMAT), end.strftime(TS_FORMAT)),
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+async def _drain(start: datetime, end: datetime, fmt: ExportFormat, after=None, keep_ids=False, stop_after=None):
+    use_case = ExportHealthHistory(ThreadedServiceRepository(), ThreadedHealthCheckRepository())
+    chunks = await use_case.open(SERVICE, start=start, end=end, fmt=fmt, after=after)
+    size, lines, ids, last = 0, 0, [], None
+    async for chunk in chunks:
+        size += len(chunk)
+        lines += chunk.count("\n")
+        if keep_ids:
+            for line in chunk.splitlines():
+                record = json.loads(line)
+                ids.append(record["id"])
+                last = f"{record['timestamp']},{record['id']}"
+                if stop_after is not None and len(ids) == stop_after:
+                    await chunks.aclose()
+                    return size, lines, ids, last
+    return size, lines, ids, last
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interval", type=int, default=60, help="seconds between seeded checks")
+    parser.add_argument("--max-ratio", type=float, default=1.5, help="allowed year/week peak memory ratio")
+    args = parser.parse_args()
+
+    end = datetime.utcnow().replace(microsecond=0)
+    problems = []
+    try:
+        t0 = time.perf_counter()
+        _seed(end, args.interval)
+        print(f"seeded a year of checks in {time.perf_counter() - t0:.1f}s")
+
+        peaks = {}
+        for label, days in (("1 day", 1), ("1 week", 7), ("1 year", 366)):
+            start = end - timedelta(days=days)
+            for fmt in ExportFormat:
+                t0 = time.perf_counter()
+                size, lines, _, _ = asyncio.run(_drain(start, end, fmt))
+                elapsed = time.perf_counter() - t0
+                # Separate traced run: tracemalloc slows allocation-heavy code a lot
+                tracemalloc.start()
+                asyncio.run(_drain(start, end, fmt))
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                rows = lines - (1 if fmt is ExportFormat.CSV else 0)
+                peaks[(label, fmt)] = peak
+                print(
+                    f"  {label:<7} {fmt.value:<6} {rows:9,} rows  {size / 1e6:7.1f} MB  "
+                    f"{elapsed:6.2f}s  peak {peak / 1e6:6.2f} MB"
+                )
+                if rows != _expected(start, end):
+                    problems.append(f"{label} {fmt.value}: exported {rows} rows, expected {_expected(start, end)}")
+
+        for fmt in ExportFormat:
+            # A week already spans several full pages; a year must not need more memory than that
+            ratio = peaks[("1 year", fmt)] / peaks[("1 week", fmt)]
+            if ratio > args.max_ratio:
+                problems.append(f"{fmt.value}: 1-year peak memory is {ratio:.1f}x the 1-week peak")
+
+        # Resume: stop part-way, continue from the last record's cursor
+        start = end - timedelta(days=30)
+        _, _, full, _ = asyncio.run(_drain(start, end, ExportFormat.NDJSON, keep_ids=True))
+        _, _, head, cursor = asyncio.run(_drain(start, end, ExportFormat.NDJSON, keep_ids=True, stop_after=5_001))
+        _, _, tail, _ = asyncio.run(_drain(start, end, ExportFormat.NDJSON, after=cursor, keep_ids=True))
+        if len(set(full)) != len(full):
+            problems.append("duplicate ids in export")
+        if head + tail != full:
+            problems.append(f"resumed export differs: {len(head)} + {len(tail)} rows vs {len(full)}")
+        else:
+            print(f"  resume from cursor after {len(head):,} rows: {len(tail):,} remaining rows, no gaps or repeats")
+    finally:
+        engine.dispose()
+        _tmp.cleanup()
+
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+# benchmarks/bench_latest_for_all_services.py
+"""
+Time SQLiteHealthCheckRepository.find_latest_for_all_services against the
+previous N+1 implementation (DISTINCT service_id, then one ORDER BY/LIMIT 1
+query per service).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_latest_for_all_services --services 1000 --rows 1000000 [--composite-index]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+from sqlalchemy import create_engine, desc
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.models import HealthCheckORM
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+
+
+def populate(path: str, services: int, rows: int, composite_index: bool) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    start = datetime(2025, 1, 1)
+    per_service = rows // services
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+
+    def gen():
+        for i in range(per_service):
+            ts = (start + timedelta(seconds=15 * i)).isoformat(sep=" ")
+            for s in range(services):
+                yield (f"svc-{s}", ts, "UP" if random.random() > 0.05 else "DOWN", random.randint(5, 500))
+
+    conn.executemany(
+        "INSERT INTO health_checks (service_id, timestamp, status, latency_ms) VALUES (?, ?, ?, ?)",
+        gen(),
+    )
+    conn.commit()
+    if composite_index:
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_health_checks_service_id_timestamp "
+            "ON health_checks (service_id, timestamp DESC)"
+        )
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def legacy_n_plus_one(db: Session) -> Dict[str, HealthCheckORM]:
+    results = {}
+    service_ids = [r[0] for r in db.query(HealthCheckORM.service_id).distinct().all()]
+    for sid in service_ids:
+        row = (
+            db.query(HealthCheckORM)
+            .filter(HealthCheckORM.service_id == sid)
+            .order_by(desc(HealthCheckORM.timestamp))
+            .first()
+        )
+        if row:
+            results[sid] = row
+    return results
+
+
+def time_it(fn: Callable[[], dict], repeat: int) -> tuple[float, int]:
+    samples = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(fn())
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=1_000)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--composite-index",
+        action="store_true",
+        help="also create an index on (service_id, timestamp DESC)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "latest.db")
+        t0 = time.perf_counter()
+        populate(path, args.services, args.rows, args.composite_index)
+        print(f"populated {args.services} services x {args.rows} rows in {time.perf_counter() - t0:.1f}s")
+
+        engine = create_engine(f"sqlite:///{path}")
+        db = sessionmaker(bind=engine)()
+        repo = SQLiteHealthCheckRepository(db)
+
+        for name, fn in (
+            ("legacy N+1", lambda: legacy_n_plus_one(db)),
+            ("find_latest_for_all_services", repo.find_latest_for_all_services),
+        ):
+            db.expire_all()
+            median, size = time_it(fn, args.repeat)
+            print(f"  {name:<30} {median * 1000:10.1f} ms  ({size} services)")
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
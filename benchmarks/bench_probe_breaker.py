@@ -0,0 +1,292 @@
+# benchmarks/bench_probe_breaker.py
+"""
+Adaptive probe timeouts and the per-service circuit breaker during an outage.
+
+Serves --services services from a local stub whose targets can be switched
+between "answer in ~5 ms" and "hang (never answer)". Each scenario runs
+back-to-back check cycles through the real check path (ProbeLimiter slot
+-> RunHealthCheckForService -> write-behind writer into a scratch DB):
+- --warmup cycles with every service up (latencies are learnt),
+- --outage cycles with --dead services hanging,
+- recovery: the dead services answer again; cycles until all are UP,
+- slowdown: the same services answer after --slow-seconds (above the
+  timeout learnt while they were fast, below HTTP_TIMEOUT_SECONDS); cycles
+  until all are UP again,
+for three configurations:
+- baseline:  fixed HTTP_TIMEOUT_SECONDS, no breaker (the old behaviour),
+- adaptive:  per-service adaptive timeouts only,
+- breaker:   adaptive timeouts + circuit breaker (open after
+             --breaker-threshold DOWN checks, re-probe every --open-cycles cycles),
+reporting cycle time, probes sent to dead services and the socket-seconds
+they held per outage cycle, and checking that:
+- no service that stayed up was reported DOWN,
+- with the breaker, every dead service has an "open" transition stored
+  with its checks and a "closed" one after recovery; up services none,
+- recovery is seen within --open-cycles + 1 cycles,
+- slowed-down services are UP again within --breaker-threshold cycles
+  (a clipped timeout must not keep them DOWN).
+
+Usage (from the repo root):
+    python -m benchmarks.bench_probe_breaker --services 200 --dead 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Set
+
+_tmp = tempfile.TemporaryDirectory()
+_db_path = os.path.join(_tmp.name, "probe_breaker.db")
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{_db_path}"
+os.environ["SERVICES_CONFIG_PATH"] = os.path.join(_tmp.name, "none.json")
+os.environ.setdefault("HTTP_TIMEOUT_SECONDS", "2")
+
+from app.application.use_cases.run_health_check_for_service import RunHealthCheckForService  # noqa: E402
+from app.domain.model.health_check import HealthCheckResult  # noqa: E402
+from app.domain.model.service import Service  # noqa: E402
+from app.domain.model.value_objects import HealthStatus  # noqa: E402
+from app.domain.services.adaptive_timeout_policy import AdaptiveTimeoutPolicy  # noqa: E402
+from app.domain.services.health_evaluation_service import HealthEvaluationService  # noqa: E402
+from app.domain.services.probe_circuit_breaker import ProbeCircuitBreaker  # noqa: E402
+from app.infrastructure.db.base import engine  # noqa: E402
+from app.infrastructure.db.health_check_writer import HealthCheckWriter  # noqa: E402
+from app.infrastructure.db.migrations import run_migrations  # noqa: E402
+from app.infrastructure.db.threaded_repositories import ThreadedHealthCheckRepository  # noqa: E402
+from app.infrastructure.http.http_client import build_http_client  # noqa: E402
+from app.infrastructure.http.probe_limiter import ProbeLimiter  # noqa: E402
+from app.infrastructure.http.service_pinger import HttpServicePinger  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+
+class SwitchableStub:
+    """
+    GET /svc/<n>: 200 {"version": "1.0.0"} after ~5 ms (`slow_seconds` while
+    n is in `slow`), or no answer at all while n is in `dead` (the
+    connection is held open, like a hung target).
+    """
+
+    def __init__(self) -> None:
+        self.dead: Set[int] = set()
+        self.slow: Set[int] = set()
+        self.slow_seconds = 0.0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, port: int) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", port, backlog=1024)
+
+    async def stop(self) -> None:
+        self._server.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                while (await reader.readline()) not in (b"\r\n", b""):
+                    pass
+                number = int(request_line.split()[1].rsplit(b"/", 1)[1])
+                if number in self.dead:
+                    await asyncio.sleep(3600)
+                await asyncio.sleep(self.slow_seconds if number in self.slow else 0.005)
+                body = b'{"version": "1.0.0"}'
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+def _breaker_rows() -> Dict[str, List[str]]:
+    conn = sqlite3.connect(_db_path)
+    try:
+        rows = conn.execute(
+            "SELECT service_id, breaker_state FROM health_checks WHERE breaker_state IS NOT NULL ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+    transitions: Dict[str, List[str]] = {}
+    for service_id, state in rows:
+        transitions.setdefault(service_id, []).append(state)
+    return transitions
+
+
+async def _scenario(
+    name: str, stub: SwitchableStub, services: List[Service], dead: Set[int], args: argparse.Namespace,
+) -> Dict[str, object]:
+    conn = sqlite3.connect(_db_path)
+    conn.execute("DELETE FROM health_checks")
+    conn.commit()
+    conn.close()
+    stub.dead = set()
+    stub.slow = set()
+
+    cycle_no = 0
+    timeouts = AdaptiveTimeoutPolicy(
+        max_seconds=settings.http_timeout_seconds,
+        min_seconds=settings.probe_timeout_min_seconds,
+        percentile=settings.probe_timeout_percentile,
+        multiplier=settings.probe_timeout_multiplier,
+    ) if name != "baseline" else None
+    breaker = ProbeCircuitBreaker(
+        args.breaker_threshold, args.open_cycles, clock=lambda: cycle_no,
+    ) if name == "breaker" else None
+
+    client = build_http_client()
+    writer = HealthCheckWriter(flush_interval_ms=200)
+    writer.start()
+    run_single = RunHealthCheckForService(
+        pinger=HttpServicePinger(client),
+        evaluator=HealthEvaluationService(),
+        health_repo=ThreadedHealthCheckRepository(),
+        writer=writer,
+        timeouts=timeouts,
+        breaker=breaker,
+    )
+    limiter = ProbeLimiter(args.concurrency)
+
+    async def check(service: Service) -> HealthCheckResult:
+        async with limiter.slot(service.url):
+            return await run_single.execute(service)
+
+    async def cycle() -> List[HealthCheckResult]:
+        due = [s for s in services if breaker is None or breaker.allow(s.id)]
+        return list(await asyncio.gather(*(check(s) for s in due)))
+
+    dead_ids = {services[n].id for n in dead}
+    for _ in range(args.warmup):
+        await cycle()
+        cycle_no += 1
+
+    stub.dead = set(dead)
+    cycle_seconds: List[float] = []
+    dead_probes = dead_socket_seconds = false_down = 0
+    for _ in range(args.outage):
+        started = time.perf_counter()
+        results = await cycle()
+        cycle_seconds.append(time.perf_counter() - started)
+        cycle_no += 1
+        for result in results:
+            if result.service_id in dead_ids:
+                dead_probes += 1
+                dead_socket_seconds += (result.latency_ms or 0) / 1000
+            elif result.status != HealthStatus.UP:
+                false_down += 1
+
+    stub.dead = set()
+    recovered: Set[str] = set()
+    recovery_cycles = 0
+    while len(recovered) < len(dead_ids) and recovery_cycles < args.open_cycles + 5:
+        results = await cycle()
+        cycle_no += 1
+        recovery_cycles += 1
+        recovered |= {r.service_id for r in results if r.service_id in dead_ids and r.status == HealthStatus.UP}
+
+    # Learn fast latencies again, then slow the same services down
+    for _ in range(args.warmup):
+        await cycle()
+        cycle_no += 1
+    stub.slow, stub.slow_seconds = set(dead), args.slow_seconds
+    slow_up: Set[str] = set()
+    slowdown_cycles = 0
+    while len(slow_up) < len(dead_ids) and slowdown_cycles < args.breaker_threshold + args.open_cycles + 5:
+        results = await cycle()
+        cycle_no += 1
+        slowdown_cycles += 1
+        slow_up = {r.service_id for r in results if r.service_id in dead_ids and r.status == HealthStatus.UP}
+
+    await writer.stop()
+    await client.aclose()
+    return {
+        "cycle_s": sum(cycle_seconds) / len(cycle_seconds),
+        "dead_probes": dead_probes / args.outage,
+        "dead_socket_s": dead_socket_seconds / args.outage,
+        "false_down": false_down,
+        "recovery_cycles": recovery_cycles if len(recovered) == len(dead_ids) else None,
+        "slowdown_cycles": slowdown_cycles if len(slow_up) == len(dead_ids) else None,
+        "transitions": _breaker_rows(),
+    }
+
+
+async def _run(args: argparse.Namespace) -> List[str]:
+    problems: List[str] = []
+    stub = SwitchableStub()
+    await stub.start(args.port)
+    services = [
+        Service.from_primitives(f"svc-{n}", f"Service {n}", f"http://127.0.0.1:{args.port}/svc/{n}", None, "production")
+        for n in range(args.services)
+    ]
+    dead = set(range(0, args.services, max(1, args.services // args.dead)))
+    dead = set(sorted(dead)[:args.dead])
+    dead_ids = {services[n].id for n in dead}
+
+    print(f"{args.services} services, {len(dead)} hanging during the outage, {args.concurrency} probes in flight, "
+          f"HTTP timeout {settings.http_timeout_seconds:g} s")
+    print(f"{'':10s} {'cycle':>9} {'dead probes':>12} {'socket-s on dead':>17} {'false DOWN':>11} {'recovered after':>16} "
+          f"{'slowed, UP after':>17}")
+    try:
+        for name in ("baseline", "adaptive", "breaker"):
+            row = await _scenario(name, stub, services, dead, args)
+            recovery = f"{row['recovery_cycles']} cycles" if row["recovery_cycles"] is not None else "never"
+            slowdown = f"{row['slowdown_cycles']} cycles" if row["slowdown_cycles"] is not None else "never"
+            print(f"{name:10s} {row['cycle_s']:7.2f} s {row['dead_probes']:12.1f} {row['dead_socket_s']:15.1f} s "
+                  f"{row['false_down']:11d} {recovery:>16} {slowdown:>17}")
+            if row["false_down"]:
+                problems.append(f"{name}: {row['false_down']} DOWN results for services that stayed up")
+            if row["recovery_cycles"] is None or row["recovery_cycles"] > args.open_cycles + 1:
+                problems.append(f"{name}: dead services recovered after {recovery}")
+            if row["slowdown_cycles"] is None or row["slowdown_cycles"] > args.breaker_threshold:
+                problems.append(f"{name}: slowed-down services UP again after {slowdown}")
+            transitions = row["transitions"]
+            if name != "breaker":
+                if transitions:
+                    problems.append(f"{name}: breaker transitions stored without a breaker")
+                continue
+            stray = set(transitions) - dead_ids
+            bad = [sid for sid in dead_ids if transitions.get(sid, [None])[0] != "open"
+                   or transitions[sid][-1] != "closed"]
+            print(f"  stored transitions: {sum(len(t) for t in transitions.values())} for {len(transitions)} services, "
+                  f"e.g. {services[min(dead)].id}: {' -> '.join(transitions.get(services[min(dead)].id, []))}")
+            if stray:
+                problems.append(f"breaker transitions stored for services that stayed up: {sorted(stray)[:5]}")
+            if bad:
+                problems.append(f"{len(bad)} dead services without an open ... closed transition history")
+    finally:
+        await stub.stop()
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=200)
+    parser.add_argument("--dead", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--outage", type=int, default=8)
+    parser.add_argument("--breaker-threshold", type=int, default=3)
+    parser.add_argument("--open-cycles", type=int, default=4)
+    parser.add_argument("--slow-seconds", type=float, default=1.3)
+    parser.add_argument("--port", type=int, default=9500)
+    args = parser.parse_args()
+
+    run_migrations(engine)
+    problems = asyncio.run(_run(args))
+    engine.dispose()
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+# benchmarks/bench_probe_modes.py
+"""
+Bytes transferred and CPU per check for each probe mode.
+
+Starts a stub target in a separate process (so its CPU isn't counted) whose
+health URL returns a --body-bytes JSON document ({"version": "1.2.3",
+"data": [...]}) and an X-Service-Version: 1.2.3-header header, then sends
+--checks checks (--concurrency in flight) through HttpServicePinger +
+HealthEvaluationService for:
+- get, uncapped: the whole body is read and parsed (the old behaviour),
+- get:           body read up to PROBE_MAX_BODY_BYTES (--cap),
+- headers-only:  GET, body never read,
+- head:          HEAD request,
+- tcp:           TCP connect only,
+and reports per check: body bytes read by the client, new connections
+the target accepted, client CPU and latency. Checks that:
+- every check is UP,
+- get (capped or not) reports the body's version, head/headers-only the
+  header's, tcp none,
+- capped get reads at most the cap (+ one chunk) and uses less CPU than uncapped.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_probe_modes --body-bytes 1000000 --checks 300
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.domain.model.service import Service
+from app.domain.model.value_objects import HealthStatus, ProbeMode
+from app.domain.services.health_evaluation_service import HealthCheckInput, HealthEvaluationService
+from app.infrastructure.http.http_client import build_http_client
+from app.infrastructure.http.service_pinger import HttpServicePinger
+
+BODY_VERSION = "1.2.3"
+HEADER_VERSION = "1.2.3-header"
+
+
+async def _serve(port: int, body_bytes: int) -> None:
+    """
+    Stub target: any path answers with the big document; /stats returns
+    the number of connections accepted so far.
+    """
+    filler = max(0, body_bytes - 40)
+    body = json.dumps({"version": BODY_VERSION, "data": "x" * filler}).encode()
+    accepted = 0
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal accepted
+        accepted += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                while (await reader.readline()) not in (b"\r\n", b""):
+                    pass
+                method, path = request_line.split()[:2]
+                payload = str(accepted).encode() if path == b"/stats" else body
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"X-Service-Version: %s\r\nContent-Length: %d\r\n\r\n"
+                    % (HEADER_VERSION.encode(), len(payload))
+                )
+                if method != b"HEAD":
+                    writer.write(payload)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", port, backlog=1024)
+    print("READY", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def _start_stub(args: argparse.Namespace) -> subprocess.Popen:
+    stub = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.bench_probe_modes", "--serve",
+         "--port", str(args.port), "--body-bytes", str(args.body_bytes)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    if not (stub.stdout.readline() or "").startswith("READY"):
+        raise RuntimeError("stub target did not start")
+    return stub
+
+
+async def _accepted(port: int) -> int:
+    async with httpx.AsyncClient() as client:
+        return int((await client.get(f"http://127.0.0.1:{port}/stats")).text)
+
+
+async def _measure(label: str, mode: ProbeMode, cap: Optional[int], args: argparse.Namespace) -> Dict[str, object]:
+    service = Service.from_primitives(
+        "svc", "Service", f"http://127.0.0.1:{args.port}/health", BODY_VERSION, "production", probe_mode=mode.value,
+    )
+    client = build_http_client()
+    pinger = HttpServicePinger(client, max_body_bytes=cap if cap is not None else 2 ** 62)
+    evaluator = HealthEvaluationService()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    bytes_read: List[int] = []
+    latencies: List[int] = []
+    statuses: List[HealthStatus] = []
+    versions: set = set()
+
+    async def check() -> None:
+        async with semaphore:
+            ping = await pinger.ping(service)
+        result = evaluator.evaluate(service, HealthCheckInput(
+            http_status_code=ping.http_status_code,
+            latency_ms=ping.latency_ms,
+            reported_version=ping.reported_version,
+            error_message=ping.error_message,
+            connect_ms=ping.connect_ms,
+            tcp_connected=ping.tcp_connected,
+        ))
+        bytes_read.append(ping.bytes_received or 0)
+        latencies.append(ping.latency_ms or 0)
+        statuses.append(result.status)
+        versions.add(result.version.value if result.version else None)
+
+    await asyncio.gather(*(check() for _ in range(args.concurrency)))  # warm up the pool
+    for samples in (bytes_read, latencies, statuses, versions):
+        samples.clear()
+    accepted_before = await _accepted(args.port)
+    cpu_started = time.process_time()
+    await asyncio.gather(*(check() for _ in range(args.checks)))
+    cpu = time.process_time() - cpu_started
+    connections = await _accepted(args.port) - accepted_before - 1  # minus the /stats request itself
+    await client.aclose()
+    latencies.sort()
+    return {
+        "label": label,
+        "bytes": sum(bytes_read) / args.checks,
+        "max_bytes": max(bytes_read),
+        "connections": connections / args.checks,
+        "cpu_ms": cpu * 1000 / args.checks,
+        "p50_ms": latencies[len(latencies) // 2],
+        "down": sum(1 for s in statuses if s != HealthStatus.UP),
+        "versions": versions,
+    }
+
+
+async def _run(args: argparse.Namespace) -> List[str]:
+    problems: List[str] = []
+    stub = _start_stub(args)
+    rows = []
+    expected = {
+        "get, uncapped": BODY_VERSION, "get": BODY_VERSION,
+        "headers-only": HEADER_VERSION, "head": HEADER_VERSION, "tcp": None,
+    }
+    try:
+        for label, mode, cap in (
+            ("get, uncapped", ProbeMode.GET, None),
+            ("get", ProbeMode.GET, args.cap),
+            ("headers-only", ProbeMode.HEADERS_ONLY, args.cap),
+            ("head", ProbeMode.HEAD, args.cap),
+            ("tcp", ProbeMode.TCP, args.cap),
+        ):
+            rows.append(await _measure(label, mode, cap, args))
+    finally:
+        stub.terminate()
+        stub.wait()
+
+    print(f"{args.checks} checks per mode, {args.concurrency} in flight, {args.body_bytes / 1e6:.1f} MB body, "
+          f"cap {args.cap} bytes")
+    print(f"{'mode':14s} {'bytes read':>11} {'new conns':>10} {'CPU/check':>10} {'p50':>8}  version")
+    for row in rows:
+        print(f"{row['label']:14s} {row['bytes']:11.0f} {row['connections']:10.2f} {row['cpu_ms']:7.2f} ms "
+              f"{row['p50_ms']:5d} ms  {', '.join(str(v) for v in row['versions'])}")
+        if row["down"]:
+            problems.append(f"{row['label']}: {row['down']} checks not UP")
+        if row["versions"] != {expected[row["label"]]}:
+            problems.append(f"{row['label']}: versions {row['versions']}, expected {expected[row['label']]}")
+    by_label = {row["label"]: row for row in rows}
+    if by_label["get"]["max_bytes"] > args.cap + 256 * 1024:
+        problems.append(f"capped get read {by_label['get']['max_bytes']} bytes (cap {args.cap})")
+    if args.body_bytes > args.cap and by_label["get"]["cpu_ms"] >= by_label["get, uncapped"]["cpu_ms"]:
+        problems.append("capped get did not use less CPU than uncapped")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--body-bytes", type=int, default=1_000_000)
+    parser.add_argument("--cap", type=int, default=65_536)
+    parser.add_argument("--checks", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--port", type=int, default=9600)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        asyncio.run(_serve(args.port, args.body_bytes))
+        return 0
+    problems = asyncio.run(_run(args))
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+# benchmarks/bench_probe_processes.py
+"""
+Checks/sec with the pings spread over PROBE_PROCESSES worker processes.
+
+Starts --stubs fleet stub servers, then for each process count in
+--processes (0 = pings on the main event loop, as before) drives the real
+check path for --duration seconds: ProbeLimiter slot -> RunHealthCheckForService
+(ping + evaluate in the pool's workers, or in-process for 0) -> write-behind
+HealthCheckWriter into a scratch DB, --concurrency checks in flight at all
+times. Reports per process count:
+- checks/sec and speed-up over in-process probing,
+- CPU per check in the persisting (main) process and in the probe workers,
+and checks that:
+- every check completed UP (the stub fleet doesn't fail) and was persisted,
+- with 1+ processes the main process spends less CPU per check than in-process.
+
+Throughput can only scale up to the number of cores (the stub servers need
+some too); on a 1-core machine the run shows the IPC overhead instead.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_probe_processes --processes 0,1,2,4 --duration 10
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+_tmp = tempfile.TemporaryDirectory()
+_db_path = os.path.join(_tmp.name, "probe_processes.db")
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{_db_path}"
+os.environ["SERVICES_CONFIG_PATH"] = os.path.join(_tmp.name, "none.json")
+
+from app.application.use_cases.run_health_check_for_service import RunHealthCheckForService  # noqa: E402
+from app.domain.model.health_check import HealthCheckResult  # noqa: E402
+from app.domain.model.service import Service  # noqa: E402
+from app.domain.model.value_objects import HealthStatus  # noqa: E402
+from app.domain.services.health_evaluation_service import HealthEvaluationService  # noqa: E402
+from app.infrastructure.db.base import engine  # noqa: E402
+from app.infrastructure.db.health_check_writer import HealthCheckWriter  # noqa: E402
+from app.infrastructure.db.migrations import run_migrations  # noqa: E402
+from app.infrastructure.db.threaded_repositories import ThreadedHealthCheckRepository  # noqa: E402
+from app.infrastructure.http.http_client import close_http_client  # noqa: E402
+from app.infrastructure.http.probe_limiter import ProbeLimiter  # noqa: E402
+from app.infrastructure.http.process_probe_pool import ProcessProbePool  # noqa: E402
+from app.infrastructure.http.service_pinger import HttpServicePinger  # noqa: E402
+from benchmarks.fleet_stub_server import FleetProfile  # noqa: E402
+
+
+def _start_stub(port: int) -> subprocess.Popen:
+    profile = FleetProfile(latency_median_ms=5.0, error_rate=0.0, timeout_rate=0.0, hang_rate=0.0)
+    stub = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.fleet_stub_server", "--port", str(port),
+         "--profile", json.dumps(profile.to_json())],
+        stdout=subprocess.PIPE, text=True,
+    )
+    if not (stub.stdout.readline() or "").startswith("READY"):
+        raise RuntimeError(f"stub server on port {port} did not start")
+    return stub
+
+
+def _children_cpu() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _persisted() -> int:
+    conn = sqlite3.connect(_db_path)
+    try:
+        return conn.execute("SELECT count(*) FROM health_checks").fetchone()[0]
+    finally:
+        conn.close()
+
+
+async def _drive(services: List[Service], processes: int, args: argparse.Namespace) -> Dict[str, float]:
+    pool: Optional[ProcessProbePool] = ProcessProbePool(processes) if processes else None
+    if pool is not None:
+        await pool.start()
+    writer = HealthCheckWriter(flush_interval_ms=200)
+    writer.start()
+    run_single = RunHealthCheckForService(
+        pinger=HttpServicePinger(),
+        evaluator=HealthEvaluationService(),
+        health_repo=ThreadedHealthCheckRepository(),
+        writer=writer,
+        probe_pool=pool,
+    )
+    limiter = ProbeLimiter(args.concurrency, args.concurrency)
+    results: List[HealthCheckResult] = []
+    errors: List[str] = []
+    stop_at = 0.0
+
+    async def driver(offset: int) -> None:
+        n = offset
+        while time.perf_counter() < stop_at:
+            service = services[n % len(services)]
+            n += args.concurrency
+            try:
+                async with limiter.slot(service.url):
+                    results.append(await run_single.execute(service))
+            except Exception as exc:  # noqa: BLE001
+                errors.append(repr(exc))
+
+    # Warm up: connections, worker imports
+    stop_at = time.perf_counter() + 2.0
+    await asyncio.gather(*(driver(n) for n in range(args.concurrency)))
+    await writer.flush()
+    before = _persisted()
+    results.clear()
+
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    stop_at = started + args.duration
+    await asyncio.gather(*(driver(n) for n in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    main_cpu = time.process_time() - cpu_started
+
+    await writer.stop()
+    children_started = _children_cpu()
+    if pool is not None:
+        await pool.stop()
+    else:
+        await close_http_client()
+    # Workers' CPU is only reported once they have exited; warm-up included, so pro-rate it
+    worker_cpu = (_children_cpu() - children_started) * args.duration / (args.duration + 2.0)
+    return {
+        "checks": len(results),
+        "rate": len(results) / elapsed,
+        "up": sum(1 for result in results if result.status == HealthStatus.UP),
+        "persisted": _persisted() - before,
+        "main_cpu_ms": main_cpu * 1000 / max(1, len(results)),
+        "worker_cpu_ms": worker_cpu * 1000 / max(1, len(results)),
+        "errors": len(errors),
+        "first_error": errors[0] if errors else "",
+    }
+
+
+async def _run(args: argparse.Namespace) -> List[str]:
+    problems: List[str] = []
+    stubs = [_start_stub(args.base_port + n) for n in range(args.stubs)]
+    services = [
+        Service.from_primitives(
+            f"svc-{n}", f"Service {n}", f"http://127.0.0.1:{args.base_port + n % args.stubs}/svc/{n}",
+            None, "production",
+        )
+        for n in range(args.services)
+    ]
+    counts = [int(p) for p in args.processes.split(",")]
+    print(f"{args.services} services on {args.stubs} stub servers, {args.concurrency} checks in flight, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'processes':>9} {'checks/s':>9} {'speed-up':>9} {'main CPU/check':>15} {'worker CPU/check':>17}")
+    baseline: Optional[Dict[str, float]] = None
+    try:
+        for processes in counts:
+            row = await _drive(services, processes, args)
+            if processes == 0:
+                baseline = row
+            speedup = f"{row['rate'] / baseline['rate']:8.2f}x" if baseline else f"{'-':>9}"
+            print(f"{processes:>9} {row['rate']:9.0f} {speedup} {row['main_cpu_ms']:12.2f} ms "
+                  f"{row['worker_cpu_ms']:14.2f} ms")
+            label = f"{processes} processes"
+            if row["errors"]:
+                problems.append(f"{label}: {row['errors']} checks raised, e.g. {row['first_error']}")
+            if row["up"] != row["checks"]:
+                problems.append(f"{label}: {row['checks'] - row['up']} of {row['checks']} checks not UP")
+            if row["persisted"] < row["checks"]:
+                problems.append(f"{label}: {row['persisted']} persisted of {row['checks']} checks")
+            if baseline and processes and row["main_cpu_ms"] >= baseline["main_cpu_ms"]:
+                problems.append(f"{label}: main process CPU per check did not drop "
+                                f"({row['main_cpu_ms']:.2f} ms vs {baseline['main_cpu_ms']:.2f} ms in-process)")
+    finally:
+        for stub in stubs:
+            stub.terminate()
+            stub.wait()
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=2_000)
+    parser.add_argument("--processes", default="0,1,2,4")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--stubs", type=int, default=2)
+    parser.add_argument("--base-port", type=int, default=9400)
+    args = parser.parse_args()
+
+    run_migrations(engine)
+    problems = asyncio.run(_run(args))
+    engine.dispose()
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
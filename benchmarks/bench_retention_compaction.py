@@ -0,0 +1,143 @@
+# benchmarks/bench_retention_compaction.py
+"""
+Retention compaction on a seeded history.
+
+Seeds N services x D days of checks, then runs HealthCheckCompactor with the
+configured retention and reports:
+- rows per table before/after and the compaction time,
+- the longest single batch (how long the write lock is held at most),
+- that hourly history for a service is identical before and after
+  compaction (rollups + raw are merged transparently), and that /history
+  style queries pick raw / 1m / 1h as expected.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_retention_compaction --services 100 --days 10 --interval 60
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.model.health_check import HistoryResolution
+from app.domain.model.value_objects import ServiceId
+from app.infrastructure.db.base import SQLiteProfile, create_db_engine
+from app.infrastructure.db.health_check_compactor import HealthCheckCompactor
+from app.infrastructure.db.migrations import run_migrations
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+
+TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"  # how SQLAlchemy stores DateTime in SQLite
+
+
+def _seed(path: str, services: int, days: int, interval: int, now: datetime) -> None:
+    rng = random.Random(42)
+    conn = sqlite3.connect(path)
+    start = now - timedelta(days=days)
+    steps = int(days * 86_400 / interval)
+    for s in range(services):
+        rows = []
+        for i in range(steps):
+            ts = start + timedelta(seconds=i * interval + s % interval)
+            up = rng.random() > 0.02
+            rows.append((
+                f"svc-{s}", ts.strftime(TS_FORMAT), "UP" if up else "DOWN",
+                rng.randint(5, 400) if up else None, f"1.{i // 5000}",
+            ))
+        conn.executemany(
+            "INSERT INTO health_checks (service_id, timestamp, status, latency_ms, version) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+    conn.commit()
+    conn.close()
+
+
+def _counts(path: str) -> str:
+    conn = sqlite3.connect(path)
+    try:
+        return ", ".join(
+            f"{table}={conn.execute(f'SELECT count(*) FROM {table}').fetchone()[0]:,}"
+            for table in ("health_checks", "health_check_rollups_1m", "health_check_rollups_1h")
+        )
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=100)
+    parser.add_argument("--days", type=int, default=10)
+    parser.add_argument("--interval", type=int, default=60, help="seconds between checks per service")
+    parser.add_argument("--raw-hours", type=int, default=48)
+    parser.add_argument("--minute-days", type=int, default=3)
+    parser.add_argument("--batch", type=int, default=2_000)
+    args = parser.parse_args()
+
+    now = datetime.utcnow()
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "retention.db")
+        engine = create_db_engine(f"sqlite:///{path}", profile=SQLiteProfile())
+        run_migrations(engine)
+        factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        t0 = time.perf_counter()
+        _seed(path, args.services, args.days, args.interval, now)
+        print(f"seeded in {time.perf_counter() - t0:.1f}s: {_counts(path)}")
+
+        def hourly(service: str):
+            db = factory()
+            try:
+                return SQLiteHealthCheckRepository(db).find_history(
+                    ServiceId(service), now - timedelta(days=args.days + 1), now, HistoryResolution.HOUR
+                )
+            finally:
+                db.close()
+
+        before = hourly("svc-7")
+
+        compactor = HealthCheckCompactor(
+            raw_retention=timedelta(hours=args.raw_hours),
+            minute_retention=timedelta(days=args.minute_days),
+            hour_retention=None,
+            batch_size=args.batch,
+            session_factory=factory,
+        )
+        t0 = time.perf_counter()
+        stats = compactor.compact(now)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"compacted in {elapsed:.1f}s: {stats.raw_rows_folded:,} raw rows folded, "
+            f"{stats.minute_rows_folded:,} 1m rollups folded, {stats.batches} batches, "
+            f"longest batch {stats.max_batch_ms:.1f} ms"
+        )
+        print(f"after: {_counts(path)}")
+
+        after = hourly("svc-7")
+        if [(b.bucket_start, b.count, b.up_count, b.latency_min_ms, b.latency_max_ms, b.latency_avg_ms, b.version)
+                for b in before] != \
+           [(b.bucket_start, b.count, b.up_count, b.latency_min_ms, b.latency_max_ms, b.latency_avg_ms, b.version)
+                for b in after]:
+            problems.append("hourly history changed after compaction")
+        else:
+            print(f"hourly history for svc-7 unchanged by compaction ({len(after)} buckets)")
+
+        second = compactor.compact(now)
+        if second.raw_rows_folded or second.minute_rows_folded:
+            problems.append("second pass found more work (compaction is not idempotent)")
+        engine.dispose()
+
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
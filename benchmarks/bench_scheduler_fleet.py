@@ -0,0 +1,285 @@
+# benchmarks/bench_scheduler_fleet.py
+"""
+The health check scheduler against a simulated fleet.
+
+Starts --stub-processes fleet stub servers (benchmarks/fleet_stub_server.py,
+each in its own process), registers --services services pointing at them in
+one bulk insert, then runs the real health_check_loop (write-behind writer,
+shared HTTP client, status snapshot) for --warmup + --duration seconds and
+measures over the --duration window:
+- checks/sec (vs. the services / interval the schedule asks for),
+- sweep time: how long it takes for every service to be checked once more,
+- scheduler lag (how late checks started vs. when they were due),
+- CPU of the monitor process (the stubs run elsewhere), RSS,
+- DB write rate (rows landing in health_checks),
+- the UP/DOWN split and how many results reported a drifted version,
+- the phase breakdown of the last complete scheduler cycle (where check time went).
+
+Results are written as JSON to --output (with the git commit), and
+--baseline compares against an earlier file, exiting non-zero if
+checks/sec dropped by more than --tolerance.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_scheduler_fleet --services 2000 --interval 10 --duration 60 \\
+        --profile '{"errorRate": 0.05, "hangRate": 0.01}' --output fleet.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.fleet_stub_server import FleetProfile
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _git_commit() -> Dict[str, object]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def _start_stubs(count: int, base_port: int, profile: FleetProfile) -> List[subprocess.Popen]:
+    stubs = []
+    for i in range(count):
+        stub = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.fleet_stub_server",
+             "--port", str(base_port + i), "--profile", json.dumps(profile.to_json())],
+            stdout=subprocess.PIPE, text=True,
+        )
+        stubs.append(stub)
+        if not (stub.stdout.readline() or "").startswith("READY"):
+            raise RuntimeError(f"stub server on port {base_port + i} did not start")
+    return stubs
+
+
+def _register(db_path: str, services: int, ports: List[int], expected_version: str) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO services (id, name, url, expected_version, environment, enabled) VALUES (?, ?, ?, ?, 'production', 1)",
+        [
+            (f"fleet-{n}", f"Fleet {n}", f"http://127.0.0.1:{ports[n % len(ports)]}/svc/{n}", expected_version)
+            for n in range(services)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _row_count(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT count(*) FROM health_checks").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _percentile(values: List[float], p: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 3)
+
+
+async def _measure(args: argparse.Namespace, db_path: str) -> Dict[str, object]:
+    # App modules read settings at import time, so they are imported only
+    # after main() has put this run's configuration into the environment.
+    from app.infrastructure.cache.status_snapshot import status_snapshot
+    from app.infrastructure.http.http_client import close_http_client, start_http_client
+    from app.infrastructure.scheduling.cycle_profiler import cycle_profiler
+    from app.infrastructure.scheduling.health_check_scheduler import (
+        get_scheduler_status,
+        start_health_check_scheduler,
+        stop_health_check_scheduler,
+    )
+
+    loop = asyncio.get_running_loop()
+    start_http_client()
+    start_health_check_scheduler()
+
+    seen: Dict[str, datetime] = {}
+    checks_per_service: Dict[str, int] = {}
+    sweeps_done_at: List[float] = []
+    rss_peak = 0.0
+    window_start = loop.time() + args.warmup
+    window_end = window_start + args.duration
+    base: Optional[Dict[str, float]] = None
+    try:
+        while loop.time() < window_end:
+            await asyncio.sleep(args.sample_seconds)
+            now = loop.time()
+            for service, check in status_snapshot.latest():
+                sid = str(service.id)
+                if seen.get(sid) != check.timestamp:
+                    seen[sid] = check.timestamp
+                    checks_per_service[sid] = checks_per_service.get(sid, 0) + 1
+            if len(checks_per_service) == args.services:
+                full_sweeps = min(checks_per_service.values())
+                while len(sweeps_done_at) < full_sweeps:
+                    sweeps_done_at.append(now)
+            if now >= window_start:
+                rss_peak = max(rss_peak, _rss_mb())
+                if base is None:
+                    base = {
+                        "t": now, "cpu": _cpu_seconds(), "version": status_snapshot.version,
+                        "rows": _row_count(db_path), "sweeps": len(sweeps_done_at),
+                    }
+        elapsed = loop.time() - base["t"]
+        checks = status_snapshot.version - base["version"]
+        cpu = _cpu_seconds() - base["cpu"]
+        rows = _row_count(db_path) - base["rows"]
+        scheduler = get_scheduler_status()
+        latest = status_snapshot.latest()
+        cycles = cycle_profiler.recent(1)
+    finally:
+        await stop_health_check_scheduler()
+        await close_http_client()
+
+    sweep_times = [b - a for a, b in zip(sweeps_done_at[base["sweeps"]:], sweeps_done_at[base["sweeps"] + 1:])]
+    status_counts: Dict[str, int] = {}
+    for _, check in latest:
+        status_counts[check.status.value] = status_counts.get(check.status.value, 0) + 1
+    return {
+        "checksPerSecond": round(checks / elapsed, 2),
+        "expectedChecksPerSecond": round(args.services / args.interval, 2),
+        "sweepSeconds": {
+            "count": len(sweep_times),
+            "p50": _percentile(sweep_times, 0.5),
+            "max": round(max(sweep_times), 3) if sweep_times else None,
+        },
+        "lag": scheduler["lag"],
+        "inFlightAtEnd": scheduler["inFlight"],
+        "cpuPercent": round(100 * cpu / elapsed, 1),
+        "cpuMsPerCheck": round(1000 * cpu / checks, 3) if checks else None,
+        "rssMb": {"peak": round(rss_peak, 1)},
+        "dbRowsPerSecond": round(rows / elapsed, 2),
+        "latestStatus": status_counts,
+        "versionDrift": sum(1 for _, check in latest if check.version_matches_expected is False),
+        "lastCycle": {
+            "checks": cycles[0]["checks"],
+            "durationMs": cycles[0]["durationMs"],
+            "phasesMs": {row["phase"]: row["totalMs"] for row in cycles[0]["phases"]},
+            "dbCommitMs": cycles[0]["dbCommit"]["totalMs"],
+        } if cycles else None,
+    }
+
+
+def _compare(result: Dict[str, object], baseline_path: str, tolerance: float) -> List[str]:
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    now, before = result["metrics"], baseline["metrics"]
+    print(f"\nvs baseline {baseline.get('commit') or baseline_path}:")
+    for label, key, sub in (
+        ("checks/sec", "checksPerSecond", None), ("cpu ms/check", "cpuMsPerCheck", None),
+        ("lag p99 ms", "lag", "p99Ms"), ("rss peak MB", "rssMb", "peak"), ("db rows/sec", "dbRowsPerSecond", None),
+    ):
+        a = before[key][sub] if sub else before[key]
+        b = now[key][sub] if sub else now[key]
+        change = f"{100 * (b - a) / a:+.1f}%" if a else "n/a"
+        print(f"  {label:<13} {a:>10} -> {b:>10}  ({change})")
+    if now["checksPerSecond"] < before["checksPerSecond"] * (1 - tolerance):
+        return [f"checks/sec fell from {before['checksPerSecond']} to {now['checksPerSecond']}"]
+    return []
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=2_000)
+    parser.add_argument("--interval", type=int, default=10, help="check interval per service (seconds)")
+    parser.add_argument("--warmup", type=float, default=15.0, help="seconds before measuring (first sweep)")
+    parser.add_argument("--duration", type=float, default=60.0, help="measured seconds")
+    parser.add_argument("--sample-seconds", type=float, default=0.25)
+    parser.add_argument("--concurrency", type=int, default=200, help="HEALTH_CHECK_MAX_CONCURRENCY")
+    parser.add_argument("--http-timeout", type=float, default=5.0)
+    parser.add_argument("--stub-processes", type=int, default=2)
+    parser.add_argument("--base-port", type=int, default=9100)
+    parser.add_argument("--profile", default="", help="FleetProfile JSON (camelCase), e.g. '{\"errorRate\": 0.1}'")
+    parser.add_argument("--expected-version", default="1.4.2")
+    parser.add_argument("--output", default="scheduler_fleet.json")
+    parser.add_argument("--baseline", help="earlier --output file to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed checks/sec drop vs the baseline")
+    args = parser.parse_args()
+
+    profile = FleetProfile.from_json(args.profile)
+    tmp = tempfile.TemporaryDirectory()
+    db_path = os.path.join(tmp.name, "fleet.db")
+    os.environ.update({
+        "DB_URL": f"sqlite:///{db_path}",
+        "SERVICES_CONFIG_PATH": os.path.join(tmp.name, "none.json"),
+        "HEALTH_CHECK_INTERVAL_SECONDS": str(args.interval),
+        "HEALTH_CHECK_MAX_CONCURRENCY": str(args.concurrency),
+        "HTTP_TIMEOUT_SECONDS": str(args.http_timeout),
+        "HTTP_MAX_CONNECTIONS": str(args.concurrency),
+        "HTTP_MAX_KEEPALIVE_CONNECTIONS": str(args.concurrency),
+        "RETENTION_ENABLED": "false",
+    })
+    from app.infrastructure.db.base import engine
+    from app.infrastructure.db.migrations import run_migrations
+
+    ports = [args.base_port + i for i in range(args.stub_processes)]
+    stubs = _start_stubs(args.stub_processes, args.base_port, profile)
+    try:
+        run_migrations(engine)
+        _register(db_path, args.services, ports, args.expected_version)
+        print(f"{args.services} services on {len(ports)} stub server(s), interval {args.interval}s, "
+              f"measuring {args.duration:.0f}s after {args.warmup:.0f}s warm-up")
+        metrics = asyncio.run(_measure(args, db_path))
+    finally:
+        for stub in stubs:
+            stub.terminate()
+            stub.wait()
+        engine.dispose()
+        tmp.cleanup()
+
+    result = {
+        "benchmark": "scheduler_fleet",
+        **_git_commit(),
+        "recordedAt": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "params": {
+            "services": args.services, "intervalSeconds": args.interval, "durationSeconds": args.duration,
+            "concurrency": args.concurrency, "httpTimeoutSeconds": args.http_timeout,
+            "stubProcesses": args.stub_processes, "profile": profile.to_json(),
+        },
+        "metrics": metrics,
+    }
+    with open(args.output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(json.dumps(metrics, indent=2))
+    print(f"results written to {args.output}")
+
+    problems = _compare(result, args.baseline, args.tolerance) if args.baseline else []
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
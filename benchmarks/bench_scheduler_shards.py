@@ -0,0 +1,308 @@
+# benchmarks/bench_scheduler_shards.py
+"""
+The scheduler under `uvicorn --workers N`: probing divided vs multiplied.
+
+First starts uvicorn --workers N on an empty database, so every worker runs
+the schema migrations at the same moment, and checks that all of them came
+up and each migration was recorded once. Then registers --services services
+pointing at a local fleet stub server, runs the real app with uvicorn
+--workers for each scenario and measures,
+after the leases have settled, how many checks each service got per
+interval (1.0 = checked exactly once per interval):
+- 1 worker,
+- N workers with SCHEDULER_SHARDS=0 (no coordination: every worker checks everything),
+- N workers with shard leases (the default),
+and for the sharded run:
+- how the shards are spread over the workers,
+- failover: one worker is SIGKILLed; time until all its shards are held by
+  live workers again, and checks per interval afterwards,
+- GET /health lists every service whichever worker answers (peer refresh),
+  and stops listing a disabled service on every worker.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_scheduler_shards --services 200 --workers 4 --interval 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import datetime
+from typing import Dict, List, Optional
+
+_tmp = tempfile.TemporaryDirectory()
+_db_path = os.path.join(_tmp.name, "shards.db")
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{_db_path}"
+os.environ["SERVICES_CONFIG_PATH"] = os.path.join(_tmp.name, "none.json")
+
+from app.infrastructure.db.migrations import MIGRATIONS  # noqa: E402
+from benchmarks.fleet_stub_server import FleetProfile  # noqa: E402
+
+TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"  # how SQLAlchemy stores DateTime in SQLite
+
+
+def _query(sql: str, *params) -> list:  # noqa: ANN002
+    conn = sqlite3.connect(_db_path, timeout=30)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+        conn.commit()
+        return rows
+    finally:
+        conn.close()
+
+
+def _now() -> str:
+    return datetime.utcnow().strftime(TS_FORMAT)
+
+
+def _start_stub(port: int) -> subprocess.Popen:
+    profile = FleetProfile(latency_median_ms=5.0, error_rate=0.0, timeout_rate=0.0, hang_rate=0.0)
+    stub = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.fleet_stub_server", "--port", str(port),
+         "--profile", json.dumps(profile.to_json())],
+        stdout=subprocess.PIPE, text=True,
+    )
+    if not (stub.stdout.readline() or "").startswith("READY"):
+        raise RuntimeError(f"stub server on port {port} did not start")
+    return stub
+
+
+def _register(services: int, stub_port: int) -> None:
+    conn = sqlite3.connect(_db_path)
+    conn.executemany(
+        "INSERT INTO services (id, name, url, environment, enabled) VALUES (?, ?, ?, 'production', 1)",
+        [(f"svc-{n}", f"Service {n}", f"http://127.0.0.1:{stub_port}/svc/{n}") for n in range(services)],
+    )
+    conn.commit()
+    conn.close()
+
+
+class App:
+    """
+    uvicorn --workers N running the monitor against the scratch DB.
+    """
+
+    def __init__(
+        self, workers: int, port: int, args: argparse.Namespace, shards: int, log_path: Optional[str] = None,
+    ) -> None:
+        env = dict(
+            os.environ,
+            HEALTH_CHECK_INTERVAL_SECONDS=str(args.interval),
+            HEALTH_CHECK_CATALOGUE_REFRESH_SECONDS="30",
+            SCHEDULER_SHARDS=str(shards),
+            SCHEDULER_LEASE_TTL_SECONDS=str(args.lease_ttl),
+            SCHEDULER_PEER_REFRESH_SECONDS="1",
+            SERVICES_CONFIG_RELOAD_SECONDS="0",
+        )
+        self.port = port
+        self._log = open(log_path, "w") if log_path else subprocess.DEVNULL
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+             "--workers", str(workers), "--log-level", "warning"],
+            env=env, stdout=subprocess.DEVNULL, stderr=self._log,
+        )
+        self._wait_ready()
+
+    def _wait_ready(self) -> None:
+        deadline = time.time() + 60
+        while time.time() < deadline:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{self.port}/ping", timeout=1).read()
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise RuntimeError("app did not start")
+
+    def worker_pids(self) -> List[int]:
+        out = subprocess.run(["pgrep", "-P", str(self.proc.pid)], capture_output=True, text=True).stdout
+        # uvicorn's supervisor also forks a multiprocessing helper; workers are the ones serving requests
+        return [int(pid) for pid in out.split()]
+
+    def get_json(self, path: str) -> object:
+        with urllib.request.urlopen(f"http://127.0.0.1:{self.port}{path}", timeout=10) as response:
+            return json.loads(response.read())
+
+    def stop(self) -> None:
+        self.proc.send_signal(signal.SIGTERM)
+        try:
+            self.proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        if self._log is not subprocess.DEVNULL:
+            self._log.close()
+
+
+def _checks_per_interval(services: int, interval: float, seconds: float) -> float:
+    start = _now()
+    time.sleep(seconds)
+    end = _now()
+    # The write-behind writer flushes every few hundred ms; let it catch up
+    time.sleep(1.0)
+    checks = _query("SELECT count(*) FROM health_checks WHERE timestamp >= ? AND timestamp < ?", start, end)[0][0]
+    return checks / (services * seconds / interval)
+
+
+def _live_leases(exclude_pid: Optional[int] = None) -> Dict[str, int]:
+    rows = _query("SELECT owner, count(*) FROM scheduler_leases WHERE expires_at > ? GROUP BY owner", _now())
+    return {owner: n for owner, n in rows if exclude_pid is None or f":{exclude_pid}:" not in owner}
+
+
+def _migrate_concurrently(args: argparse.Namespace) -> List[str]:
+    """
+    Every worker of a fresh `uvicorn --workers N` migrates the empty DB at once.
+    """
+    problems: List[str] = []
+    log_path = os.path.join(_tmp.name, "migrate.log")
+    app = App(args.workers, args.base_port + 1, args, args.shards, log_path=log_path)
+    try:
+        time.sleep(2)  # the first worker to answer /ping isn't proof the others started
+    finally:
+        app.stop()
+    with open(log_path) as log:
+        failed = log.read().count("Application startup failed")
+    recorded = dict(_query("SELECT version, count(*) FROM schema_migrations GROUP BY version"))
+    expected = {m.version: 1 for m in MIGRATIONS}
+    print(f"{args.workers} workers migrating an empty DB at once: {failed} failed to start, "
+          f"{sum(recorded.values())} migration rows for {len(expected)} migrations")
+    if failed:
+        problems.append(f"{failed} of {args.workers} workers failed to start during concurrent migrations")
+    if recorded != expected:
+        problems.append(f"schema_migrations after concurrent startup: {recorded}, expected each version once")
+    return problems
+
+
+def _check_disabled_service_dropped(app: App, args: argparse.Namespace) -> List[str]:
+    """
+    Disable a service behind every worker's back (straight in the DB): after
+    a couple of peer refreshes no worker may still list it in /health or
+    serve its cached /services entry. Enabled again, every worker lists it.
+    """
+    # Connections are spread over the workers; ask enough times to reach each one
+    requests = 8 * args.workers
+    for _ in range(requests):
+        app.get_json("/services/svc-0")  # cache it everywhere
+    _query("UPDATE services SET enabled = 0 WHERE id = 'svc-0'")
+    try:
+        time.sleep(3)  # SCHEDULER_PEER_REFRESH_SECONDS=1
+        still_listed = sum(
+            any(row.get("serviceId") == "svc-0" for row in app.get_json("/health/")) for _ in range(requests)
+        )
+        still_enabled = sum(bool(app.get_json("/services/svc-0").get("enabled")) for _ in range(requests))
+    finally:
+        _query("UPDATE services SET enabled = 1 WHERE id = 'svc-0'")
+    # Back on: its owner checks it again within an interval, the others pick that up
+    time.sleep(args.interval + 3)
+    missing = sum(
+        not any(row.get("serviceId") == "svc-0" for row in app.get_json("/health/")) for _ in range(requests)
+    )
+    print(f"  disabled svc-0: still listed by {still_listed}/{requests} GET /health responses, "
+          f"shown enabled by {still_enabled}/{requests} GET /services/svc-0; "
+          f"re-enabled: missing from {missing}/{requests}")
+    problems = []
+    if missing:
+        problems.append(f"re-enabled service missing from {missing} GET /health responses")
+    if still_listed:
+        problems.append(f"disabled service still listed by {still_listed} GET /health responses")
+    if still_enabled:
+        problems.append(f"disabled service shown enabled by {still_enabled} GET /services/svc-0 responses")
+    return problems
+
+
+def _run(args: argparse.Namespace) -> List[str]:
+    problems = _migrate_concurrently(args)
+    stub = _start_stub(args.base_port)
+    _register(args.services, args.base_port)
+    settle = args.lease_ttl + 3
+    results: Dict[str, float] = {}
+    try:
+        for label, workers, shards in (
+            ("1 worker", 1, args.shards),
+            (f"{args.workers} workers, no coordination", args.workers, 0),
+            (f"{args.workers} workers, shard leases", args.workers, args.shards),
+        ):
+            app = App(workers, args.base_port + 1, args, shards)
+            try:
+                time.sleep(settle)
+                results[label] = _checks_per_interval(args.services, args.interval, args.duration)
+                print(f"{label:38s} {results[label]:5.2f} checks per service per interval")
+                if shards == 0 or workers == 1:
+                    continue
+
+                spread = _live_leases()
+                print(f"  shards per worker: {sorted(spread.values(), reverse=True)} (of {shards})")
+                if len(spread) != workers or sum(spread.values()) != shards:
+                    problems.append(f"leases not spread over {workers} workers: {spread}")
+
+                health = app.get_json("/health/")
+                listed = len(health) if isinstance(health, list) else 0
+                print(f"  GET /health lists {listed}/{args.services} services")
+                if listed != args.services:
+                    problems.append(f"/health listed {listed} of {args.services} services")
+
+                problems += _check_disabled_service_dropped(app, args)
+
+                victim = next(
+                    (pid for pid in app.worker_pids() if any(f":{pid}:" in owner for owner in spread)), None
+                )
+                if victim is None:
+                    problems.append("could not find a worker process holding leases")
+                    continue
+                lost = sum(n for owner, n in spread.items() if f":{victim}:" in owner)
+                os.kill(victim, signal.SIGKILL)
+                killed_at = time.perf_counter()
+                while sum(_live_leases(exclude_pid=victim).values()) < shards:
+                    if time.perf_counter() - killed_at > 4 * args.lease_ttl:
+                        break
+                    time.sleep(0.2)
+                failover = time.perf_counter() - killed_at
+                covered = sum(_live_leases(exclude_pid=victim).values())
+                print(f"  killed worker {victim} holding {lost} shards: all {shards} shards held again after "
+                      f"{failover:.1f} s" if covered == shards else f"  only {covered}/{shards} shards recovered")
+                if covered != shards or failover > 2 * args.lease_ttl:
+                    problems.append(f"failover: {covered}/{shards} shards after {failover:.1f} s")
+                time.sleep(args.interval)
+                after = _checks_per_interval(args.services, args.interval, args.duration)
+                print(f"  after failover: {after:.2f} checks per service per interval")
+                if not 0.7 <= after <= 1.3:
+                    problems.append(f"after failover: {after:.2f} checks per service per interval")
+            finally:
+                app.stop()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+    sharded = results[f"{args.workers} workers, shard leases"]
+    if not 0.7 <= sharded <= 1.3:
+        problems.append(f"sharded: {sharded:.2f} checks per service per interval, expected ~1")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--shards", type=int, default=64)
+    parser.add_argument("--interval", type=float, default=5.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--lease-ttl", type=float, default=6.0)
+    parser.add_argument("--base-port", type=int, default=9300)
+    args = parser.parse_args()
+
+    problems = _run(args)
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
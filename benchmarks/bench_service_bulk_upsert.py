@@ -0,0 +1,149 @@
+# benchmarks/bench_service_bulk_upsert.py
+"""
+Registering a large service catalogue: per-service save vs set-based upsert.
+
+For --services services it reports the time to:
+- per-row:  the old save_or_update_many (SELECT, INSERT/UPDATE and commit per service),
+- upsert:   SQLiteServiceRepository.save_or_update_many, one INSERT ... ON CONFLICT
+            DO UPDATE transaction, first creating every service, then updating all of them,
+- api:      POST /services:bulk with every service in one body (validation included),
+and checks that:
+- the table holds exactly --services rows with the updated values afterwards,
+- the bulk endpoint stays under --target-ms.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_service_bulk_upsert --services 10000 --target-ms 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import List
+
+_tmp = tempfile.TemporaryDirectory()
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'bulk_upsert.db')}"
+os.environ["SERVICES_CONFIG_PATH"] = os.path.join(_tmp.name, "none.json")
+
+import httpx  # noqa: E402
+
+from app.domain.model.service import Service  # noqa: E402
+from app.infrastructure.db.base import SessionLocal, engine  # noqa: E402
+from app.infrastructure.db.migrations import run_migrations  # noqa: E402
+from app.infrastructure.db.models import ServiceORM  # noqa: E402
+from app.infrastructure.db.sqlite_service_repository import SQLiteServiceRepository  # noqa: E402
+from app.main import service_reliability_app  # noqa: E402
+
+
+def _services(count: int, name: str) -> List[Service]:
+    return [
+        Service.from_primitives(
+            id=f"svc-{n}", name=f"{name} {n}", url=f"http://svc-{n}.invalid/health",
+            expected_version="1.0.0", environment="production",
+        )
+        for n in range(count)
+    ]
+
+
+def _per_row_save(db, services: List[Service]) -> None:  # noqa: ANN001
+    # What save_or_update_many used to do for each service
+    for service in services:
+        existing = db.query(ServiceORM).filter(ServiceORM.id == str(service.id)).first()
+        if existing:
+            existing.name = service.name
+            existing.url = service.url
+        else:
+            db.add(ServiceORM(
+                id=str(service.id), name=service.name, url=service.url,
+                expected_version=service.expected_version.value, environment=service.environment.value,
+                enabled=service.enabled,
+            ))
+        db.commit()
+
+
+def _clear() -> None:
+    conn = sqlite3.connect(engine.url.database)
+    conn.execute("DELETE FROM services")
+    conn.commit()
+    conn.close()
+
+
+def _rows(name_prefix: str) -> tuple:
+    conn = sqlite3.connect(engine.url.database)
+    try:
+        total = conn.execute("SELECT count(*) FROM services").fetchone()[0]
+        named = conn.execute("SELECT count(*) FROM services WHERE name LIKE ?", (f"{name_prefix} %",)).fetchone()[0]
+        return total, named
+    finally:
+        conn.close()
+
+
+def _timed(fn) -> float:  # noqa: ANN001
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        fn(db)
+        return time.perf_counter() - started
+    finally:
+        db.close()
+
+
+async def _post_bulk(count: int) -> tuple:
+    body = [
+        {"serviceId": f"svc-{n}", "name": f"Api {n}", "url": f"http://svc-{n}.invalid/health",
+         "expectedVersion": "1.0.0", "environment": "staging"}
+        for n in range(count)
+    ]
+    transport = httpx.ASGITransport(app=service_reliability_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        started = time.perf_counter()
+        response = await client.post("/services:bulk", json=body)
+        elapsed = time.perf_counter() - started
+    return elapsed, response
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=10_000)
+    parser.add_argument("--target-ms", type=float, default=1_000.0)
+    args = parser.parse_args()
+
+    run_migrations(engine)
+    problems: List[str] = []
+    count = args.services
+
+    per_row = _timed(lambda db: _per_row_save(db, _services(count, "Row")))
+    _clear()
+    created = _timed(lambda db: SQLiteServiceRepository(db).save_or_update_many(_services(count, "Created")))
+    updated = _timed(lambda db: SQLiteServiceRepository(db).save_or_update_many(_services(count, "Updated")))
+    if _rows("Updated") != (count, count):
+        problems.append(f"after upsert: (rows, updated rows) = {_rows('Updated')}, expected ({count}, {count})")
+
+    api, response = asyncio.run(_post_bulk(count))
+    if response.status_code != 200 or response.json()["registered"] != count:
+        problems.append(f"POST /services:bulk answered {response.status_code}: {response.text[:200]}")
+    if _rows("Api") != (count, count):
+        problems.append(f"after POST /services:bulk: (rows, updated rows) = {_rows('Api')}")
+    if api * 1000 > args.target_ms:
+        problems.append(f"POST /services:bulk took {api * 1000:.0f} ms (target {args.target_ms:.0f} ms)")
+
+    print(f"{count} services:")
+    print(f"  per-row save       {per_row * 1000:9.1f} ms  ({count / per_row:10.0f} services/s)")
+    print(f"  upsert (create)    {created * 1000:9.1f} ms  ({count / created:10.0f} services/s)")
+    print(f"  upsert (update)    {updated * 1000:9.1f} ms  ({count / updated:10.0f} services/s)")
+    print(f"  POST /services:bulk{api * 1000:9.1f} ms  (target {args.target_ms:.0f} ms)")
+
+    engine.dispose()
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
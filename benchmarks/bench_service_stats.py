@@ -0,0 +1,183 @@
+# benchmarks/bench_service_stats.py
+"""
+GET /health/{id}/stats over a 1M-check window.
+
+Seeds one service with --rows checks (1s apart, ~2% DOWN in short runs) and
+compares:
+- per-object:  find_history(RAW) -> HealthCheckBucket objects, stats in a Python loop
+               (what building stats on top of the existing object API would cost)
+- vectorised:  load_series() column pull + HealthStatsCalculator (NumPy)
+- endpoint:    the full HTTP request through the ASGI app
+
+Exits non-zero if the endpoint's median exceeds --target-ms, and checks the
+vectorised numbers match the per-object ones.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_service_stats --rows 1000000 --target-ms 3000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_tmp = tempfile.TemporaryDirectory()
+# Settings are read at import time, so point the app at a scratch DB first.
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmp.name, 'stats.db')}"
+os.environ["SERVICES_CONFIG_PATH"] = os.path.join(_tmp.name, "none.json")
+
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+
+from app.domain.model.health_check import HistoryResolution  # noqa: E402
+from app.domain.model.value_objects import ServiceId  # noqa: E402
+from app.domain.services.health_stats_calculator import HealthStatsCalculator  # noqa: E402
+from app.infrastructure.db.base import SessionLocal, engine  # noqa: E402
+from app.infrastructure.db.migrations import run_migrations  # noqa: E402
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository  # noqa: E402
+from app.main import service_reliability_app  # noqa: E402
+
+TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"  # how SQLAlchemy stores DateTime in SQLite
+SERVICE = "svc-stats"
+
+
+def _seed(rows: int, end: datetime) -> None:
+    run_migrations(engine)
+    path = engine.url.database
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "INSERT INTO services (id, name, url, environment, enabled) VALUES (?, 'Stats', 'http://stats.invalid', 'dev', 0)",
+        (SERVICE,),
+    )
+    rng = random.Random(7)
+    start = end - timedelta(seconds=rows)
+    down_left = 0
+    batch = []
+    for i in range(rows):
+        if down_left == 0 and rng.random() < 0.004:
+            down_left = rng.randint(1, 10)
+        up = down_left == 0
+        down_left = max(0, down_left - 1)
+        batch.append((
+            SERVICE, (start + timedelta(seconds=i)).strftime(TS_FORMAT), "UP" if up else "DOWN",
+            int(rng.lognormvariate(3.5, 0.6)) if up else None,
+        ))
+        if len(batch) == 100_000:
+            conn.executemany("INSERT INTO health_checks (service_id, timestamp, status, latency_ms) VALUES (?, ?, ?, ?)", batch)
+            batch = []
+    if batch:
+        conn.executemany("INSERT INTO health_checks (service_id, timestamp, status, latency_ms) VALUES (?, ?, ?, ?)", batch)
+    conn.commit()
+    conn.close()
+
+
+def _per_object(start: datetime, end: datetime):
+    db = SessionLocal()
+    try:
+        buckets = SQLiteHealthCheckRepository(db).find_history(ServiceId(SERVICE), start, end, HistoryResolution.RAW)
+    finally:
+        db.close()
+    latencies, up_checks = [], 0
+    repair_times, down_since, prev_up = [], None, True
+    for b in buckets:
+        is_up = b.up_count == 1
+        up_checks += is_up
+        if is_up and b.latency_avg_ms is not None:
+            latencies.append(b.latency_avg_ms)
+        if not is_up and prev_up:
+            down_since = b.bucket_start
+        if is_up and not prev_up and down_since is not None:
+            repair_times.append((b.bucket_start - down_since).total_seconds())
+        prev_up = is_up
+    latencies.sort()
+    return {
+        "checks": len(buckets),
+        "availability": round(100.0 * up_checks / len(buckets), 3),
+        "p99": round(float(np.percentile(latencies, 99)), 1),
+        "mttr": round(statistics.fmean(repair_times), 3),
+    }
+
+
+def _vectorised(start: datetime, end: datetime):
+    db = SessionLocal()
+    try:
+        series = SQLiteHealthCheckRepository(db).load_series(ServiceId(SERVICE), start, end)
+    finally:
+        db.close()
+    stats = HealthStatsCalculator().calculate(series)
+    return {
+        "checks": stats.checks,
+        "availability": stats.availability_percent,
+        "p99": stats.latency_p99_ms,
+        "mttr": stats.mttr_seconds,
+    }
+
+
+def _timed(fn, repeat: int):
+    timings, result = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings), result
+
+
+async def _endpoint(window: str, repeat: int) -> float:
+    app = service_reliability_app()
+    transport = httpx.ASGITransport(app=app)
+    timings = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            response = await client.get(f"/health/{SERVICE}/stats", params={"window": window})
+            timings.append((time.perf_counter() - t0) * 1000)
+            response.raise_for_status()
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--target-ms", type=float, default=3_000.0, help="max median endpoint time for the 1M-check window")
+    args = parser.parse_args()
+
+    end = datetime.utcnow()
+    start = end - timedelta(seconds=args.rows + 60)
+    window = f"{args.rows // 3600 + 1}h"
+    problems = []
+    try:
+        t0 = time.perf_counter()
+        _seed(args.rows, end)
+        print(f"seeded {args.rows:,} checks in {time.perf_counter() - t0:.1f}s (window={window})")
+
+        obj_ms, obj = _timed(lambda: _per_object(start, end), 1)
+        vec_ms, vec = _timed(lambda: _vectorised(start, end), args.repeat)
+        api_ms = asyncio.run(_endpoint(window, args.repeat))
+        print(f"  per-object  {obj_ms:9.1f} ms   {obj}")
+        print(f"  vectorised  {vec_ms:9.1f} ms   {vec}   ({obj_ms / vec_ms:.1f}x)")
+        print(f"  endpoint    {api_ms:9.1f} ms   (target {args.target_ms:.0f} ms)")
+
+        if obj != vec:
+            problems.append(f"vectorised stats differ from per-object stats: {vec} != {obj}")
+        if api_ms > args.target_ms:
+            problems.append(f"endpoint median {api_ms:.0f} ms is over the {args.target_ms:.0f} ms target")
+    finally:
+        engine.dispose()
+        _tmp.cleanup()
+
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
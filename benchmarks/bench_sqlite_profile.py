@@ -0,0 +1,152 @@
+# benchmarks/bench_sqlite_profile.py
+"""
+Concurrent read/write throughput with and without the SQLite engine profile.
+
+For each profile, one writer thread inserts health checks (batches like the
+write-behind writer, plus some single-row commits) while reader threads run
+the API read paths. Reports reads/sec, read p50/p99, written rows/sec and
+lock errors:
+- default:  SQLite defaults (rollback journal, synchronous=FULL), as before
+- tuned:    SQLiteProfile from Settings (WAL, synchronous=NORMAL, mmap, cache, ...)
+
+Usage (from the repo root):
+    python -m benchmarks.bench_sqlite_profile --seconds 5 --readers 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.value_objects import HealthStatus, ServiceId
+from app.infrastructure.db.base import SQLiteProfile, create_db_engine
+from app.infrastructure.db.migrations import run_migrations
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+
+SERVICES = 200
+
+
+def _results(n: int, start: datetime) -> List[HealthCheckResult]:
+    return [
+        HealthCheckResult(
+            service_id=ServiceId(f"svc-{i % SERVICES}"),
+            timestamp=start + timedelta(milliseconds=i),
+            status=HealthStatus.UP if i % 10 else HealthStatus.DOWN,
+            latency_ms=i % 300,
+            version=None,
+            version_matches_expected=None,
+            connect_ms=0,
+        )
+        for i in range(n)
+    ]
+
+
+def _run(path: str, profile: Optional[SQLiteProfile], seconds: float, readers: int, seed_rows: int, batch: int) -> Dict[str, float]:
+    engine = create_db_engine(f"sqlite:///{path}", profile=profile, pool_size=readers + 1)
+    run_migrations(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = factory()
+    SQLiteHealthCheckRepository(db).save_many(_results(seed_rows, datetime(2025, 1, 1)))
+    db.close()
+
+    stop = threading.Event()
+    read_latencies: List[List[float]] = [[] for _ in range(readers)]
+    counters = {"rows_written": 0, "lock_errors": 0}
+    lock = threading.Lock()
+
+    def writer() -> None:
+        db = factory()
+        repo = SQLiteHealthCheckRepository(db)
+        start = datetime(2026, 1, 1)
+        cycle = 0
+        while not stop.is_set():
+            rows = _results(batch, start + timedelta(seconds=cycle))
+            try:
+                repo.save_many(rows)
+                for row in rows[:10]:  # a few per-row commits, like the non-buffered path
+                    repo.save(row)
+                written = len(rows) + 10
+            except OperationalError:
+                db.rollback()
+                written = 0
+                with lock:
+                    counters["lock_errors"] += 1
+            with lock:
+                counters["rows_written"] += written
+            cycle += 1
+        db.close()
+
+    def reader(slot: int) -> None:
+        db = factory()
+        repo = SQLiteHealthCheckRepository(db)
+        i = slot
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            try:
+                if i % 10 == 0:
+                    repo.find_latest_for_all_services()
+                else:
+                    repo.find_recent_by_service_id(ServiceId(f"svc-{i % SERVICES}"), limit=20)
+                db.rollback()  # end the read transaction, as a request-scoped session would
+                read_latencies[slot].append((time.perf_counter() - t0) * 1000)
+            except OperationalError:
+                db.rollback()
+                with lock:
+                    counters["lock_errors"] += 1
+            i += readers
+        db.close()
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+
+    latencies = sorted(l for per_reader in read_latencies for l in per_reader)
+    p99 = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))] if latencies else 0.0
+    return {
+        "reads_per_sec": len(latencies) / elapsed,
+        "read_p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "read_p99_ms": p99,
+        "rows_per_sec": counters["rows_written"] / elapsed,
+        "lock_errors": counters["lock_errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seed-rows", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=200, help="rows per writer transaction")
+    args = parser.parse_args()
+
+    profiles = {"default": None, "tuned": SQLiteProfile.from_settings() or SQLiteProfile()}
+    print(f"{args.readers} readers + 1 writer, {args.seconds:.0f}s per profile, {args.seed_rows:,} seed rows")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, profile in profiles.items():
+            r = _run(os.path.join(tmp, f"{name}.db"), profile, args.seconds, args.readers, args.seed_rows, args.batch)
+            print(
+                f"  {name:<8} reads {r['reads_per_sec']:9,.0f}/s  p50 {r['read_p50_ms']:7.2f} ms  "
+                f"p99 {r['read_p99_ms']:8.2f} ms   writes {r['rows_per_sec']:9,.0f} rows/s   "
+                f"lock errors {r['lock_errors']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
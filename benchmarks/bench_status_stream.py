@@ -0,0 +1,160 @@
+# benchmarks/bench_status_stream.py
+"""
+Fan-out cost of the live dashboard stream (/health/stream).
+
+Builds a snapshot of --services services, opens --viewers SSE streams on a
+StatusBroadcaster and runs --cycles check cycles in which --change-rate of
+the services change status/latency (the rest report the same values again).
+Reports, for 1 viewer and for --viewers viewers:
+- event-loop time per cycle spent recording results and fanning out,
+- rows and bytes each viewer receives per cycle,
+- delivery delay after the coalescing window (p50 / p99),
+and checks that:
+- every viewer receives exactly the changed rows of each cycle (unchanged
+  results are not pushed, only their new check time under "checked"),
+- each cycle is encoded once, however many viewers are connected.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_status_stream --services 1000 --viewers 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from app.domain.model.health_check import HealthCheckResult
+from app.domain.model.service import Service
+from app.domain.model.value_objects import HealthStatus
+from app.infrastructure.cache.status_broadcaster import StatusBroadcaster
+from app.infrastructure.cache.status_snapshot import StatusSnapshot
+
+COALESCE_SECONDS = 0.05
+
+
+def _services(count: int) -> List[Service]:
+    return [
+        Service.from_primitives(f"svc-{i}", f"Service {i}", f"http://svc-{i}.invalid", "1.0.0", "production")
+        for i in range(count)
+    ]
+
+
+def _result(service: Service, status: HealthStatus, latency: int) -> HealthCheckResult:
+    return HealthCheckResult(
+        service_id=service.id, timestamp=datetime.utcnow(), status=status,
+        latency_ms=latency, version=None, version_matches_expected=None,
+    )
+
+
+async def _viewer(broadcaster: StatusBroadcaster, received: List[str], arrivals: List[float]) -> None:
+    # Frames are kept as sent and parsed after the run, so the viewers' own
+    # work doesn't count as fan-out cost
+    async for frame in broadcaster.stream():
+        if frame.startswith("id:") and "event: update" in frame:
+            arrivals.append(time.perf_counter())
+            received.append(frame)
+
+
+def _changed_ids(frame: str) -> set:
+    return {row["serviceId"] for row in json.loads(frame.split("data: ", 1)[1])["services"]}
+
+
+def _checked_ids(frame: str) -> set:
+    return set(json.loads(frame.split("data: ", 1)[1])["checked"])
+
+
+async def _run(services: int, viewers: int, cycles: int, change_rate: float) -> Dict[str, object]:
+    rng = random.Random(3)
+    catalogue = _services(services)
+    snapshot = StatusSnapshot()
+    snapshot.warm(catalogue, {s.id: _result(s, HealthStatus.UP, 50) for s in catalogue})
+    broadcaster = StatusBroadcaster(snapshot, coalesce_seconds=COALESCE_SECONDS, queue_size=cycles + 4)
+    broadcaster.start()
+
+    received = [[] for _ in range(viewers)]
+    arrivals = [[] for _ in range(viewers)]
+    tasks = [asyncio.create_task(_viewer(broadcaster, received[v], arrivals[v])) for v in range(viewers)]
+    await asyncio.sleep(0.1)  # let every stream send its snapshot
+
+    current = {s.id: (HealthStatus.UP, 50) for s in catalogue}
+    expected: List[set] = []
+    loop_ms: List[float] = []
+    delays: List[float] = []
+    for _ in range(cycles):
+        changed = set(rng.sample(range(services), int(services * change_rate)))
+        t0 = time.perf_counter()
+        for i, service in enumerate(catalogue):
+            if i in changed:
+                status, latency = current[service.id]
+                current[service.id] = (status, latency + 1) if rng.random() < 0.8 else (
+                    HealthStatus.DOWN if status is HealthStatus.UP else HealthStatus.UP, latency
+                )
+            snapshot.record(service, _result(service, *current[service.id]))
+        recorded = time.perf_counter()
+        expected.append({f"svc-{i}" for i in changed})
+        # Wait for the coalesced flush, then time how long fan-out + delivery took
+        await asyncio.sleep(COALESCE_SECONDS)
+        flush_start = time.perf_counter()
+        while any(len(r) < len(expected) for r in received):
+            await asyncio.sleep(0.001)
+        loop_ms.append((recorded - t0) * 1000 + (time.perf_counter() - flush_start) * 1000)
+        delays.extend((a[-1] - recorded) * 1000 - COALESCE_SECONDS * 1000 for a in arrivals)
+
+    await broadcaster.stop()
+    await asyncio.gather(*tasks)
+
+    parsed: Dict[int, set] = {}  # every viewer got the same frame objects; parse each once
+    exact = all(
+        [parsed.setdefault(id(frame), _changed_ids(frame)) for frame in r] == expected for r in received
+    )
+    everyone = {f"svc-{i}" for i in range(services)}
+    timestamps = all(_checked_ids(frame) == everyone - changed for frame, changed in zip(received[0], expected))
+    return {
+        "cycle_ms": statistics.median(loop_ms),
+        "rows": statistics.mean(len(_changed_ids(frame)) for frame in received[0]),
+        "bytes": statistics.mean(len(frame) for frame in received[0]),
+        "p50": statistics.median(delays),
+        "p99": sorted(delays)[int(len(delays) * 0.99) - 1],
+        "frames": broadcaster.frames_sent,
+        "exact": exact,
+        "timestamps": timestamps,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=1_000)
+    parser.add_argument("--viewers", type=int, default=1_000)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--change-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    problems = []
+    for viewers in (1, args.viewers):
+        r = asyncio.run(_run(args.services, viewers, args.cycles, args.change_rate))
+        print(
+            f"  {viewers:5d} viewer(s): {r['cycle_ms']:7.1f} ms/cycle on the loop, "
+            f"{r['rows']:.0f} of {args.services} rows/update, {r['bytes'] / 1024:.1f} KiB/update, "
+            f"delivery p50 {r['p50']:.1f} ms p99 {r['p99']:.1f} ms"
+        )
+        if not r["exact"]:
+            problems.append(f"{viewers} viewers: updates did not contain exactly the changed services")
+        if not r["timestamps"]:
+            problems.append(f"{viewers} viewers: unchanged services did not all get their new check time")
+        if r["frames"] != args.cycles:
+            problems.append(f"{viewers} viewers: {r['frames']} frames encoded for {args.cycles} cycles")
+
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
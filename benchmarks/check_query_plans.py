@@ -0,0 +1,151 @@
+# benchmarks/check_query_plans.py
+"""
+Regression check for the health_checks read paths.
+
+Runs each SQLiteHealthCheckRepository read method against a migrated
+database, captures the SQL it issues and asserts on EXPLAIN QUERY PLAN:
+- the (service_id, timestamp) index is used,
+- no temp B-tree sort step and no full table scan of health_checks.
+
+Also upgrades a database with the original (pre-migration) schema and
+checks the index is created there.
+
+Exits non-zero on failure, so it can run in CI:
+    python -m benchmarks.check_query_plans
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.model.value_objects import ServiceId
+from app.infrastructure.db.migrations import run_migrations
+from app.infrastructure.db.sqlite_health_check_repository import SQLiteHealthCheckRepository
+
+INDEX_NAME = "ix_health_checks_service_id_timestamp"
+
+# Schema as created by the original create_all(), before any migration existed.
+LEGACY_SCHEMA = """
+CREATE TABLE services (
+    id VARCHAR NOT NULL, name VARCHAR NOT NULL, url VARCHAR NOT NULL,
+    expected_version VARCHAR, environment VARCHAR, enabled BOOLEAN, PRIMARY KEY (id)
+);
+CREATE INDEX ix_services_id ON services (id);
+CREATE TABLE health_checks (
+    id INTEGER NOT NULL, service_id VARCHAR NOT NULL, timestamp DATETIME NOT NULL,
+    status VARCHAR NOT NULL, latency_ms INTEGER, version VARCHAR,
+    version_matches_expected BOOLEAN, error_message VARCHAR, PRIMARY KEY (id)
+);
+CREATE INDEX ix_health_checks_service_id ON health_checks (service_id);
+CREATE INDEX ix_health_checks_id ON health_checks (id);
+"""
+
+
+def _seed(path: str) -> None:
+    conn = sqlite3.connect(path)
+    start = datetime(2025, 1, 1)
+    conn.executemany(
+        "INSERT INTO health_checks (service_id, timestamp, status, latency_ms) VALUES (?, ?, 'UP', 10)",
+        [
+            (f"svc-{s}", (start + timedelta(seconds=15 * i)).isoformat(sep=" "))
+            for i in range(200)
+            for s in range(20)
+        ],
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def _plans_for(path: str, call: Callable[[SQLiteHealthCheckRepository], object]) -> List[Tuple[str, str]]:
+    """
+    Run `call` against the repository and return (sql, plan) for every SELECT it issued.
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    captured: List[Tuple[str, object]] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    db = sessionmaker(bind=engine)()
+    try:
+        call(SQLiteHealthCheckRepository(db))
+    finally:
+        db.close()
+        engine.dispose()
+
+    raw = sqlite3.connect(path)
+    try:
+        return [
+            (sql, "\n".join(row[3] for row in raw.execute(f"EXPLAIN QUERY PLAN {sql}", params)))
+            for sql, params in captured
+        ]
+    finally:
+        raw.close()
+
+
+def _check_plan(name: str, plan: str) -> List[str]:
+    problems = []
+    if INDEX_NAME not in plan:
+        problems.append(f"{name}: {INDEX_NAME} not used")
+    if "TEMP B-TREE" in plan:
+        problems.append(f"{name}: sort step (temp B-tree) in plan")
+    for line in plan.splitlines():
+        if line.startswith("SCAN health_checks") and "INDEX" not in line:
+            problems.append(f"{name}: full table scan of health_checks")
+    return problems
+
+
+def main() -> int:
+    problems: List[str] = []
+    read_paths = {
+        "find_latest_by_service_id": lambda repo: repo.find_latest_by_service_id(ServiceId("svc-3")),
+        "find_recent_by_service_id": lambda repo: repo.find_recent_by_service_id(ServiceId("svc-3"), limit=20),
+        "find_latest_for_all_services": lambda repo: repo.find_latest_for_all_services(),
+        "find_page_by_service_id": lambda repo: repo.find_page_by_service_id(
+            ServiceId("svc-3"), datetime(2025, 1, 1), datetime(2025, 1, 2), after=(datetime(2025, 1, 1, 0, 10), 100)
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Fresh database
+        fresh = os.path.join(tmp, "fresh.db")
+        run_migrations(create_engine(f"sqlite:///{fresh}"))
+        _seed(fresh)
+        for name, call in read_paths.items():
+            for sql, plan in _plans_for(fresh, call):
+                print(f"--- {name}\n{plan}")
+                problems.extend(_check_plan(name, plan))
+
+        # Existing database created before migrations existed
+        legacy = os.path.join(tmp, "legacy.db")
+        conn = sqlite3.connect(legacy)
+        conn.executescript(LEGACY_SCHEMA)
+        conn.close()
+        run_migrations(create_engine(f"sqlite:///{legacy}"))
+        conn = sqlite3.connect(legacy)
+        indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        if INDEX_NAME not in indexes:
+            problems.append(f"legacy upgrade: {INDEX_NAME} was not created")
+        if "ix_health_checks_service_id" in indexes:
+            problems.append("legacy upgrade: superseded ix_health_checks_service_id was not dropped")
+
+    if problems:
+        print("\nFAILED:\n  " + "\n  ".join(problems))
+        return 1
+    print("\nOK: all health_checks read paths use the composite index without a sort step")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
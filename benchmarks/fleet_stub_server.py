@@ -0,0 +1,152 @@
+# benchmarks/fleet_stub_server.py
+"""
+A local HTTP server that pretends to be thousands of monitored services.
+
+GET /svc/<n> answers as simulated service n. Behaviour is drawn from a
+FleetProfile: each service gets its own latency (a per-service lognormal
+factor on the fleet median, so some services are consistently slower) and
+a reported version; each request may additionally
+- fail with 503             (error_rate),
+- answer only after timeout_ms, i.e. past the monitor's HTTP timeout (timeout_rate),
+- never answer and keep the connection open (hang_rate).
+Draws are seeded by the service number, so a fleet behaves the same on
+every run.
+
+It is a bare asyncio protocol rather than a web framework, so one process
+can serve a large fleet without becoming the bottleneck. Run it in its own
+process (the fleet benchmark does) so its CPU isn't charged to the monitor:
+
+    python -m benchmarks.fleet_stub_server --port 9100 --profile '{"errorRate": 0.05}'
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from dataclasses import asdict, dataclass, field, fields
+from typing import Dict
+
+
+@dataclass
+class FleetProfile:
+    latency_median_ms: float = 40.0
+    latency_sigma: float = 0.4  # request-to-request spread (lognormal sigma)
+    service_sigma: float = 0.6  # spread of per-service median latencies
+    error_rate: float = 0.02
+    timeout_rate: float = 0.005
+    timeout_ms: float = 30_000.0  # keep above the monitor's HTTP timeout
+    hang_rate: float = 0.002
+    versions: Dict[str, float] = field(default_factory=lambda: {"1.4.2": 0.9, "1.4.1": 0.1})
+
+    @classmethod
+    def from_json(cls, text: str) -> "FleetProfile":
+        """
+        camelCase keys, e.g. {"latencyMedianMs": 80, "errorRate": 0.1}; missing keys keep their defaults.
+        """
+        data = json.loads(text) if text else {}
+        by_camel = {_camel(f.name): f.name for f in fields(cls)}
+        return cls(**{by_camel.get(key, key): value for key, value in data.items()})
+
+    def to_json(self) -> Dict[str, object]:
+        return {_camel(key): value for key, value in asdict(self).items()}
+
+
+def _camel(name: str) -> str:
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+class _SimulatedService:
+    __slots__ = ("median_ms", "version", "rng")
+
+    def __init__(self, number: int, profile: FleetProfile) -> None:
+        rng = random.Random(number)
+        self.median_ms = profile.latency_median_ms * rng.lognormvariate(0.0, profile.service_sigma)
+        versions, weights = zip(*profile.versions.items()) if profile.versions else ((None,), (1,))
+        self.version = rng.choices(versions, weights)[0]
+        self.rng = rng
+
+
+class FleetStubServer:
+    def __init__(self, profile: FleetProfile) -> None:
+        self._profile = profile
+        self._services: Dict[int, _SimulatedService] = {}
+        self.requests = 0
+
+    def _service(self, number: int) -> _SimulatedService:
+        service = self._services.get(number)
+        if service is None:
+            service = self._services[number] = _SimulatedService(number, self._profile)
+        return service
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:  # keep-alive: serve requests until the client closes
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass  # headers are ignored; GETs carry no body
+                self.requests += 1
+                status, body = await self._respond(request_line)
+                if status is None:  # hung: never answer, just wait for the client to give up
+                    await reader.read()
+                    return
+                writer.write(
+                    b"HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s"
+                    % (status, b"OK" if status == 200 else b"Error", len(body), body)
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, request_line: bytes) -> tuple:
+        try:
+            number = int(request_line.split()[1].rsplit(b"/", 1)[1])
+        except (IndexError, ValueError):
+            return 404, b'{"error":"unknown service"}'
+        service = self._service(number)
+        profile, rng = self._profile, service.rng
+
+        roll = rng.random()
+        if roll < profile.hang_rate:
+            return None, b""
+        if roll < profile.hang_rate + profile.timeout_rate:
+            await asyncio.sleep(profile.timeout_ms / 1000)
+        else:
+            await asyncio.sleep(service.median_ms * rng.lognormvariate(0.0, profile.latency_sigma) / 1000)
+        if rng.random() < profile.error_rate:
+            return 503, b'{"error":"simulated failure"}'
+        payload = {"status": "ok"}
+        if service.version is not None:
+            payload["version"] = service.version
+        return 200, json.dumps(payload).encode()
+
+
+async def serve(port: int, profile: FleetProfile, host: str = "127.0.0.1") -> None:
+    stub = FleetStubServer(profile)
+    server = await asyncio.start_server(stub.handle, host, port, backlog=4096)
+    print(f"READY {host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--profile", default="", help="FleetProfile as JSON (camelCase keys)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.port, FleetProfile.from_json(args.profile), args.host))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,11 +4,116 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     app_name: str = "Service Reliability Monitor"
     db_url: str = "sqlite:///./health.db"
+    db_thread_pool_size: int = 4  # threads that run blocking DB calls off the event loop
+
+    # SQLAlchemy connection pool (keep pool_size >= db_thread_pool_size)
+    db_pool_size: int = 8
+    db_max_overflow: int = 4
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_pre_ping: bool = False
+
+    # SQLite engine profile, applied as PRAGMAs on every new connection.
+    # Set SQLITE_TUNED=false to get SQLite's defaults (rollback journal, FULL sync).
+    sqlite_tuned: bool = True
+    sqlite_journal_mode: str = "WAL"  # readers no longer block on the writer
+    sqlite_synchronous: str = "NORMAL"  # safe with WAL; fsync at checkpoints only
+    sqlite_busy_timeout_ms: int = 5_000  # wait for a lock instead of failing with "database is locked"
+    sqlite_cache_size_kib: int = 65_536  # page cache per connection
+    sqlite_mmap_size_bytes: int = 268_435_456  # 256 MiB; 0 disables memory-mapped I/O
+    sqlite_temp_store: str = "MEMORY"  # temp B-trees/sorts in memory rather than temp files
     health_check_interval_seconds: int = 60
     services_config_path: str = "config/services.json"
+    services_config_reload_seconds: float = 5.0  # how often the file is checked for edits; 0 disables hot reload
+    services_bulk_max_items: int = 50_000  # POST /services:bulk rejects larger bodies with 413
+
+    # Per-service scheduling defaults (services can override both)
+    health_check_jitter_seconds: float = 0.0
+    health_check_catalogue_refresh_seconds: int = 30  # how often enabled services are re-read
+
+    # Multi-worker coordination (uvicorn --workers N): services are hashed into
+    # shards and each worker checks only the shards it holds a DB lease on
+    # (a lone worker simply holds them all).
+    scheduler_shards: int = 64  # 0 = no coordination (every worker checks every service)
+    scheduler_lease_ttl_seconds: float = 15.0  # a dead worker's shards move after this; renewed every ttl/3
+    scheduler_peer_refresh_seconds: float = 5.0  # how often other workers' latest results are read into /health
+
+    # How many checks may be in flight at once.
+    # max_concurrency=1 reproduces the old sequential behaviour.
+    health_check_max_concurrency: int = 50
+    health_check_max_concurrency_per_host: int | None = None  # None = no per-host limit
+
+    # Write-behind buffering of health check results
+    health_check_write_behind: bool = True
+    health_check_write_queue_size: int = 10_000  # put() blocks when full (backpressure)
+    health_check_write_flush_interval_ms: int = 1_000
+    health_check_write_max_batch: int = 1_000
+    health_check_write_max_attempts: int = 6  # a batch failing this many writes in a row is dropped (and counted)
+    health_check_write_retry_base_seconds: float = 0.5  # backoff doubles per failed write...
+    health_check_write_retry_max_seconds: float = 10.0  # ...up to this
+
+    # Retention: raw checks are folded into 1-minute rollups, those into 1-hour rollups
+    retention_enabled: bool = True
+    retention_raw_hours: int = 48
+    retention_minute_rollup_days: int = 14
+    retention_hour_rollup_days: int = 400  # 0 = keep hourly rollups forever
+    retention_compaction_interval_seconds: int = 300
+    retention_batch_size: int = 2_000  # rows per delete transaction (bounds write-lock time)
+    retention_batch_pause_ms: int = 50  # gap between batches so the writer and readers get the lock
+
+    # Live dashboard (Server-Sent Events at /health/stream)
+    dashboard_stream_coalesce_ms: int = 500  # changes within this window go out as one update
+    dashboard_stream_queue_size: int = 64  # frames a slow viewer may lag before it is resynced
+    dashboard_stream_keepalive_seconds: float = 15.0
+    dashboard_stream_max_seconds: float = 300.0  # streams end (browser reconnects) so shutdown isn't held up
+
+    # Read API response cache and conditional GETs (ETag / If-None-Match)
+    response_cache_max_entries: int = 1_024  # 0 disables body caching (ETags/304s still work)
+    response_cache_ttl_seconds: float = 5.0  # max age of a cached body or ETag (backstop for writes made elsewhere)
+    http_cache_max_age_seconds: int = 0  # Cache-Control max-age; 0 = "no-cache" (always revalidate)
+
+    # /metrics (Prometheus text format)
+    metrics_enabled: bool = True
+    metrics_max_service_series: int = 1_000  # per-service series beyond this are folded into service="_other"
+
+    # Per-cycle phase timings (/admin/scheduler/cycles) and one-shot cProfile captures
+    scheduler_cycle_history: int = 20  # cycles kept in the ring buffer
+    scheduler_cycle_slowest_services: int = 10
+    scheduler_profiler_enabled: bool = False  # allow POST /admin/scheduler/profile
+    scheduler_profiler_dir: str = "profiles"
+
+    # Shared HTTP client used by the pinger (lives as long as the app)
+    http_timeout_seconds: float = 5.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http_http2: bool = False  # needs the optional 'h2' package (pip install httpx[http2])
+    # >0: pings run in this many worker processes, each with its own event loop and
+    # HTTP client built from the settings above; 0 = on the scheduler's own loop
+    probe_processes: int = 0
+    # probeMode "get" reads at most this much of a response body to find the version
+    probe_max_body_bytes: int = 65_536
+
+    # Per-service probe timeout: multiplier x the percentile of its last window UP
+    # latencies, between probe_timeout_min_seconds and http_timeout_seconds
+    probe_adaptive_timeouts: bool = True
+    probe_timeout_percentile: float = 0.99
+    probe_timeout_multiplier: float = 3.0
+    probe_timeout_min_seconds: float = 1.0
+    probe_timeout_window: int = 50
+    # Circuit breaker: after this many consecutive DOWN checks a service is only re-probed
+    # every probe_breaker_open_seconds until it answers again (0 = off). Keep it at or above
+    # alert_consecutive_failures_threshold, or alerts wait for the slow re-probes.
+    probe_breaker_failure_threshold: int = 5
+    probe_breaker_open_seconds: float = 300.0
 
     alert_consecutive_failures_threshold: int = 3
     alert_webhook_url: str | None = None  # optional; if not set, log-only alerts
+    alert_batch_window_ms: int = 2_000  # alerts raised within this window go out as one POST
+    alert_batch_max_size: int = 100
+    alert_webhook_timeout_seconds: float = 5.0
+    alert_retry_base_seconds: float = 2.0  # backoff doubles per failed attempt...
+    alert_retry_max_seconds: float = 300.0  # ...up to this
+    alert_max_attempts: int = 10  # then the outbox row is marked dead
 
     class Config:
         env_file = ".env"